@@ -65,30 +65,33 @@ Useful Application and Window actions
 
 """
 
-# Imports which don't select the toolkit as a side-effect.
-
-from .action import Action
-from .action_controller import ActionController
-from .action_event import ActionEvent
-from .action_manager import ActionManager
-from .action_manager_item import ActionManagerItem
-from .field_action import FieldAction
-from .group import Group, Separator
-from .gui_application_action import (
-    AboutAction,
-    CloseActiveWindowAction,
-    CreateWindowAction,
-    ExitAction,
-    GUIApplicationAction,
-)
-from .i_action_manager import IActionManager
-from .i_menu_bar_manager import IMenuBarManager
-from .i_menu_manager import IMenuManager
-from .i_status_bar_manager import IStatusBarManager
-from .i_tool_bar_manager import IToolBarManager
-from .listening_action import ListeningAction
-from .traitsui_widget_action import TraitsUIWidgetAction
-from .window_action import CloseWindowAction, WindowAction
+# Imports which don't select the toolkit as a side-effect.  These are also
+# deferred until first use, so that importing the api module is cheap.
+
+_lazy_imports = {
+    'AboutAction': "gui_application_action",
+    'Action': "action",
+    'ActionController': "action_controller",
+    'ActionEvent': "action_event",
+    'ActionManager': "action_manager",
+    'ActionManagerItem': "action_manager_item",
+    'CloseActiveWindowAction': "gui_application_action",
+    'CloseWindowAction': "window_action",
+    'CreateWindowAction': "gui_application_action",
+    'ExitAction': "gui_application_action",
+    'FieldAction': "field_action",
+    'Group': "group",
+    'GUIApplicationAction': "gui_application_action",
+    'IActionManager': "i_action_manager",
+    'IMenuBarManager': "i_menu_bar_manager",
+    'IMenuManager': "i_menu_manager",
+    'IStatusBarManager': "i_status_bar_manager",
+    'IToolBarManager': "i_tool_bar_manager",
+    'ListeningAction': "listening_action",
+    'Separator': "group",
+    'TraitsUIWidgetAction': "traitsui_widget_action",
+    'WindowAction': "window_action",
+}
 
 
 # ----------------------------------------------------------------------------
@@ -111,8 +114,16 @@ _relative_imports = {
 }
 
 
+# Each name is looked up in the first table which has it, so a name in more
+# than one table would silently resolve to the wrong object.
+_import_tables = [_lazy_imports, _relative_imports, _toolkit_imports]
+assert sum(len(table) for table in _import_tables) == len(
+    set().union(*_import_tables)
+), "a name is in more than one of the deferred import tables"
+
+
 def __getattr__(name):
-    """Lazily load attributes with side-effects
+    """Lazily load attributes
 
     In particular, lazily load toolkit backend names.  For efficiency, lazily
     loaded objects are injected into the module namespace
@@ -121,9 +132,9 @@ def __getattr__(name):
     not_found = object()
     result = not_found
 
-    if name in _relative_imports:
+    source = _lazy_imports.get(name) or _relative_imports.get(name)
+    if source is not None:
         from importlib import import_module
-        source = _relative_imports[name]
         module = import_module(f"pyface.action.{source}")
         result = getattr(module, name)
 
@@ -144,8 +155,14 @@ def __getattr__(name):
 # ----------------------------------------------------------------------------
 
 # the list of available names we report for introspection purposes
-_extra_names = set(_toolkit_imports) | set(_relative_imports)
+_extra_names = (
+    set(_lazy_imports) | set(_toolkit_imports) | set(_relative_imports)
+)
 
 
 def __dir__():
     return sorted(set(globals()) | _extra_names)
+
+
+# names exported by "import *", which doesn't select the toolkit
+__all__ = sorted(_lazy_imports)
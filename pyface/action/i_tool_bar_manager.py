@@ -34,6 +34,11 @@ class IToolBarManager(IActionManager):
     # Should we display the horizontal divider?
     show_divider = Bool(True)
 
+    # Should tool images be decoded in the background, showing a placeholder
+    # until they are ready?  Toolkits which don't support this load images
+    # immediately.
+    async_images = Bool(False)
+
     # ------------------------------------------------------------------------
     # 'ToolBarManager' interface.
     # ------------------------------------------------------------------------
@@ -14,11 +14,16 @@ API for the ``pyface`` package.
 
 - :class:`~.Application`
 - :class:`~.ApplicationWindow`
+- :class:`~.AsyncioDriver`
 - :attr:`~.clipboard`
 - :class:`~.Clipboard`
 - :func:`~.find_toolkit`
 - :class:`~.GUI`
 - :class:`~.GUIApplication`
+- :class:`~.GUIExecutor`
+- :class:`~.GUIFuture`
+- :class:`~.GUIStall`
+- :class:`~.GUIWatchdog`
 - :class:`~.ImageResource`
 - :class:`~.KeyPressedEvent`
 - :class:`~.SplashScreen`
@@ -104,6 +109,7 @@ Miscellaneous
 - :class:`~.BaseDropHandler`
 - :class:`~.Border`
 - :class:`~.beep`
+- :func:`~.dispatch_latest`
 - :class:`~.FileDropHandler`
 - :class:`~.Filter`
 - :class:`~.HeadingText`
@@ -114,9 +120,11 @@ Miscellaneous
 - :class:`~.PythonEditor`
 - :class:`~.PythonShell`
 - :class:`~.Sorter`
+- :class:`~.StreamingArrayImage`
 
-Note that the :class:`~.ArrayImage` is only available if the ``numpy``
-package is available in the Python environment.
+Note that the :class:`~.ArrayImage` and :class:`~.StreamingArrayImage` are
+only available if the ``numpy`` package is available in the Python
+environment.
 
 Note that the :class:`~.PILImage` is only available if the ``pillow``
 package is available in the Python environment.
@@ -136,46 +144,66 @@ Wx-specific classes
 
 """
 
-# Imports which don't select the toolkit as a side-effect.
-
-from .application import Application
-from .base_toolkit import Toolkit, find_toolkit
-from .color import Color
-from .constant import OK, CANCEL, YES, NO
-from .filter import Filter
-from .font import Font
-from .gui_application import GUIApplication
-from .i_about_dialog import IAboutDialog
-from .i_application_window import IApplicationWindow
-from .i_clipboard import IClipboard
-from .i_confirmation_dialog import IConfirmationDialog
-from .i_dialog import IDialog
-from .i_directory_dialog import IDirectoryDialog
-from .i_drop_handler import IDropHandler
-from .i_file_dialog import IFileDialog
-from .i_gui import IGUI
-from .i_heading_text import IHeadingText
-from .i_image import IImage
-from .i_image_resource import IImageResource
-from .i_layered_panel import ILayeredPanel
-from .i_layout_item import ILayoutItem
-from .i_layout_widget import ILayoutWidget
-from .i_message_dialog import IMessageDialog
-from .i_pil_image import IPILImage
-from .i_progress_dialog import IProgressDialog
-from .i_python_editor import IPythonEditor
-from .i_python_shell import IPythonShell
-from .i_single_choice_dialog import ISingleChoiceDialog
-from .i_splash_screen import ISplashScreen
-from .i_split_widget import ISplitWidget
-from .i_system_metrics import ISystemMetrics
-from .i_widget import IWidget
-from .i_window import IWindow
-from .sorter import Sorter
-from .ui_traits import (
-    Alignment, Border, HasBorder, HasMargin, Image, Margin, Orientation,
-    Position, PyfaceColor, PyfaceFont
-)
+# Imports which don't select the toolkit as a side-effect.  These are also
+# deferred until first use, so that importing the api module is cheap.
+
+_lazy_imports = {
+    'Alignment': "ui_traits",
+    'Application': "application",
+    'AsyncioDriver': "asyncio_driver",
+    'Border': "ui_traits",
+    'CANCEL': "constant",
+    'Color': "color",
+    'dispatch_latest': "ui_dispatch",
+    'Filter': "filter",
+    'find_toolkit': "base_toolkit",
+    'Font': "font",
+    'GUIApplication': "gui_application",
+    'GUIExecutor': "gui_executor",
+    'GUIFuture': "gui_executor",
+    'GUIStall': "gui_watchdog",
+    'GUIWatchdog': "gui_watchdog",
+    'HasBorder': "ui_traits",
+    'HasMargin': "ui_traits",
+    'IAboutDialog': "i_about_dialog",
+    'IApplicationWindow': "i_application_window",
+    'IClipboard': "i_clipboard",
+    'IConfirmationDialog': "i_confirmation_dialog",
+    'IDialog': "i_dialog",
+    'IDirectoryDialog': "i_directory_dialog",
+    'IDropHandler': "i_drop_handler",
+    'IFileDialog': "i_file_dialog",
+    'IGUI': "i_gui",
+    'IHeadingText': "i_heading_text",
+    'IImage': "i_image",
+    'IImageResource': "i_image_resource",
+    'ILayeredPanel': "i_layered_panel",
+    'ILayoutItem': "i_layout_item",
+    'ILayoutWidget': "i_layout_widget",
+    'Image': "ui_traits",
+    'IMessageDialog': "i_message_dialog",
+    'IPILImage': "i_pil_image",
+    'IProgressDialog': "i_progress_dialog",
+    'IPythonEditor': "i_python_editor",
+    'IPythonShell': "i_python_shell",
+    'ISingleChoiceDialog': "i_single_choice_dialog",
+    'ISplashScreen': "i_splash_screen",
+    'ISplitWidget': "i_split_widget",
+    'ISystemMetrics': "i_system_metrics",
+    'IWidget': "i_widget",
+    'IWindow': "i_window",
+    'Margin': "ui_traits",
+    'NO': "constant",
+    'OK': "constant",
+    'Orientation': "ui_traits",
+    'Position': "ui_traits",
+    'PyfaceColor': "ui_traits",
+    'PyfaceFont': "ui_traits",
+    'Sorter': "sorter",
+    'Toolkit': "base_toolkit",
+    'YES': "constant",
+}
+
 
 # ----------------------------------------------------------------------------
 # Deferred imports
@@ -234,11 +262,22 @@ _optional_imports = {
     'PILImage': ("pillow", "pil_image"),
     'PythonEditor': ("pygments", "python_editor"),
     'PythonShell': ("pygments", "python_shell"),
+    'StreamingArrayImage': ("numpy", "array_image"),
 }
 
 
+# Each name is looked up in the first table which has it, so a name in more
+# than one table would silently resolve to the wrong object.
+_import_tables = [
+    _lazy_imports, _relative_imports, _toolkit_imports, _optional_imports,
+]
+assert sum(len(table) for table in _import_tables) == len(
+    set().union(*_import_tables)
+), "a name is in more than one of the deferred import tables"
+
+
 def __getattr__(name):
-    """Lazily load attributes with side-effects
+    """Lazily load attributes
 
     In particular, lazily load toolkit backend names.  For efficiency, lazily
     loaded objects are injected into the module namespace
@@ -247,9 +286,9 @@ def __getattr__(name):
     not_found = object()
     result = not_found
 
-    if name in _relative_imports:
+    source = _lazy_imports.get(name) or _relative_imports.get(name)
+    if source is not None:
         from importlib import import_module
-        source = _relative_imports[name]
         module = import_module(f"pyface.{source}")
         result = getattr(module, name)
 
@@ -284,9 +323,14 @@ def __getattr__(name):
 
 # the list of available names we report for introspection purposes
 _extra_names = (
-    set(_toolkit_imports) | set(_relative_imports) | set(_optional_imports)
+    set(_lazy_imports) | set(_toolkit_imports) | set(_relative_imports)
+    | set(_optional_imports)
 )
 
 
 def __dir__():
     return sorted(set(globals()) | _extra_names)
+
+
+# names exported by "import *", which doesn't select the toolkit
+__all__ = sorted(_lazy_imports)
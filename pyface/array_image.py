@@ -8,13 +8,19 @@
 #
 # Thanks for using Enthought open source!
 
-from traits.api import Array, HasStrictTraits, provides
+import numpy as np
+from traits.api import (
+    Any, Array, Bool, Event, HasStrictTraits, Int, Tuple, observe, provides
+)
 
 from pyface.i_image import IImage
 from pyface.util.image_helpers import (
     array_to_image, image_to_bitmap, bitmap_to_icon, resize_image
 )
 
+#: Trait type for a rectangular region of an image as (x, y, width, height).
+ImageRegion = Tuple(Int, Int, Int, Int)
+
 #: Trait type for image arrays.
 ImageArray = Array(shape=(None, None, (3, 4)), dtype='uint8')
 
@@ -22,6 +28,10 @@ ImageArray = Array(shape=(None, None, (3, 4)), dtype='uint8')
 @provides(IImage)
 class ArrayImage(HasStrictTraits):
     """ An IImage stored in an RGB(A) numpy array.
+
+    Toolkit images are created from the current contents of the array each
+    time they are requested, so changes made to the array in-place are
+    shown.  They are not held in the shared decoded image cache.
     """
 
     # 'ArrayImage' interface ------------------------------------------------
@@ -93,3 +103,150 @@ class ArrayImage(HasStrictTraits):
 
     def __init__(self, data, **traits):
         super().__init__(data=data, **traits)
+
+
+class StreamingArrayImage(ArrayImage):
+    """ An ArrayImage whose pixels are updated in place, such as a video feed.
+
+    The image owns a single buffer which new frames, or the parts of them
+    which have changed, are copied into by :py:meth:`update`.  Where the
+    toolkit allows it, a single toolkit image shares the buffer, so updates
+    don't allocate new arrays or images.  Toolkit images are not held in
+    the decoded image cache, since they would be out of date on the next
+    update.
+
+    Parameters
+    ----------
+    data : array-like
+        The initial N x M x {3, 4} array of unsigned 8-bit ints.  This is
+        copied into the buffer.
+    """
+
+    # 'StreamingArrayImage' interface ---------------------------------------
+
+    #: Fired with the (x, y, width, height) region of the image which has
+    #: been updated.
+    updated = Event(ImageRegion)
+
+    # Private interface ----------------------------------------------------
+
+    #: The toolkit image for the current buffer, if it has been created.
+    _image = Any()
+
+    #: Whether the toolkit image shares the memory of the buffer.
+    _image_shares_data = Bool(False)
+
+    # ------------------------------------------------------------------------
+    # 'StreamingArrayImage' interface.
+    # ------------------------------------------------------------------------
+
+    def update(self, array, region=None):
+        """ Copy new pixel values into the image.
+
+        Parameters
+        ----------
+        array : array-like
+            An N x M x {3, 4} array of unsigned 8-bit ints.  This can either
+            be a complete frame, in which case only the region is copied
+            from it, or hold just the pixels of the region.  If it is a
+            complete frame of a different size from the image and no region
+            is given, a new buffer is allocated.
+        region : (int, int, int, int) or None
+            The (x, y, width, height) region to update, or None to update
+            the whole image.
+
+        Raises
+        ------
+        ValueError
+            If the region is not within the image, or the array doesn't
+            match the image or the region.
+        """
+        array = np.asarray(array)
+        if array.ndim != 3 or array.shape[2] not in {3, 4}:
+            raise ValueError("Array must be either RGB or RGBA values.")
+
+        height, width, channels = self.data.shape
+        if region is None:
+            if array.shape[:2] != (height, width):
+                self.data = np.array(array, dtype='uint8', order='C')
+                self.updated = (0, 0, array.shape[1], array.shape[0])
+                return
+            region = (0, 0, width, height)
+
+        x, y, region_width, region_height = region
+        if (
+            x < 0 or y < 0 or region_width < 0 or region_height < 0
+            or x + region_width > width or y + region_height > height
+        ):
+            raise ValueError(
+                "Region {} is not within the image.".format(region)
+            )
+
+        if array.shape[:2] == (height, width):
+            array = array[y:y + region_height, x:x + region_width]
+        elif array.shape[:2] != (region_height, region_width):
+            raise ValueError(
+                "Array of shape {} does not match region {}.".format(
+                    array.shape, region
+                )
+            )
+
+        target = self.data[y:y + region_height, x:x + region_width]
+        if array.shape[2] == channels:
+            target[...] = array
+        elif channels == 4:
+            target[..., :3] = array
+            target[..., 3] = 0xff
+        else:
+            target[...] = array[..., :3]
+
+        if not self._image_shares_data:
+            self._image = None
+        self.updated = (x, y, region_width, region_height)
+
+    # ------------------------------------------------------------------------
+    # 'IImage' interface.
+    # ------------------------------------------------------------------------
+
+    def create_image(self, size=None):
+        """ Creates a toolkit-specific image for this array.
+
+        Parameters
+        ----------
+        size : (int, int) or None
+            The desired size as a width, height tuple, or None if wanting
+            default image size.
+
+        Returns
+        -------
+        image : toolkit image
+            The toolkit image corresponding to the image and the specified
+            size.
+        """
+        from pyface.resource_manager import resource_manager
+
+        if self._image is None:
+            self._image = array_to_image(self.data, copy=False)
+            self._image_shares_data = (
+                getattr(self._image, "_numpy_data", None) is self.data
+            )
+        if size is not None:
+            return resize_image(self._image, size)
+        return resource_manager.resource_factory.copy_image(self._image)
+
+    # ------------------------------------------------------------------------
+    # 'object' interface.
+    # ------------------------------------------------------------------------
+
+    def __init__(self, data, **traits):
+        data = np.array(data, dtype='uint8', order='C')
+        super().__init__(data, **traits)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    @observe('data')
+    def _reset_image(self, event):
+        self._image = None
+        self._image_shares_data = False
@@ -0,0 +1,246 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Running an asyncio event loop interleaved with the GUI event loop.
+
+The :py:class:`AsyncioDriver` runs iterations of an asyncio event loop from
+GUI callbacks on the GUI thread, so coroutines can do non-blocking I/O (for
+example on sockets or subprocess pipes) and update widgets directly.  This
+works with any toolkit, since it only uses ``GUI.invoke_later``,
+``GUI.invoke_later_coalesced`` and ``GUI.invoke_after``::
+
+    async def read_lines(reader):
+        while line := await reader.readline():
+            log_view.append(line.decode())
+
+    driver = AsyncioDriver()
+    driver.start()
+    driver.create_task(read_lines(reader))
+    gui.start_event_loop()
+
+Coroutines, GUI callbacks, timers and ``invoke_later`` calls all run on the
+GUI thread, so they can use each other's objects freely.  GUI callbacks run
+outside the asyncio loop, so they must use :py:meth:`AsyncioDriver.create_task`
+rather than ``asyncio.create_task`` to start coroutines.  Futures returned by
+``GUI.submit`` can be awaited after wrapping them with ``asyncio.wrap_future``.
+"""
+
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+#: The default maximum delay, in milliseconds, between iterations of an idle
+#: asyncio event loop.
+DEFAULT_INTERVAL = 10
+
+
+class AsyncioDriver:
+    """ Runs an asyncio event loop interleaved with the GUI event loop.
+
+    Once started, the driver runs an iteration of the asyncio event loop
+    whenever the GUI is idle: immediately if the asyncio loop has callbacks
+    ready, and otherwise every ``interval`` milliseconds to poll for I/O and
+    timers.  Each iteration handles the callbacks that are ready and any
+    I/O that is available, without blocking.
+
+    The driver must be used from the GUI thread.
+
+    To tell when callbacks are ready, the driver wraps the ``call_soon`` and
+    ``call_soon_threadsafe`` methods of the loop until it is closed.
+    Callbacks scheduled from other threads, such as the results of
+    ``run_in_executor`` or of futures wrapped with ``asyncio.wrap_future``,
+    also wake the driver.  Loops which don't allow this, such as those
+    implemented as extension types, are run every ``interval`` milliseconds
+    even when callbacks are ready, so chains of awaits on them are slower.
+    Timers which come due, such as those of ``asyncio.sleep`` or
+    ``loop.call_later``, are made ready by the loop itself without going
+    through these methods, so they are run within ``interval`` milliseconds
+    rather than immediately.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop or None
+        The event loop to run.  If None, a new event loop is created, and
+        closed by :py:meth:`close`.
+    interval : int
+        The maximum delay, in milliseconds, between iterations when the
+        asyncio loop is idle.  This is the resolution of asyncio timers and
+        the latency of I/O.
+    """
+
+    def __init__(self, loop=None, interval=DEFAULT_INTERVAL):
+        self._owns_loop = loop is None
+        if loop is None:
+            loop = asyncio.new_event_loop()
+
+        #: The asyncio event loop.
+        self.loop = loop
+
+        #: The maximum delay between iterations of an idle loop.
+        self.interval = interval
+
+        self._running = False
+
+        # Incremented each time a step is scheduled, so that only the most
+        # recently scheduled step runs.  This ignores steps scheduled before
+        # the driver was stopped and restarted, and the delayed step that a
+        # wake-up replaces.
+        self._generation = 0
+
+        # Whether callbacks have been scheduled since the last iteration
+        # started, which tells us whether to run again as soon as the GUI is
+        # idle.
+        self._callbacks_ready = False
+        self._call_soon = loop.call_soon
+        self._call_soon_threadsafe = loop.call_soon_threadsafe
+        try:
+            loop.call_soon = self._loop_call_soon
+            loop.call_soon_threadsafe = self._loop_call_soon_threadsafe
+        except AttributeError:
+            pass
+
+    def start(self):
+        """ Start running the asyncio loop from the GUI event loop.
+
+        The loop is also made the current event loop of the GUI thread.
+        """
+        from pyface.gui import GUI
+
+        asyncio.set_event_loop(self.loop)
+        if not self._running:
+            self._running = True
+            self._generation += 1
+            GUI.invoke_later(self._step, self._generation)
+
+    def stop(self):
+        """ Stop running the asyncio loop.
+
+        Pending tasks are kept, and continue if the driver is started again.
+        """
+        self._running = False
+
+    def close(self):
+        """ Stop running the loop, cancelling all of its tasks.
+
+        If the driver created the loop, it is also closed.
+        """
+        self.stop()
+
+        loop = self.loop
+        if vars(loop).get("call_soon") == self._loop_call_soon:
+            del loop.call_soon
+        if vars(loop).get("call_soon_threadsafe") == (
+            self._loop_call_soon_threadsafe
+        ):
+            del loop.call_soon_threadsafe
+
+        if loop.is_closed() or loop.is_running():
+            return
+
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True)
+            )
+
+        if self._owns_loop:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            asyncio.set_event_loop(None)
+
+    def is_running(self):
+        """ Whether the asyncio loop is being run.
+
+        Returns
+        -------
+        running : bool
+            True if the driver has been started and not stopped.
+        """
+        return self._running
+
+    def create_task(self, coro):
+        """ Schedule a coroutine to run on the asyncio loop.
+
+        Unlike ``asyncio.create_task``, this can be called from GUI
+        callbacks, which are not run by the asyncio loop.
+
+        Parameters
+        ----------
+        coro : coroutine
+            The coroutine to run.
+
+        Returns
+        -------
+        task : asyncio.Task
+            The task running the coroutine.
+        """
+        return self.loop.create_task(coro)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _step(self, generation):
+        """ Run one iteration of the asyncio loop and schedule the next. """
+        from pyface.gui import GUI
+
+        if not self._running or generation != self._generation:
+            return
+        if self.loop.is_closed():
+            self._running = False
+            return
+
+        loop = self.loop
+        ready = False
+        if not loop.is_running():
+            # A loop that is stopped as soon as it starts runs a single
+            # iteration, polling for I/O without blocking.  The loop is
+            # already running if a coroutine started a nested GUI event loop,
+            # such as a modal dialog, in which case it is left alone.
+            self._callbacks_ready = False
+            self._call_soon(loop.stop)
+            try:
+                loop.run_forever()
+            except Exception:
+                logger.exception("Error running the asyncio event loop")
+
+            # Callbacks scheduled during the iteration are run by the next.
+            ready = self._callbacks_ready
+
+        self._generation += 1
+        if ready:
+            GUI.invoke_later(self._step, self._generation)
+        else:
+            GUI.invoke_after(self.interval, self._step, self._generation)
+
+    def _wake(self):
+        """ Run an iteration now, replacing the step which is scheduled. """
+        if self._running:
+            self._generation += 1
+            self._step(self._generation)
+
+    def _loop_call_soon(self, callback, *args, **kwargs):
+        """ Schedule a callback on the loop, noting that one is ready. """
+        self._callbacks_ready = True
+        return self._call_soon(callback, *args, **kwargs)
+
+    def _loop_call_soon_threadsafe(self, callback, *args, **kwargs):
+        """ Schedule a callback on the loop from any thread, and wake the
+        driver so that it is run as soon as the GUI is idle.
+        """
+        from pyface.gui import GUI
+
+        handle = self._call_soon_threadsafe(callback, *args, **kwargs)
+        GUI.invoke_later_coalesced((self, "wake"), self._wake)
+        return handle
@@ -37,6 +37,12 @@ This module provides three things:
 - a class :py:class:`Toolkit` class that implements the standard logic for
   finding toolkit objects.
 
+Both functions use :py:func:`find_entry_points` to get the toolkit entry
+points.  Scanning the metadata of every installed distribution for entry
+points can be slow in large environments, so the results are cached for the
+life of the process (or until ``sys.path`` changes), and can also be cached
+on disk between processes.
+
 These are done in a library-agnostic way so that the same tools can be used
 not just for different pyface backends, but also for TraitsUI and ETS
 libraries where we need to switch between different GUI toolkit
@@ -61,11 +67,26 @@ to load toolkits:
   and `null` last.
 
 - finally, if all else fails, we try to load the null toolkit.
+
+Entry point cache
+-----------------
+
+If the ``ETS_ENTRY_POINTS_CACHE`` environment variable is set to the path of
+a file, then the entry points found are also stored in that file, and later
+processes read them from there rather than scanning all distributions.  The
+file is only used while ``sys.path`` and the modification times of the
+directories on it are unchanged, which is the case until distributions are
+installed or removed.  Changes to the entry points of a distribution which is
+installed in development mode may not be noticed, so in that case call
+:py:func:`clear_entry_points_cache` or remove the file.
 """
 
+import json
 import logging
 import os
 import sys
+import tempfile
+import threading
 
 try:
     # Starting Python 3.8, importlib.metadata is available in the Python
@@ -75,12 +96,20 @@ try:
 except ImportError:
     import importlib_metadata
 
-from traits.api import HasTraits, List, ReadOnly, Str
+from traits.api import (
+    Any, Dict, HasTraits, List, ReadOnly, Str, Tuple, observe
+)
 from traits.etsconfig.api import ETSConfig
 
 logger = logging.getLogger(__name__)
 
 
+#: The environment variable giving the path of the entry point cache file.
+ENTRY_POINTS_CACHE_ENV = "ETS_ENTRY_POINTS_CACHE"
+
+#: The version of the format of the entry point cache file.
+ENTRY_POINTS_CACHE_VERSION = 2
+
 TOOLKIT_PRIORITIES = {"qt": -2, "wx": -1, "null": float("inf")}
 default_priorities = lambda plugin: TOOLKIT_PRIORITIES.get(plugin.name, 0)
 
@@ -91,6 +120,9 @@ class Toolkit(HasTraits):
     This implementation uses pathname mangling to find modules and objects in
     those modules.  If an object can't be found, the toolkit will return a
     class that raises NotImplementedError when it is instantiated.
+
+    The objects found for each name, and the results of importing each
+    module (including failures), are cached until the packages change.
     """
 
     #: The name of the package (eg. pyface)
@@ -102,6 +134,13 @@ class Toolkit(HasTraits):
     #: The packages to look in for implementations.
     packages = List(Str)
 
+    #: The objects found for each name, including Unimplemented classes.
+    _objects = Dict(Str, Any)
+
+    #: The modules imported for each (module name, package) pair, or None if
+    #: the module doesn't exist.
+    _modules = Dict(Tuple(Str, Str), Any)
+
     def __init__(self, package, toolkit, *packages, **traits):
         super().__init__(
             package=package, toolkit=toolkit, packages=list(packages), **traits
@@ -116,37 +155,58 @@ class Toolkit(HasTraits):
             The name consists of the relative module path and the object name
             separated by a colon.
         """
-        from importlib import import_module
+        try:
+            return self._objects[name]
+        except KeyError:
+            pass
+
+        obj = self._find_object(name)
+        self._objects[name] = obj
+        return obj
+
+    def resolve(self, names):
+        """ Find the toolkit specific objects for several names at once.
+
+        This can be used at startup with a manifest of the names that an
+        application uses, so that later lookups of them are dictionary
+        lookups.  Each module is only imported once, however many names
+        refer to it.
+
+        Parameters
+        ----------
+        names : iterable of str
+            The names, each consisting of the relative module path and the
+            object name separated by a colon.
+
+        Returns
+        -------
+        objects : dict
+            A dictionary mapping each name to its toolkit specific object.
+        """
+        return {name: self(name) for name in names}
+
+    def clear_cache(self):
+        """ Discard the cached objects and modules.
+
+        This is only needed if modules are added to the packages after they
+        have been looked up.
+        """
+        self._objects = {}
+        self._modules = {}
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
 
+    def _find_object(self, name):
+        """ Find the toolkit specific object with the given name. """
         mname, oname = name.split(":")
         if not mname.startswith("."):
             mname = "." + mname
 
         for package in self.packages:
-            try:
-                module = import_module(mname, package)
-            except ImportError as exc:
-                # is the error while trying to import package mname or not?
-                if all(
-                    part not in exc.args[0]
-                    for part in mname.split(".")
-                    if part
-                ):
-                    # something else went wrong - let the exception be raised
-                    raise
-
-                # Ignore *ANY* errors unless a debug ENV variable is set.
-                if "ETS_DEBUG" in os.environ:
-                    # Attempt to only skip errors in importing the backend modules.
-                    # The idea here is that this only happens when the last entry in
-                    # the traceback's stack frame mentions the toolkit in question.
-                    import traceback
-
-                    frames = traceback.extract_tb(sys.exc_info()[2])
-                    filename, lineno, function, text = frames[-1]
-                    if package not in filename:
-                        raise
-            else:
+            module = self._import_module(mname, package)
+            if module is not None:
                 obj = getattr(module, oname, None)
                 if obj is not None:
                     return obj
@@ -166,6 +226,50 @@ class Toolkit(HasTraits):
 
         return Unimplemented
 
+    def _import_module(self, mname, package):
+        """ Import a module relative to a package, or return None if the
+        module doesn't exist.
+        """
+        from importlib import import_module
+
+        key = (mname, package)
+        try:
+            return self._modules[key]
+        except KeyError:
+            pass
+
+        try:
+            module = import_module(mname, package)
+        except ImportError as exc:
+            # is the error while trying to import package mname or not?
+            if all(
+                part not in exc.args[0]
+                for part in mname.split(".")
+                if part
+            ):
+                # something else went wrong - let the exception be raised
+                raise
+
+            # Ignore *ANY* errors unless a debug ENV variable is set.
+            if "ETS_DEBUG" in os.environ:
+                # Attempt to only skip errors in importing the backend modules.
+                # The idea here is that this only happens when the last entry in
+                # the traceback's stack frame mentions the toolkit in question.
+                import traceback
+
+                frames = traceback.extract_tb(sys.exc_info()[2])
+                filename, lineno, function, text = frames[-1]
+                if package not in filename:
+                    raise
+            module = None
+
+        self._modules[key] = module
+        return module
+
+    @observe("packages.items")
+    def _packages_updated(self, event):
+        self.clear_cache()
+
 
 def import_toolkit(toolkit_name, entry_point="pyface.toolkits"):
     """ Attempt to import an toolkit specified by an entry point.
@@ -189,13 +293,7 @@ def import_toolkit(toolkit_name, entry_point="pyface.toolkits"):
         reason.
     """
 
-    # This compatibility layer can be removed when we drop support for
-    # Python < 3.10. Ref https://github.com/enthought/pyface/issues/999.
-    all_entry_points = importlib_metadata.entry_points()
-    if hasattr(all_entry_points, "select"):
-        entry_point_group = all_entry_points.select(group=entry_point)
-    else:
-        entry_point_group = all_entry_points[entry_point]
+    entry_point_group = find_entry_points(entry_point)
 
     plugins = [
         plugin for plugin in entry_point_group if plugin.name == toolkit_name
@@ -268,19 +366,10 @@ def find_toolkit(
     if ETSConfig.toolkit:
         return import_toolkit(ETSConfig.toolkit, entry_point)
 
-    # This compatibility layer can be removed when we drop support for
-    # Python < 3.10. Ref https://github.com/enthought/pyface/issues/999.
-    all_entry_points = importlib_metadata.entry_points()
-    if hasattr(all_entry_points, "select"):
-        entry_points = [
-            plugin for plugin in all_entry_points.select(group=entry_point)
-            if toolkits is None or plugin.name in toolkits
-        ]
-    else:
-        entry_points = [
-            plugin for plugin in all_entry_points[entry_point]
-            if toolkits is None or plugin.name in toolkits
-        ]
+    entry_points = [
+        plugin for plugin in find_entry_points(entry_point)
+        if toolkits is None or plugin.name in toolkits
+    ]
 
     for plugin in sorted(entry_points, key=priorities):
         try:
@@ -296,3 +385,172 @@ def find_toolkit(
     # if all else fails, try to import the null toolkit.
     with ETSConfig.provisional_toolkit("null"):
         return import_toolkit("null", entry_point)
+
+
+def find_entry_points(group):
+    """ Find the installed entry points of a group, using a cache.
+
+    The first call scans the metadata of all installed distributions for the
+    entry points of every group, and later calls for any group return the
+    same results until ``sys.path`` changes or the cache is cleared.  If the
+    ``ETS_ENTRY_POINTS_CACHE`` environment variable is set, the entry points
+    are also cached in the file that it names.
+
+    Parameters
+    ----------
+    group : str
+        The name of the entry point group, such as "pyface.toolkits".
+
+    Returns
+    -------
+    entry_points : tuple of EntryPoint
+        The entry points of the group.
+    """
+    global _entry_points_cache, _entry_points_sys_path
+
+    with _entry_points_lock:
+        sys_path = tuple(sys.path)
+        if sys_path != _entry_points_sys_path:
+            _entry_points_cache = None
+            _entry_points_sys_path = sys_path
+
+        if _entry_points_cache is None:
+            _entry_points_cache = _load_entry_points()
+        return _entry_points_cache.get(group, ())
+
+
+def clear_entry_points_cache():
+    """ Discard the cached entry points of the process and of the cache file.
+
+    This is only needed if entry points are installed or changed in a way
+    which doesn't change ``sys.path`` or the directories on it.
+    """
+    global _entry_points_cache
+
+    with _entry_points_lock:
+        _entry_points_cache = None
+
+    path = os.environ.get(ENTRY_POINTS_CACHE_ENV)
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# ----------------------------------------------------------------------------
+# Private functions
+# ----------------------------------------------------------------------------
+
+#: The entry points found in this process, keyed by group, or None if they
+#: haven't been found yet.
+_entry_points_cache = None
+
+#: The value of sys.path when the cached entry points were found.
+_entry_points_sys_path = None
+
+#: Lock protecting the entry point cache.
+_entry_points_lock = threading.RLock()
+
+
+def _load_entry_points():
+    """ Get the entry points of all groups from the cache file or metadata.
+    """
+    path = os.environ.get(ENTRY_POINTS_CACHE_ENV)
+    if not path:
+        return _scan_entry_points()
+
+    key = _entry_points_cache_key()
+    groups = _read_entry_points_cache(path, key)
+    if groups is not None:
+        return {
+            group: tuple(
+                importlib_metadata.EntryPoint(name, value, group)
+                for name, value in items
+            )
+            for group, items in groups.items()
+        }
+
+    entry_points = _scan_entry_points()
+    groups = {
+        group: [[plugin.name, plugin.value] for plugin in plugins]
+        for group, plugins in entry_points.items()
+    }
+    _write_entry_points_cache(path, key, groups)
+    return entry_points
+
+
+def _scan_entry_points():
+    """ Scan the metadata of all distributions for the entry points of all
+    groups.
+    """
+    all_entry_points = importlib_metadata.entry_points()
+    # This compatibility layer can be removed when we drop support for
+    # Python < 3.12, which returns a dictionary of entry points by group.
+    # Ref https://github.com/enthought/pyface/issues/999.
+    if isinstance(all_entry_points, dict):
+        all_entry_points = [
+            plugin
+            for group, plugins in all_entry_points.items()
+            for plugin in plugins
+        ]
+
+    groups = {}
+    for plugin in all_entry_points:
+        groups.setdefault(plugin.group, []).append(plugin)
+    return {group: tuple(plugins) for group, plugins in groups.items()}
+
+
+def _entry_points_cache_key():
+    """ A key which changes when distributions are installed or removed. """
+    sys_path = []
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or os.curdir).st_mtime_ns
+        except (OSError, ValueError):
+            mtime = None
+        sys_path.append([entry, mtime])
+    return {"executable": sys.executable, "sys_path": sys_path}
+
+
+def _read_entry_points_cache(path, key):
+    """ Read the cached entry points of all groups, or None if they are not
+    valid for the key.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != ENTRY_POINTS_CACHE_VERSION
+        or data.get("key") != key
+        or not isinstance(data.get("groups"), dict)
+    ):
+        return None
+    return data["groups"]
+
+
+def _write_entry_points_cache(path, key, groups):
+    """ Atomically write the cached entry points, ignoring failures. """
+    data = {
+        "version": ENTRY_POINTS_CACHE_VERSION,
+        "key": key,
+        "groups": groups,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError:
+        logger.debug("Could not write entry point cache %r", path,
+                     exc_info=True)
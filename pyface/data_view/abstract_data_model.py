@@ -73,7 +73,10 @@ class AbstractDataModel(ABCHasStrictTraits):
     #: or a TupleIndexManager for hierarchical data.
     index_manager = Instance(AbstractIndexManager)
 
-    #: Event fired when the structure of the data changes.
+    #: Event fired when the structure of the data changes.  This should
+    #: usually be set to True.  If the change only affects the children of
+    #: a particular row, it may instead be set to the index of that row
+    #: so that views can keep cached information about other rows.
     structure_changed = Event()
 
     #: Event fired when value changes without changes to structure.  This
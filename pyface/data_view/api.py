@@ -65,25 +65,43 @@ Interfaces
 
 """
 
-from pyface.data_view.abstract_data_exporter import AbstractDataExporter
-from pyface.data_view.abstract_data_model import AbstractDataModel
-from pyface.data_view.abstract_value_type import AbstractValueType
-from pyface.data_view.data_formats import (
-    csv_column_format, csv_format, csv_row_format, from_csv, from_csv_column,
-    from_csv_row, from_json, from_npy, html_format, npy_format,
-    standard_text_format, to_csv, to_csv_column, to_csv_row, to_json, to_npy,
-    table_format, text_column_format, text_row_format
-)
-from pyface.data_view.data_view_errors import (
-    DataViewError, DataViewGetError, DataViewSetError
-)
-from pyface.data_view.i_data_view_widget import IDataViewWidget
-from pyface.data_view.i_data_wrapper import (
-    DataFormat, IDataWrapper, text_format
-)
-from pyface.data_view.index_manager import (
-    AbstractIndexManager, IntIndexManager, TupleIndexManager
-)
+# Imports which don't select the toolkit as a side-effect.  These are also
+# deferred until first use, so that importing the api module is cheap.
+
+_lazy_imports = {
+    'AbstractDataExporter': "abstract_data_exporter",
+    'AbstractDataModel': "abstract_data_model",
+    'AbstractIndexManager': "index_manager",
+    'AbstractValueType': "abstract_value_type",
+    'csv_column_format': "data_formats",
+    'csv_format': "data_formats",
+    'csv_row_format': "data_formats",
+    'DataFormat': "i_data_wrapper",
+    'DataViewError': "data_view_errors",
+    'DataViewGetError': "data_view_errors",
+    'DataViewSetError': "data_view_errors",
+    'from_csv': "data_formats",
+    'from_csv_column': "data_formats",
+    'from_csv_row': "data_formats",
+    'from_json': "data_formats",
+    'from_npy': "data_formats",
+    'html_format': "data_formats",
+    'IDataViewWidget': "i_data_view_widget",
+    'IDataWrapper': "i_data_wrapper",
+    'IntIndexManager': "index_manager",
+    'npy_format': "data_formats",
+    'standard_text_format': "data_formats",
+    'table_format': "data_formats",
+    'text_column_format': "data_formats",
+    'text_format': "i_data_wrapper",
+    'text_row_format': "data_formats",
+    'to_csv': "data_formats",
+    'to_csv_column': "data_formats",
+    'to_csv_row': "data_formats",
+    'to_json': "data_formats",
+    'to_npy': "data_formats",
+    'TupleIndexManager': "index_manager",
+}
 
 
 # ----------------------------------------------------------------------------
@@ -99,7 +117,7 @@ _toolkit_imports = {
 
 
 def __getattr__(name):
-    """Lazily load attributes with side-effects
+    """Lazily load attributes
 
     In particular, lazily load toolkit backend names.  For efficiency, lazily
     loaded objects are injected into the module namespace
@@ -108,7 +126,13 @@ def __getattr__(name):
     not_found = object()
     result = not_found
 
-    if name in _toolkit_imports:
+    if name in _lazy_imports:
+        from importlib import import_module
+        source = _lazy_imports[name]
+        module = import_module(f"pyface.data_view.{source}")
+        result = getattr(module, name)
+
+    elif name in _toolkit_imports:
         from pyface.toolkit import toolkit_object
         source = _toolkit_imports[name]
         result = toolkit_object(f"data_view.{source}:{name}")
@@ -124,5 +148,13 @@ def __getattr__(name):
 # Introspection support
 # ----------------------------------------------------------------------------
 
+# the list of available names we report for introspection purposes
+_extra_names = set(_lazy_imports) | set(_toolkit_imports)
+
+
 def __dir__():
-    return sorted(set(globals()) | set(_toolkit_imports))
+    return sorted(set(globals()) | _extra_names)
+
+
+# names exported by "import *", which doesn't select the toolkit
+__all__ = sorted(_lazy_imports)
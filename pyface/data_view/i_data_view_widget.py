@@ -55,6 +55,11 @@ class IDataViewWidget(ILayoutWidget):
     #: Exporters available for the DataViewWidget.
     exporters = List(Instance(AbstractDataExporter))
 
+    #: Whether images should be decoded in the background, showing a
+    #: placeholder until they are ready.  Toolkits which don't support this
+    #: load images immediately.
+    async_images = Bool(False)
+
 
 class MDataViewWidget(HasTraits):
     """ Mixin class for data view widgets. """
@@ -80,6 +85,11 @@ class MDataViewWidget(HasTraits):
     #: Exporters available for the DataViewWidget.
     exporters = List(Instance(AbstractDataExporter))
 
+    #: Whether images should be decoded in the background, showing a
+    #: placeholder until they are ready.  Toolkits which don't support this
+    #: load images immediately.
+    async_images = Bool(False)
+
     # Private traits --------------------------------------------------------
 
     #: Whether the selection is currently being updated.
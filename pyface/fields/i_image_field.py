@@ -10,7 +10,8 @@
 
 """ The image field interface. """
 
-from traits.api import Any, HasTraits
+from traits.api import Any, Bool, HasTraits
+from traits.observation.api import trait
 
 from pyface.fields.i_field import IField
 from pyface.ui_traits import Image
@@ -25,6 +26,11 @@ class IImageField(IField):
     #: The current value of the image field
     value = Image()
 
+    #: Whether images should be decoded in the background, showing a
+    #: placeholder until they are ready.  Toolkits which don't support this
+    #: load images immediately.
+    async_images = Bool(False)
+
 
 class MImageField(HasTraits):
     """ Mixin class for ImageField implementations """
@@ -32,5 +38,38 @@ class MImageField(HasTraits):
     #: The current value of the image field
     value = Image()
 
+    #: Whether images should be decoded in the background, showing a
+    #: placeholder until they are ready.  Toolkits which don't support this
+    #: load images immediately.
+    async_images = Bool(False)
+
     #: The toolkit image to display
     _toolkit_value = Any()
+
+    # ------------------------------------------------------------------------
+    # Private interface
+    # ------------------------------------------------------------------------
+
+    def _add_event_listeners(self):
+        """ Set up toolkit-specific bindings for events """
+        super()._add_event_listeners()
+        self.observe(
+            self._image_updated,
+            trait("value", notify=False).trait("updated", optional=True),
+            dispatch="ui",
+        )
+
+    def _remove_event_listeners(self):
+        """ Remove toolkit-specific bindings for events """
+        self.observe(
+            self._image_updated,
+            trait("value", notify=False).trait("updated", optional=True),
+            dispatch="ui",
+            remove=True,
+        )
+        super()._remove_event_listeners()
+
+    def _image_updated(self, event):
+        """ Redisplay an image whose pixels have changed in place. """
+        if self.control is not None:
+            self._set_control_value(self.value)
@@ -37,3 +37,31 @@ class ImageFieldMixin(FieldMixin, unittest.TestCase):
         self.gui.process_events()
 
         self.assertIsNotNone(self.widget._get_control_value())
+
+    def test_image_field_async_array_image(self):
+        from pyface.array_image import ArrayImage
+
+        self._create_widget_control()
+        self.widget.async_images = True
+        image = ArrayImage(data=self.data)
+        self.widget.value = image
+        self.gui.process_events()
+
+        # the control is given a toolkit bitmap, not a toolkit image
+        self.assertIsInstance(
+            self.widget._toolkit_value, type(image.create_bitmap())
+        )
+
+    def test_image_field_streaming_update(self):
+        from pyface.array_image import StreamingArrayImage
+
+        image = StreamingArrayImage(self.data)
+        self._create_widget_control()
+        self.widget.value = image
+        self.gui.process_events()
+        old_value = self.widget._toolkit_value
+
+        image.update(np.full((4, 4, 4), 0x11, dtype='uint8'), (0, 0, 4, 4))
+        self.gui.process_events()
+
+        self.assertIsNot(self.widget._toolkit_value, old_value)
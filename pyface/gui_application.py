@@ -90,6 +90,15 @@ class GUIApplication(Application):
     #: The Pyface GUI instance for the application
     gui = ReadOnly
 
+    #: An optional driver which runs an asyncio event loop along with the
+    #: GUI event loop while the application runs.  The driver is closed,
+    #: cancelling its remaining tasks, when the application stops.
+    asyncio_driver = Instance("pyface.asyncio_driver.AsyncioDriver")
+
+    #: An optional watchdog which reports stalls of the GUI event loop while
+    #: the application runs.
+    watchdog = Instance("pyface.gui_watchdog.GUIWatchdog")
+
     # Protected interface ----------------------------------------------------
 
     #: Flag if the exiting of the application was explicitely requested by user
@@ -173,6 +182,19 @@ class GUIApplication(Application):
 
         return ok
 
+    def stop(self):
+        """ Stop the application, cleanly releasing resources if possible.
+
+        Subclasses should call the superclass stop() method after doing any
+        work themselves.
+        """
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        if self.asyncio_driver is not None:
+            self.asyncio_driver.close()
+
+        return super().stop()
+
     # -------------------------------------------------------------------------
     # 'GUIApplication' Private interface
     # -------------------------------------------------------------------------
@@ -202,6 +224,11 @@ class GUIApplication(Application):
             self._fire_application_event, "application_initialized"
         )
 
+        if self.asyncio_driver is not None:
+            self.asyncio_driver.start()
+        if self.watchdog is not None:
+            self.watchdog.start()
+
         # start the GUI - script blocks here
         self.gui.start_event_loop()
         return True
@@ -0,0 +1,298 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Running work off the GUI thread and getting the results back safely.
+
+A :py:class:`GUIExecutor` runs callables on a ``concurrent.futures`` executor
+(a thread pool by default) and returns :py:class:`GUIFuture` objects, whose
+done-callbacks always run on the GUI thread.  Most code can use the shared
+executor via :py:meth:`pyface.i_gui.IGUI.submit`::
+
+    def show_result(future):
+        if not future.cancelled():
+            label.text = str(future.result())
+
+    future = GUI.submit(expensive_calculation, data)
+    future.add_done_callback(show_result)
+    future.cancel_on_destroy(label)
+"""
+
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+import logging
+import queue
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+#: The shared executor used by GUI.submit, created on first use.
+_default_gui_executor = None
+
+#: Lock protecting the creation of the shared executor.
+_default_gui_executor_lock = threading.Lock()
+
+
+def get_default_gui_executor():
+    """ Return the executor used by GUI.submit, creating it if needed.
+
+    Returns
+    -------
+    executor : GUIExecutor
+        The shared executor.
+    """
+    global _default_gui_executor
+
+    with _default_gui_executor_lock:
+        if _default_gui_executor is None:
+            _default_gui_executor = GUIExecutor()
+        return _default_gui_executor
+
+
+def set_default_gui_executor(executor):
+    """ Set the executor used by GUI.submit.
+
+    The previous executor is not shut down.
+
+    Parameters
+    ----------
+    executor : GUIExecutor or None
+        The executor to use.  If None, a default executor is created on
+        next use.
+
+    Returns
+    -------
+    previous : GUIExecutor or None
+        The previous shared executor, if any.
+    """
+    global _default_gui_executor
+
+    with _default_gui_executor_lock:
+        previous = _default_gui_executor
+        _default_gui_executor = executor
+        return previous
+
+
+class GUIFuture(Future):
+    """ A future whose done-callbacks run on the GUI thread.
+
+    Callbacks added with :py:meth:`add_done_callback` are always called
+    later on the GUI thread, even if the future is already done.
+
+    Unlike other futures, a GUIFuture can be cancelled while its work is
+    running: the work continues in the background but its result is
+    discarded, and the future is cancelled at once.
+
+    Parameters
+    ----------
+    invoke_later : callable
+        A callable used to call a callable on the GUI thread, such as
+        ``GUI.invoke_later``.
+    """
+
+    def __init__(self, invoke_later):
+        super().__init__()
+        self._invoke_later = invoke_later
+        # The future of the work in the underlying executor.
+        self._inner = None
+
+    def add_done_callback(self, fn):
+        """ Attach a callable to be called on the GUI thread when done.
+
+        Parameters
+        ----------
+        fn : callable
+            A callable which takes the future as its only argument.
+        """
+        super().add_done_callback(
+            lambda future: self._invoke_later(_call_done_callback, fn, future)
+        )
+
+    def cancel(self):
+        """ Cancel the future, discarding the result of any running work.
+
+        Returns
+        -------
+        cancelled : bool
+            False if the future has already completed, otherwise True.
+        """
+        inner = self._inner
+        if inner is not None:
+            inner.cancel()
+        return super().cancel()
+
+    def cancel_on_destroy(self, widget):
+        """ Cancel the future if a widget is destroyed before it is done.
+
+        This must be called on the GUI thread.
+
+        Parameters
+        ----------
+        widget : IWidget
+            The widget which uses the result.
+
+        Returns
+        -------
+        future : GUIFuture
+            This future, for chaining.
+        """
+        def control_updated(event):
+            if event.new is None:
+                self.cancel()
+
+        widget.observe(control_updated, "control")
+        self.add_done_callback(
+            lambda future: widget.observe(
+                control_updated, "control", remove=True
+            )
+        )
+        return self
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _set_inner(self, inner):
+        """ Copy the outcome of the work in the underlying executor. """
+        self._inner = inner
+        inner.add_done_callback(self._inner_done)
+
+    def _inner_done(self, inner):
+        """ Copy the outcome of the underlying future.  This may be called
+        on any thread.
+        """
+        try:
+            if inner.cancelled():
+                self.cancel()
+            elif inner.exception() is not None:
+                self.set_exception(inner.exception())
+            else:
+                self.set_result(inner.result())
+        except InvalidStateError:
+            # this future was cancelled while the work was running
+            pass
+
+
+def _call_done_callback(fn, future):
+    """ Call a done-callback, logging any exception as futures do. """
+    try:
+        fn(future)
+    except Exception:
+        logger.exception("Exception calling callback for %r", future)
+
+
+class GUIExecutor:
+    """ Runs callables in the background, with results on the GUI thread.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor or None
+        The executor which runs the callables, for example a
+        ``ProcessPoolExecutor`` for CPU-bound work.  If None, a
+        ``ThreadPoolExecutor`` is created and owned by this object.
+    max_workers : int or None
+        The maximum number of threads of the executor created if no
+        executor is given.
+    max_pending : int or None
+        The maximum number of callables which can be queued or running at
+        once.  If None, there is no limit.
+    invoke_later : callable or None
+        A callable used to call done-callbacks on the GUI thread.  If None,
+        ``GUI.invoke_later`` is used.
+    """
+
+    def __init__(self, executor=None, max_workers=None, max_pending=None,
+                 invoke_later=None):
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pyface-gui",
+            )
+        self._executor = executor
+        self._invoke_later = invoke_later
+        self._slots = (
+            None if max_pending is None
+            else threading.BoundedSemaphore(max_pending)
+        )
+
+    def submit(self, fn, *args, **kwargs):
+        """ Run a callable in the background.
+
+        This may be called from any thread.
+
+        Parameters
+        ----------
+        fn : callable
+            The callable to run.
+        *args, **kwargs
+            The arguments to call it with.
+
+        Returns
+        -------
+        future : GUIFuture
+            The future of the result, whose done-callbacks run on the GUI
+            thread.
+
+        Raises
+        ------
+        queue.Full
+            If the maximum number of pending callables has been reached.
+        RuntimeError
+            If the executor has been shut down.
+        """
+        if self._slots is not None and not self._slots.acquire(False):
+            raise queue.Full("Too many callables are pending")
+
+        future = GUIFuture(self._get_invoke_later())
+        try:
+            inner = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release_slot()
+            raise
+
+        if self._slots is not None:
+            inner.add_done_callback(lambda inner: self._release_slot())
+        future._set_inner(inner)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """ Shut down the executor if it is owned by this object.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for running callables to finish.
+        cancel_futures : bool
+            Whether to cancel callables which haven't started yet.  This
+            requires Python 3.9 or later.
+        """
+        if not self._owns_executor:
+            return
+
+        if cancel_futures:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _get_invoke_later(self):
+        """ The callable used to call callables on the GUI thread. """
+        if self._invoke_later is None:
+            from pyface.gui import GUI
+
+            self._invoke_later = GUI.invoke_later
+        return self._invoke_later
+
+    def _release_slot(self):
+        """ Allow another callable to be submitted. """
+        if self._slots is not None:
+            self._slots.release()
@@ -0,0 +1,244 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Detecting and diagnosing stalls of the GUI event loop.
+
+A :py:class:`GUIWatchdog` runs a background thread which regularly posts a
+heartbeat callable to the GUI event loop.  If the GUI thread doesn't run the
+heartbeat within a threshold, the watchdog samples the GUI thread's Python
+stack with ``sys._current_frames`` and reports it, both to the log and as a
+:py:attr:`GUIWatchdog.stalled` event::
+
+    watchdog = GUIWatchdog(threshold=0.5)
+    watchdog.start()
+    gui.start_event_loop()
+
+While a stall lasts, the stack is sampled and reported again every
+``threshold`` seconds, so long stalls show where the GUI thread is spending
+its time.  The watchdog is cheap enough to leave running in production: when
+the GUI is responsive it costs one heartbeat callable every ``interval``
+seconds.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from traits.api import (
+    Bool, Event, Float, HasStrictTraits, Instance, Int, List, Range, Str,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class GUIStall(HasStrictTraits):
+    """ A report of a stall of the GUI event loop. """
+
+    #: The time in seconds that the GUI thread has been unresponsive when the
+    #: stack was sampled.
+    duration = Float()
+
+    #: The Python stack of the GUI thread when it was sampled, most recent
+    #: call last, as formatted by ``traceback.format_stack``.
+    stack = List(Str)
+
+    #: Whether the GUI thread has since become responsive again.
+    recovered = Bool(False)
+
+    def __str__(self):
+        state = "recovered" if self.recovered else "stalled"
+        return "GUI event loop {} after {:.3f}s:\n{}".format(
+            state, self.duration, "".join(self.stack),
+        )
+
+
+class GUIWatchdog(HasStrictTraits):
+    """ Reports when the GUI event loop stops responding.
+
+    The watchdog must be started from the GUI thread.
+    """
+
+    #: The time in seconds that the GUI thread can be unresponsive before it
+    #: is reported as stalled.
+    threshold = Range(low=0.0, value=1.0, exclude_low=True)
+
+    #: The time in seconds between heartbeats, which is also the resolution
+    #: of the stall durations that are reported.
+    interval = Range(low=0.0, value=0.1, exclude_low=True)
+
+    #: Fired on the watchdog's thread with a :py:class:`GUIStall` each time
+    #: the stack of a stalled GUI thread is sampled, and on the GUI thread
+    #: with a recovered :py:class:`GUIStall` when the stall ends.
+    #: Observers must be thread-safe, and must not wait for the GUI thread.
+    stalled = Event(Instance(GUIStall))
+
+    #: Whether stalls are logged as warnings.
+    log_stalls = Bool(True)
+
+    #: The number of stalls detected since the watchdog was created.
+    stall_count = Int()
+
+    # Private interface ------------------------------------------------------
+
+    #: The identifier of the GUI thread.
+    _gui_thread_id = Int()
+
+    #: The background thread.
+    _thread = Instance(threading.Thread)
+
+    #: Set to stop the background thread.
+    _stopping = Instance(threading.Event)
+
+    #: Protects the state of the heartbeat shared between the threads.
+    _lock = Instance(threading.Lock, ())
+
+    #: The number of the last heartbeat posted.  This keeps increasing when
+    #: the watchdog is restarted, so that a heartbeat posted by a previous
+    #: background thread can't acknowledge one posted by the current thread.
+    _heartbeat_count = Int()
+
+    #: The number of the heartbeat awaiting a response, or 0 if none.
+    _pending = Int()
+
+    #: The monotonic time at which the pending heartbeat was posted.
+    _posted = Float()
+
+    #: The last stall reported for the pending heartbeat, if any.
+    _last_stall = Instance(GUIStall)
+
+    # ------------------------------------------------------------------------
+    # 'GUIWatchdog' interface.
+    # ------------------------------------------------------------------------
+
+    def start(self):
+        """ Start watching the GUI event loop.
+
+        This must be called on the GUI thread.
+        """
+        if self.is_running():
+            return
+
+        self._gui_thread_id = threading.get_ident()
+        self._stopping = threading.Event()
+        with self._lock:
+            self._pending = 0
+            self._last_stall = None
+        self._thread = threading.Thread(
+            target=self._watch,
+            args=(self._stopping,),
+            name="pyface-gui-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """ Stop watching the GUI event loop.
+
+        This does not wait for the background thread to finish.
+        """
+        if self._stopping is not None:
+            self._stopping.set()
+        self._thread = None
+        self._stopping = None
+
+    def is_running(self):
+        """ Whether the watchdog is watching the GUI event loop.
+
+        Returns
+        -------
+        running : bool
+            True if the watchdog has been started and not stopped.
+        """
+        return self._thread is not None
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _watch(self, stopping):
+        """ Post heartbeats and check for stalls until stopped. """
+        from pyface.gui import GUI
+
+        while not stopping.wait(self.interval):
+            with self._lock:
+                if stopping.is_set():
+                    # stopped while waiting for the lock
+                    break
+                if self._pending == 0:
+                    self._heartbeat_count += 1
+                    heartbeat = self._heartbeat_count
+                    self._pending = heartbeat
+                    self._posted = time.monotonic()
+                    self._last_stall = None
+                    post = True
+                else:
+                    post = False
+                    stall = self._check_stall()
+
+            if post:
+                GUI.invoke_later(self._heartbeat, heartbeat)
+            elif stall is not None:
+                self._report(stall)
+
+    def _check_stall(self):
+        """ Sample the stack if the pending heartbeat is overdue.
+
+        This is called with the lock held.  A stall is sampled when the
+        heartbeat is ``threshold`` seconds late, and again every
+        ``threshold`` seconds after that.
+        """
+        duration = time.monotonic() - self._posted
+        last = self._last_stall
+        due = self.threshold if last is None else (
+            last.duration + self.threshold
+        )
+        if duration < due:
+            return None
+
+        frame = sys._current_frames().get(self._gui_thread_id)
+        stack = [] if frame is None else traceback.format_stack(frame)
+        # Drop the reference to the frame promptly, to avoid keeping its
+        # locals alive.
+        del frame
+
+        stall = GUIStall(duration=duration, stack=stack)
+        if last is None:
+            self.stall_count += 1
+        self._last_stall = stall
+        return stall
+
+    def _heartbeat(self, heartbeat):
+        """ Acknowledge a heartbeat on the GUI thread. """
+        with self._lock:
+            if heartbeat != self._pending:
+                return
+            self._pending = 0
+            last = self._last_stall
+            self._last_stall = None
+            duration = time.monotonic() - self._posted
+
+        if last is not None:
+            self._report(
+                GUIStall(duration=duration, stack=last.stack, recovered=True)
+            )
+
+    def _report(self, stall):
+        """ Log a stall and fire the stalled event. """
+        if self.log_stalls:
+            if stall.recovered:
+                logger.warning(
+                    "GUI event loop recovered after %.3fs", stall.duration
+                )
+            else:
+                logger.warning("%s", stall)
+        self.stalled = stall
@@ -13,6 +13,8 @@
 
 import logging
 import os
+import threading
+import time
 
 
 from traits.etsconfig.api import ETSConfig
@@ -22,6 +24,12 @@ from traits.api import Bool, HasTraits, Interface, Str
 # Logging.
 logger = logging.getLogger(__name__)
 
+# The pending coalesced calls, keyed by their coalescing key.
+_coalesced_calls = {}
+
+# Lock protecting the pending coalesced calls.
+_coalesced_calls_lock = threading.Lock()
+
 
 class IGUI(Interface):
     """ The interface of a pyface GUI. """
@@ -126,8 +134,107 @@ class IGUI(Interface):
             The value to set.
         """
 
+    @classmethod
+    def invoke_later_coalesced(cls, key, callable, *args, **kw):
+        """ Call a callable in the main GUI thread, replacing any pending
+        call with the same key.
+
+        Only the most recent of the calls made with a key before the GUI
+        gets to them is made, with that call's arguments.  This is useful
+        when a background thread produces updates faster than the GUI can
+        show them.  The call is made at the position in the queue of the
+        first of the pending calls.
+
+        This may be called from any thread.
+
+        Parameters
+        ----------
+        key : hashable
+            The key identifying the calls which replace each other.
+        callable : Callable
+            Callable to be called.
+        args, kwargs :
+            Arguments and keyword arguments to be used when calling.
+        """
+
+    @classmethod
+    def set_trait_latest(cls, obj, trait_name, new):
+        """ Sets a trait in the main GUI thread, replacing any pending value.
+
+        Unlike :py:meth:`set_trait_later`, if the trait is set again before
+        the GUI gets to it, only the most recent value is set.
+
+        Parameters
+        ----------
+        obj : traits.has_traits.HasTraits
+            Object on which the trait is to be set
+        trait_name : str
+            The name of the trait to set
+        new : Any
+            The value to set.
+        """
+
+    @classmethod
+    def submit(cls, fn, *args, **kwargs):
+        """ Run a callable in the background, with the result on the GUI
+        thread.
+
+        The callable is run by the shared
+        :py:class:`~pyface.gui_executor.GUIExecutor`, which uses a thread
+        pool unless it is replaced with
+        :py:func:`~pyface.gui_executor.set_default_gui_executor`.
+
+        Parameters
+        ----------
+        fn : Callable
+            The callable to run.
+        args, kwargs :
+            Arguments and keyword arguments to be used when calling.
+
+        Returns
+        -------
+        future : pyface.gui_executor.GUIFuture
+            The future of the result, whose done-callbacks are called on
+            the GUI thread.
+        """
+
+    @classmethod
+    def iter_processing_events(cls, iterable, every_ms=50, max_time_ms=10,
+                               allow_user_events=True):
+        """ Iterate over an iterable, processing GUI events periodically.
+
+        This lets a long computation on the GUI thread be broken into chunks
+        while keeping the GUI responsive, with predictable latency for both
+        the GUI and the computation::
+
+            for chunk in GUI.iter_processing_events(chunks):
+                process(chunk)
+
+        After each item has been handled, if at least ``every_ms``
+        milliseconds have passed since events were last processed, pending
+        GUI events are processed for at most ``max_time_ms`` milliseconds.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The items to iterate over.
+        every_ms : float
+            The minimum time in milliseconds between processing events.
+        max_time_ms : int or None
+            The maximum time in milliseconds to spend processing events each
+            time, or None to process all pending events.
+        allow_user_events : bool
+            If allow_user_events is ``False`` then user generated events are not
+            processed.
+
+        Returns
+        -------
+        items : iterator
+            An iterator over the items of the iterable.
+        """
+
     @staticmethod
-    def process_events(allow_user_events=True):
+    def process_events(allow_user_events=True, max_time_ms=None):
         """ Process any pending GUI events.
 
         Parameters
@@ -135,6 +242,11 @@ class IGUI(Interface):
         allow_user_events : bool
             If allow_user_events is ``False`` then user generated events are not
             processed.
+        max_time_ms : int or None
+            If not None, stop processing events after this many milliseconds,
+            even if there are more pending events.  The time can be exceeded
+            by an event handler which takes longer than this.  Toolkits which
+            don't support a time limit process all pending events.
         """
 
     @staticmethod
@@ -181,6 +293,98 @@ class MGUI(HasTraits):
 
         signal.signal(signal.SIGINT, signal.SIG_DFL)
 
+    @classmethod
+    def invoke_later_coalesced(cls, key, callable, *args, **kw):
+        """ Call a callable in the main GUI thread, replacing any pending
+        call with the same key.
+
+        Parameters
+        ----------
+        key : hashable
+            The key identifying the calls which replace each other.
+        callable : Callable
+            Callable to be called.
+        args, kwargs :
+            Arguments and keyword arguments to be used when calling.
+        """
+        with _coalesced_calls_lock:
+            pending = key in _coalesced_calls
+            _coalesced_calls[key] = (callable, args, kw)
+
+        if not pending:
+            cls.invoke_later(_invoke_coalesced, key)
+
+    @classmethod
+    def set_trait_latest(cls, obj, trait_name, new):
+        """ Sets a trait in the main GUI thread, replacing any pending value.
+
+        Parameters
+        ----------
+        obj : traits.has_traits.HasTraits
+            Object on which the trait is to be set
+        trait_name : str
+            The name of the trait to set
+        new : Any
+            The value to set.
+        """
+        # The object is kept alive by the pending call, so its id is unique
+        # for as long as the key is in use.
+        key = ("set_trait_latest", id(obj), trait_name)
+        cls.invoke_later_coalesced(key, setattr, obj, trait_name, new)
+
+    @classmethod
+    def submit(cls, fn, *args, **kwargs):
+        """ Run a callable in the background, with the result on the GUI
+        thread.
+
+        Parameters
+        ----------
+        fn : Callable
+            The callable to run.
+        args, kwargs :
+            Arguments and keyword arguments to be used when calling.
+
+        Returns
+        -------
+        future : pyface.gui_executor.GUIFuture
+            The future of the result, whose done-callbacks are called on
+            the GUI thread.
+        """
+        from pyface.gui_executor import get_default_gui_executor
+
+        return get_default_gui_executor().submit(fn, *args, **kwargs)
+
+    @classmethod
+    def iter_processing_events(cls, iterable, every_ms=50, max_time_ms=10,
+                               allow_user_events=True):
+        """ Iterate over an iterable, processing GUI events periodically.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The items to iterate over.
+        every_ms : float
+            The minimum time in milliseconds between processing events.
+        max_time_ms : int or None
+            The maximum time in milliseconds to spend processing events each
+            time, or None to process all pending events.
+        allow_user_events : bool
+            If allow_user_events is ``False`` then user generated events are not
+            processed.
+
+        Returns
+        -------
+        items : iterator
+            An iterator over the items of the iterable.
+        """
+        every = every_ms / 1000.0
+        deadline = time.perf_counter() + every
+        for item in iterable:
+            yield item
+            if time.perf_counter() >= deadline:
+                cls.process_events(allow_user_events, max_time_ms)
+                deadline = time.perf_counter() + every
+
     def _default_state_location(self):
         """ Return the default state location. """
 
@@ -194,3 +398,13 @@ class MGUI(HasTraits):
         logger.debug("GUI state location is <%s>", state_location)
 
         return state_location
+
+
+def _invoke_coalesced(key):
+    """ Make the most recent pending call with a key. """
+    with _coalesced_calls_lock:
+        call = _coalesced_calls.pop(key, None)
+
+    if call is not None:
+        callable, args, kw = call
+        callable(*args, **kw)
@@ -51,12 +51,27 @@ class IImageResource(IImage):
             The (width, height) tuple giving the size of the image.
         """
 
+    def get_reference(self, size=None):
+        """ Get the resource reference to the image, locating it if needed.
+
+        Parameters
+        ----------
+        size : (int, int) or None
+            The desired size as a width, height tuple, or None if wanting
+            default image size.
+
+        Returns
+        -------
+        reference : ImageReference or None
+            The reference to the image, or None if it could not be found.
+        """
+
 
 class MImageResource(HasTraits):
     """ The mixin class that contains common code for toolkit specific
     implementations of the IImageResource interface.
 
-    Implements: __init__(), create_image()
+    Implements: __init__(), create_image(), get_reference()
     """
 
     # Private interface ----------------------------------------------------
@@ -68,8 +83,11 @@ class MImageResource(HasTraits):
     # 'object' interface.
     # ------------------------------------------------------------------------
 
-    def __init__(self, name, search_path=None):
+    def __init__(self, name, search_path=None, reference=None):
         self.name = name
+        if reference is not None:
+            # The image has already been located, eg. in an image library.
+            self._ref = reference
 
         if isinstance(search_path, str):
             _path = [search_path]
@@ -102,13 +120,31 @@ class MImageResource(HasTraits):
         """
         ref = self._get_ref(size)
         if ref is not None:
-            image = ref.load()
+            from pyface.resource_manager import decoded_image_cache
+
+            image = decoded_image_cache.get_reference_image(ref)
 
         else:
             image = self._get_image_not_found_image()
 
         return image
 
+    def get_reference(self, size=None):
+        """ Get the resource reference to the image, locating it if needed.
+
+        Parameters
+        ----------
+        size : (int, int) or None
+            The desired size as a width, height tuple, or None if wanting
+            default image size.
+
+        Returns
+        -------
+        reference : ImageReference or None
+            The reference to the image, or None if it could not be found.
+        """
+        return self._get_ref(size)
+
     # ------------------------------------------------------------------------
     # Private interface.
     # ------------------------------------------------------------------------
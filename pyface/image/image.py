@@ -12,6 +12,7 @@
 """ Defines the ImageLibrary object used to manage Pyface image libraries.
 """
 
+import json
 import sys
 from os import (
     environ,
@@ -37,11 +38,12 @@ from os.path import (
 )
 from stat import ST_MTIME
 from platform import system
-from zipfile import is_zipfile, ZipFile, ZIP_DEFLATED
+from zipfile import BadZipFile, ZipFile, ZIP_DEFLATED
 import datetime
+import struct
 import time
+import zlib
 from _thread import allocate_lock
-from threading import Thread
 
 from traits.api import (
     HasPrivateTraits,
@@ -57,17 +59,20 @@ from traits.api import (
     TraitError,
     Float,
     Any,
+    Tuple,
     cached_property,
 )
 from traits.trait_base import get_resource_path, traits_home
 
 from pyface.api import ImageResource
 from pyface.resource_manager import resource_manager
+from pyface.resource.zip_reader import get_zip_reader
 from pyface.resource.resource_reference import (
     ImageReference,
     ResourceReference,
+    file_source,
 )
-from pyface.ui_traits import HasMargin, HasBorder, Alignment
+from pyface.ui_traits import Alignment, Border, HasBorder, HasMargin, Margin
 
 # ---------------------------------------------------------------------------
 #  Constants:
@@ -79,8 +84,24 @@ ImageFileExts = (".png", ".gif", ".jpg", "jpeg")
 # The image_cache root directory:
 image_cache_path = join(traits_home(), "image_cache")
 
+# The name of the declarative index describing a volume and its images:
+volume_index_name = "image_volume.json"
+
+# The version of the volume index format written by this module:
+volume_index_version = 1
+
+# The names of the image and the JSON offset table of a volume's atlas:
+atlas_image_name = "image_atlas.png"
+atlas_index_name = "image_atlas.json"
+
+# The maximum width of a volume's atlas image:
+atlas_max_width = 1024
+
 # Names of files that should not be copied when ceating a new library copy:
-dont_copy_list = ("image_volume.py", "image_info.py", "license.txt")
+dont_copy_list = (
+    volume_index_name, "image_volume.py", "image_info.py", "license.txt",
+    atlas_image_name, atlas_index_name,
+)
 
 # -- Code Generation Templates ----------------------------------------------
 
@@ -167,6 +188,99 @@ def get_python_value(source, name):
     return temp[name]
 
 
+def get_volume_index(source):
+    """ Returns the volume index data loaded from a specified JSON string, or
+        None if the index is not in a format that can be read.
+    """
+    try:
+        data = json.loads(source)
+    except ValueError:
+        return None
+
+    if (not isinstance(data, dict)) or (
+        data.get("version") != volume_index_version
+    ):
+        return None
+
+    return data
+
+
+def image_info_from_data(data):
+    """ Returns a new ImageInfo object created from the data for an image in a
+        volume index.
+    """
+    data = dict(data)
+    for name, klass in (
+        ("border", Border), ("content", Margin), ("label", Margin)
+    ):
+        if name in data:
+            data[name] = klass(*data[name])
+
+    return ImageInfo(**data)
+
+
+def image_volume_from_data(data):
+    """ Returns a new ImageVolume object created from the data in a volume
+        index. The image data is kept so that the volume's ImageInfo objects
+        are only created if they are needed.
+    """
+    volume = ImageVolume(
+        category=data.get("category", "General"),
+        keywords=data.get("keywords", []),
+        aliases=data.get("aliases", []),
+        time_stamp=data.get("time_stamp", ""),
+        info=[ImageVolumeInfo(**info) for info in data.get("info", [])],
+    )
+    volume._image_index = data.get("images", [])
+
+    return volume
+
+
+def pack_images(sizes, max_width=atlas_max_width):
+    """ Returns the (x, y) offsets of images with the specified (width,
+        height) sizes packed into rows no wider than *max_width* (unless an
+        image is wider), together with the (width, height) of the result.
+    """
+    offsets = [None] * len(sizes)
+    order = sorted(
+        range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])
+    )
+    x = y = row_height = width = 0
+    for i in order:
+        image_width, image_height = sizes[i]
+        if (x > 0) and (x + image_width > max_width):
+            y += row_height
+            x = row_height = 0
+        offsets[i] = (x, y)
+        x += image_width
+        row_height = max(row_height, image_height)
+        width = max(width, x)
+
+    return offsets, (width, y + row_height)
+
+
+def png_data(array):
+    """ Returns the contents of a PNG file for an N x M x 4 array of RGBA
+        bytes.
+    """
+    height, width, channels = array.shape
+
+    def chunk(tag, data):
+        return (
+            struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    # Each row is preceded by the 'None' filter type:
+    rows = b"".join(b"\x00" + array[row].tobytes() for row in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+
+    return (
+        b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows, 9)) + chunk(b"IEND", b"")
+    )
+
+
 def time_stamp_for(time):
     """ Returns a specified time as a text string.
     """
@@ -208,18 +322,23 @@ def join_image_name(volume_name, file_name):
 class FastZipFile(HasPrivateTraits):
     """ Provides fast access to zip files by keeping the underlying zip file
         open across multiple uses.
+
+        The zip file is read through the reader shared with the resource
+        manager, so its directory is only parsed once, and members can be
+        read from several threads at the same time. The reader closes the
+        file after it has not been used for a while.
     """
 
     #: The path to the zip file:
     path = File()
 
-    #: The open zip file object (if None, the file is closed):
+    #: The open zip file object:
     zf = Property
 
     #: The time stamp of when the zip file was most recently accessed:
     time_stamp = Float()
 
-    #: The lock used to manage access to the 'zf' trait between the two threads:
+    #: The lock used to manage access to the shared zip file reader:
     access = Any()
 
     # -- Public Methods ---------------------------------------------------------
@@ -227,33 +346,22 @@ class FastZipFile(HasPrivateTraits):
     def namelist(self):
         """ Returns the names of all files in the top-level zip file directory.
         """
-        self.access.acquire()
-        try:
-            return self.zf.namelist()
-        finally:
-            self.access.release()
+        return self._get_reader().namelist()
 
     def read(self, file_name):
         """ Returns the contents of the specified **file_name** from the zip
             file.
         """
-        self.access.acquire()
-        try:
-            return self.zf.read(file_name)
-        finally:
-            self.access.release()
+        return self._get_reader().read(file_name)
 
     def close(self):
         """ Temporarily closes the zip file (usually while the zip file is being
             replaced by a different version).
         """
-        self.access.acquire()
-        try:
-            if self._zf is not None:
-                self._zf.close()
-                self._zf = None
-        finally:
-            self.access.release()
+        with self.access:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
 
     # -- Default Value Implementations ------------------------------------------
 
@@ -263,36 +371,26 @@ class FastZipFile(HasPrivateTraits):
     # -- Property Implementations -----------------------------------------------
 
     def _get_zf(self):
-        # Restart the time-out:
-        self.time_stamp = time.time()
-
-        if self._zf is None:
-            self._zf = ZipFile(self.path, "r")
-            if self._running is None:
-                Thread(target=self._process).start()
-                self._running = True
-
-        return self._zf
+        return self._get_reader().zip_file
 
     # -- Private Methods --------------------------------------------------------
 
-    def _process(self):
-        """ Waits until the zip file has not been accessed for a while, then
-            closes the file and exits.
+    def _get_reader(self):
+        """ Returns the shared reader for the zip file.
         """
-        while True:
-            time.sleep(1)
-            self.access.acquire()
-            if time.time() > (self.time_stamp + 2.0):
-                if self._zf is not None:
-                    self._zf.close()
-                    self._zf = None
-
-                self._running = None
-                self.access.release()
-                break
+        self.time_stamp = time.time()
+
+        reader = self._reader
+        if reader is None:
+            with self.access:
+                reader = self._reader
+                if reader is None:
+                    reader = get_zip_reader(self.path)
+                    if reader is None:
+                        raise BadZipFile("%r is not a zip file" % self.path)
+                    self._reader = reader
 
-            self.access.release()
+        return reader
 
 
 # -------------------------------------------------------------------------------
@@ -351,6 +449,10 @@ class ImageInfo(HasPrivateTraits):
     #: ImageInfo object:
     image_info_code = Property
 
+    #: A read-only dictionary containing the data stored for this ImageInfo
+    #: object in a volume index:
+    image_info_data = Property
+
     # -- Default Value Implementations ------------------------------------------
 
     def _name_default(self):
@@ -405,6 +507,23 @@ class ImageInfo(HasPrivateTraits):
         data.update(("l" + name, getattr(self.label, name)) for name in sides)
         return ImageInfoTemplate % data
 
+    def _get_image_info_data(self):
+        data = self.trait_get(
+            "name",
+            "image_name",
+            "description",
+            "category",
+            "width",
+            "height",
+            "alignment",
+        )
+        data["keywords"] = list(self.keywords)
+        sides = ["left", "right", "top", "bottom"]
+        for name in ["border", "content", "label"]:
+            margin = getattr(self, name)
+            data[name] = [getattr(margin, side) for side in sides]
+        return data
+
     def _get_copyright(self):
         return self._volume_info("copyright")
 
@@ -451,6 +570,10 @@ class ImageVolumeInfo(HasPrivateTraits):
     #: A read-only string containing the text describing the volume info:
     image_volume_info_text = Property
 
+    #: A read-only dictionary containing the data stored for this
+    #: ImageVolumeInfo object in a volume index:
+    image_volume_info_data = Property
+
     # -- Property Implementations -----------------------------------------------
 
     @cached_property
@@ -462,6 +585,11 @@ class ImageVolumeInfo(HasPrivateTraits):
 
         return ImageVolumeInfoCodeTemplate % data
 
+    def _get_image_volume_info_data(self):
+        data = self.trait_get("description", "copyright", "license")
+        data["image_names"] = list(self.image_names)
+        return data
+
     @cached_property
     def _get_image_volume_info_text(self):
         description = self.description.replace("\n", "\n    ")
@@ -540,6 +668,31 @@ class ImageVolume(HasPrivateTraits):
     #: apply to):
     license_text = Property
 
+    #: A read-only list containing the volume index data for each image in the
+    #: volume:
+    images_data = Property
+
+    #: A read-only string containing the JSON volume index describing this
+    #: ImageVolume object and its images:
+    image_volume_index = Property
+
+    #: A read-only dictionary mapping the file names of the images packed into
+    #: the volume's atlas (if it has one) to their (x, y, width, height)
+    #: regions of the atlas image:
+    atlas_index = Property
+
+    # -- Private Traits ---------------------------------------------------------
+
+    #: The image data read from the volume index (if any) that has not yet been
+    #: converted to ImageInfo objects:
+    _image_index = Any()
+
+    #: The atlas offset table read from the volume (None if not read yet):
+    _atlas_index = Any()
+
+    #: The decoded atlas image (None if not loaded yet):
+    _atlas_image = Any()
+
     # -- Public Methods ---------------------------------------------------------
 
     def update(self):
@@ -553,12 +706,14 @@ class ImageVolume(HasPrivateTraits):
         # Make sure the images are up to date by deleting any current value:
         self.reset_traits(["images"])
 
-        # Save the new image volume information:
-        self.save()
+        # Save the new image volume information, rebuilding any atlas:
+        self.save(atlas=self._has_atlas())
 
-    def save(self):
+    def save(self, atlas=False):
         """ Saves the contents of the image volume using the current contents
-            of the **ImageVolume**.
+            of the **ImageVolume**. If **atlas** is True, the images are also
+            packed into an atlas; otherwise any existing atlas is discarded,
+            since it may no longer match the images.
         """
         path = self.path
 
@@ -573,11 +728,18 @@ class ImageVolume(HasPrivateTraits):
         ):
             return False
 
-        # Pre-compute the images code, because it can require a long time
+        # Pre-compute the images data, because it can require a long time
         # to load all of the images so that we can determine their size, and we
         # don't want that time to interfere with the time stamp of the image
         # volume:
-        images_code = self.images_code
+        images_data = self.images_data
+
+        # Likewise for the atlas, which requires all of the images to be
+        # decoded:
+        atlas_files = self._atlas_files() if atlas else {}
+
+        # Any current atlas will be replaced or discarded:
+        self._atlas_index = self._atlas_image = None
 
         if not self.is_zip_file:
             # We need to time stamp when this volume info was generated, but
@@ -586,15 +748,21 @@ class ImageVolume(HasPrivateTraits):
             # allow for some slop in when the OS actually time stamps the file:
             self.time_stamp = time_stamp_for(time.time() + 5.0)
 
-            # Write the volume manifest source code to a file:
-            write_file(join(path, "image_volume.py"), self.image_volume_code)
-
-            # Write the image info source code to a file:
-            write_file(join(path, "image_info.py"), images_code)
+            # Write the volume index to a file:
+            write_file(
+                join(path, volume_index_name), self._volume_index(images_data)
+            )
 
             # Write a separate license file for human consumption:
             write_file(join(path, "license.txt"), self.license_text)
 
+            # Write or discard the atlas:
+            for name in (atlas_image_name, atlas_index_name):
+                if name in atlas_files:
+                    write_file(join(path, name), atlas_files[name])
+                elif exists(join(path, name)):
+                    remove(join(path, name))
+
             return True
 
         # Create a temporary name for the new .zip file:
@@ -623,15 +791,16 @@ class ImageVolume(HasPrivateTraits):
             # allow for some slop in when the OS actually time stamps the file:
             self.time_stamp = time_stamp_for(time.time() + 10.0)
 
-            # Write the volume manifest source code to the zip file:
-            new_zf.writestr("image_volume.py", self.image_volume_code)
-
-            # Write the image info source code to the zip file:
-            new_zf.writestr("image_info.py", images_code)
+            # Write the volume index to the zip file:
+            new_zf.writestr(volume_index_name, self._volume_index(images_data))
 
             # Write a separate license file for human consumption:
             new_zf.writestr("license.txt", self.license_text)
 
+            # Write the atlas (if any):
+            for name, data in atlas_files.items():
+                new_zf.writestr(name, data)
+
             # Done creating the new zip file:
             new_zf.close()
             new_zf = None
@@ -663,44 +832,44 @@ class ImageVolume(HasPrivateTraits):
 
         return True
 
+    def build_atlas(self):
+        """ Packs all of the images in the volume into a single atlas image
+            with a table of the region each image occupies, and saves the
+            volume. Images in the atlas are then loaded by decoding the atlas
+            once and copying their regions from it. Returns True if the volume
+            was saved.
+        """
+        return self.save(atlas=True)
+
     def image_resource(self, image_name):
         """ Returns the ImageResource object for the specified **image_name**.
         """
         # Get the name of the image file:
         volume_name, file_name = split_image_name(image_name)
 
-        if self.is_zip_file:
-            # See if we already have the image file cached in the file system:
-            cache_file = self._check_cache(file_name)
-            if cache_file is None:
-                # If not cached, then create a zip file reference:
-                ref = ZipFileReference(
-                    resource_factory=resource_manager.resource_factory,
-                    zip_file=self.zip_file,
-                    path=self.path,
-                    volume_name=self.name,
-                    file_name=file_name,
-                )
-            else:
-                # Otherwise, create a cache file reference:
-                ref = ImageReference(
-                    resource_manager.resource_factory, filename=cache_file
-                )
-        else:
-            # Otherwise, create a normal file reference:
-            ref = ImageReference(
-                resource_manager.resource_factory,
-                filename=join(self.path, file_name),
+        ref = self._file_reference(file_name)
+
+        # If the image is packed into the atlas, load it from there instead:
+        region = self.atlas_index.get(file_name)
+        if region is not None:
+            ref = AtlasImageReference(
+                resource_factory=resource_manager.resource_factory,
+                volume=self,
+                region=region,
+                source=ref,
             )
 
-        # Create the ImageResource object using the reference (note that the
-        # ImageResource class will not allow us to specify the reference in the
-        # constructor):
-        resource = ImageResource(file_name)
-        resource._ref = ref
+        # Create and return the ImageResource object using the reference:
+        return ImageResource(file_name, reference=ref)
+
+    def atlas_image(self):
+        """ Returns the decoded toolkit image of the volume's atlas. The atlas
+            is only decoded once.
+        """
+        if self._atlas_image is None:
+            self._atlas_image = self._file_reference(atlas_image_name).load()
 
-        # Return the ImageResource:
-        return resource
+        return self._atlas_image
 
     def image_data(self, image_name):
         """ Returns the image data (i.e. file contents) for the specified image
@@ -763,8 +932,100 @@ class ImageVolume(HasPrivateTraits):
             [info.image_volume_info_text for info in self.info]
         )
 
+    def _get_images_data(self):
+        return [info.image_info_data for info in self.images]
+
+    def _get_image_volume_index(self):
+        return self._volume_index(self.images_data)
+
+    def _get_atlas_index(self):
+        if self._atlas_index is None:
+            self._atlas_index = self._read_atlas_index()
+
+        return self._atlas_index
+
     # -- Private Methods --------------------------------------------------------
 
+    def _volume_index(self, images_data):
+        """ Returns the JSON volume index for the volume using the specified
+            image data.
+        """
+        data = self.trait_get("category", "time_stamp")
+        data["version"] = volume_index_version
+        data["keywords"] = list(self.keywords)
+        data["aliases"] = list(self.aliases)
+        data["info"] = [info.image_volume_info_data for info in self.info]
+        data["images"] = images_data
+
+        return json.dumps(data, indent=1, sort_keys=True)
+
+    def _read_image_index(self):
+        """ Returns the list of image data from the volume index, or None if
+            the volume does not have a readable volume index.
+        """
+        images = self._image_index
+        if images is not None:
+            # The data is only needed once, so release it:
+            self._image_index = None
+            return images
+
+        if self.is_zip_file:
+            zf = self.zip_file
+            if volume_index_name not in zf.namelist():
+                return None
+            index = get_volume_index(zf.read(volume_index_name))
+        else:
+            index_path = join(self.path, volume_index_name)
+            if not exists(index_path):
+                return None
+            index = get_volume_index(read_file(index_path))
+
+        if index is None:
+            return None
+
+        return index.get("images", [])
+
+    def _image_file_names(self):
+        """ Returns the names of the image files contained in the volume,
+            excluding the atlas.
+        """
+        if self.is_zip_file:
+            names = self.zip_file.namelist()
+        else:
+            names = listdir(self.path)
+
+        return [
+            name
+            for name in names
+            if (splitext(name)[1] in ImageFileExts)
+            and (name != atlas_image_name)
+        ]
+
+    def _has_atlas(self):
+        """ Returns whether the volume contains an atlas.
+        """
+        if self.is_zip_file:
+            return atlas_image_name in self.zip_file.namelist()
+
+        return exists(join(self.path, atlas_image_name))
+
+    def _is_up_to_date(self, images_data, time_stamp):
+        """ Returns whether the image information of the volume is up to date
+            with the image files it contains. If the volume has a volume
+            index, given by **images_data**, the images it lists are compared
+            with the image files, since the modification time of a volume
+            which has been checked out or installed says nothing about its
+            contents. Otherwise the time stamp of the volume is compared with
+            **time_stamp**, the modification time of the volume.
+        """
+        if images_data is None:
+            return self.time_stamp >= time_stamp
+
+        index_names = set(
+            split_image_name(data["image_name"])[1] for data in images_data
+        )
+        return index_names == set(self._image_file_names())
+
     def _load_image_info(self):
         """ Returns the list of ImageInfo objects for the images in the volume.
         """
@@ -777,27 +1038,32 @@ class ImageVolume(HasPrivateTraits):
         old_images = []
         cur_images = []
 
+        # Check to see if there is a volume index:
+        images_data = self._read_image_index()
+        if images_data is not None:
+            old_images = [image_info_from_data(data) for data in images_data]
+
         if self.is_zip_file:
             zf = self.zip_file
 
             # Get the names of all top-level entries in the zip file:
             names = zf.namelist()
 
-            # Check to see if there is an image info manifest file:
-            if "image_info.py" in names:
+            # Otherwise, check to see if there is an image info manifest file:
+            if (images_data is None) and ("image_info.py" in names):
                 # Load the manifest code and extract the images list:
                 old_images = get_python_value(
                     zf.read("image_info.py"), "images"
                 )
 
-            # Check to see if our time stamp is up to date with the file:
-            if self.time_stamp < time_stamp:
+            # Check to see if our image information is up to date:
+            if not self._is_up_to_date(images_data, time_stamp):
 
                 # If not, create an ImageInfo object for all image files
                 # contained in the .zip file:
                 for name in names:
                     root, ext = splitext(name)
-                    if ext in ImageFileExts:
+                    if (ext in ImageFileExts) and (name != atlas_image_name):
                         cur_images.append(
                             ImageInfo(
                                 name=root,
@@ -807,20 +1073,20 @@ class ImageVolume(HasPrivateTraits):
 
         else:
             image_info_path = join(self.path, "image_info.py")
-            if exists(image_info_path):
+            if (images_data is None) and exists(image_info_path):
                 # Load the manifest code and extract the images list:
                 old_images = get_python_value(
                     read_file(image_info_path), "images"
                 )
 
-            # Check to see if our time stamp is up to data with the file:
-            if self.time_stamp < time_stamp:
+            # Check to see if our image information is up to date:
+            if not self._is_up_to_date(images_data, time_stamp):
 
                 # If not, create an ImageInfo object for each image file
                 # contained in the path:
                 for name in listdir(self.path):
                     root, ext = splitext(name)
-                    if ext in ImageFileExts:
+                    if (ext in ImageFileExts) and (name != atlas_image_name):
                         cur_images.append(
                             ImageInfo(
                                 name=root,
@@ -858,6 +1124,123 @@ class ImageVolume(HasPrivateTraits):
 
         return images
 
+    def _read_atlas_index(self):
+        """ Returns the atlas offset table read from the volume, or an empty
+            dictionary if the volume does not have a readable atlas.
+        """
+        if self.path == "":
+            return {}
+
+        if self.is_zip_file:
+            zf = self.zip_file
+            names = zf.namelist()
+            if (atlas_index_name not in names) or (
+                atlas_image_name not in names
+            ):
+                return {}
+            source = zf.read(atlas_index_name)
+        else:
+            index_path = join(self.path, atlas_index_name)
+            if not (
+                exists(index_path)
+                and exists(join(self.path, atlas_image_name))
+            ):
+                return {}
+            source = read_file(index_path)
+
+        try:
+            data = json.loads(source)
+            if data.get("version") != volume_index_version:
+                return {}
+            return dict(
+                (name, tuple(region))
+                for name, region in data["images"].items()
+            )
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def _atlas_files(self):
+        """ Returns a dictionary mapping file names to the contents of the
+            files making up an atlas of the images in the volume.
+        """
+        import numpy as np
+
+        from pyface.util.image_helpers import bitmap_to_image, image_to_array
+
+        file_names = []
+        arrays = []
+        for info in self.images:
+            file_name = split_image_name(info.image_name)[1]
+            resource = ImageResource(
+                file_name, reference=self._file_reference(file_name)
+            )
+            try:
+                array = image_to_array(
+                    bitmap_to_image(resource.create_bitmap())
+                )
+            except ValueError:
+                # The toolkit could not decode the image, so leave it to be
+                # loaded from its own file:
+                continue
+
+            file_names.append(file_name)
+            arrays.append(array)
+
+        if len(arrays) == 0:
+            return {}
+
+        offsets, (width, height) = pack_images(
+            [(array.shape[1], array.shape[0]) for array in arrays]
+        )
+        atlas = np.zeros((height, width, 4), dtype="uint8")
+        regions = {}
+        for file_name, array, (x, y) in zip(file_names, arrays, offsets):
+            image_height, image_width = array.shape[:2]
+            atlas[y:y + image_height, x:x + image_width, :3] = array[..., :3]
+            if array.shape[2] == 4:
+                atlas[y:y + image_height, x:x + image_width, 3] = (
+                    array[..., 3]
+                )
+            else:
+                atlas[y:y + image_height, x:x + image_width, 3] = 0xFF
+            regions[file_name] = [x, y, image_width, image_height]
+
+        index = dict(version=volume_index_version, images=regions)
+
+        return {
+            atlas_image_name: png_data(atlas),
+            atlas_index_name: json.dumps(index, indent=1, sort_keys=True),
+        }
+
+    def _file_reference(self, file_name):
+        """ Returns the resource reference for an image file in the volume.
+        """
+        if self.is_zip_file:
+            # See if we already have the image file cached in the file system:
+            cache_file = self._check_cache(file_name)
+            if cache_file is None:
+                # If not cached, then create a zip file reference:
+                ref = ZipFileReference(
+                    resource_factory=resource_manager.resource_factory,
+                    zip_file=self.zip_file,
+                    path=self.path,
+                    volume_name=self.name,
+                    file_name=file_name,
+                )
+            else:
+                # Otherwise, create a cache file reference:
+                ref = ImageReference(
+                    resource_manager.resource_factory, filename=cache_file
+                )
+        else:
+            # Otherwise, create a normal file reference:
+            ref = ImageReference(
+                resource_manager.resource_factory,
+                filename=join(self.path, file_name),
+            )
+
+        return ref
+
     def _check_cache(self, file_name):
         """ Checks to see if the specified zip file name has been saved in the
             image cache. If it has, it returns the fully-qualified cache file
@@ -932,6 +1315,29 @@ class ZipFileReference(ResourceReference):
         # Return the image data from the image cache file:
         return self.resource_factory.image_from_file(cache_file)
 
+    def read_data(self):
+        """ Returns the raw bytes of the image file.
+        """
+        if self.cache_file == "":
+            return self.zip_file.read(self.file_name)
+
+        return read_file(self.cache_file)
+
+    def cache_key(self):
+        """ Returns a hashable key identifying the current image content.
+        """
+        source = file_source(self.path)
+        if source is None:
+            return None
+
+        return (source, self.file_name)
+
+    def is_persistent(self):
+        """ Returns whether the cache key identifies the image content across
+            sessions.
+        """
+        return True
+
     # -- Property Implementations -----------------------------------------------
 
     def _get_filename(self):
@@ -941,6 +1347,65 @@ class ZipFileReference(ResourceReference):
         return self.cache_file
 
 
+# -------------------------------------------------------------------------------
+#  'AtlasImageReference' class:
+# -------------------------------------------------------------------------------
+
+
+class AtlasImageReference(ResourceReference):
+    """ A reference to an image which is packed into the atlas of an image
+        volume, which is loaded by copying the image's region of the atlas.
+    """
+
+    #: The volume whose atlas contains the image:
+    volume = Instance(ImageVolume)
+
+    #: The (x, y, width, height) region of the atlas containing the image:
+    region = Tuple(Int, Int, Int, Int)
+
+    #: The reference to the image's own file:
+    source = Instance(ResourceReference)
+
+    # -- The 'ResourceReference' API --------------------------------------------
+
+    #: The file name of the image (in this case, the image's own file):
+    filename = Property
+
+    # -- ResourceReference Interface Implementation -----------------------------
+
+    def load(self):
+        """ Loads the resource by copying its region of the atlas.
+        """
+        return self.resource_factory.image_region(
+            self.volume.atlas_image(), *self.region
+        )
+
+    def read_data(self):
+        """ Returns the raw bytes of the image's own file.
+        """
+        return self.source.read_data()
+
+    def cache_key(self):
+        """ Returns a hashable key identifying the current image content.
+        """
+        source = self.source.cache_key()
+        if source is None:
+            return None
+
+        return (source, self.region)
+
+    def is_persistent(self):
+        """ Returns whether the cache key identifies the image content across
+            sessions.
+        """
+        return self.source.is_persistent()
+
+    # -- Property Implementations -----------------------------------------------
+
+    def _get_filename(self):
+        return self.source.filename
+
+
 # -------------------------------------------------------------------------------
 #  'ImageLibrary' class:
 # -------------------------------------------------------------------------------
@@ -965,6 +1430,17 @@ class ImageLibrary(HasPrivateTraits):
     #: Mapping from a 'virtual' library name to a 'real' library name:
     aliases = Dict()
 
+    #: The paths of the volume zip files found in the default library
+    #: directories:
+    volume_paths = List(Str)
+
+    #: The volumes loaded on demand (keyed by path) before the complete list
+    #: of volumes has been loaded:
+    _lazy_volumes = Dict(Str, ImageVolume)
+
+    #: Has the complete list of volumes been loaded?
+    _volumes_loaded = Bool(False)
+
     # -- Public methods ---------------------------------------------------------
 
     def image_info(self, image_name):
@@ -1001,6 +1477,11 @@ class ImageLibrary(HasPrivateTraits):
         # Extract the volume name from the image name:
         volume_name, file_name = split_image_name(image_name)
 
+        # If the volumes have not all been loaded yet, only load the ones
+        # needed to resolve the name:
+        if not self._volumes_loaded:
+            return self._find_lazy_volume(volume_name)
+
         # Find the correct volume, possibly resolving any aliases used:
         catalog = self.catalog
         aliases = self.aliases
@@ -1083,8 +1564,15 @@ class ImageLibrary(HasPrivateTraits):
             )
 
         # Create the ImageVolume to describe the path's contents:
+        index = None
+        index_path = join(path, volume_index_name)
+        if exists(index_path):
+            index = get_volume_index(read_file(index_path))
+
         image_volume_path = join(path, "image_volume.py")
-        if exists(image_volume_path):
+        if index is not None:
+            volume = image_volume_from_data(index)
+        elif exists(image_volume_path):
             volume = get_python_value(read_file(image_volume_path), "volume")
         else:
             volume = ImageVolume()
@@ -1093,17 +1581,32 @@ class ImageLibrary(HasPrivateTraits):
         volume.trait_set(name=volume_name, path=path, is_zip_file=False)
 
         # Try to bring the volume information up to date if necessary:
-        if volume.time_stamp < time_stamp_for(stat(path)[ST_MTIME]):
+        if not volume._is_up_to_date(
+            volume._image_index, time_stamp_for(stat(path)[ST_MTIME])
+        ):
             # Note that the save could fail if the volume is read-only, but
             # that's OK, because we're only trying to do the save in case
             # a developer had added or deleted some image files, which would
             # require write access to the volume:
-            volume.save()
+            volume.save(atlas=volume._has_atlas())
 
         # Add the new volume to the library:
         self.catalog[volume_name] = volume
         self.volumes.append(volume)
 
+    def build_atlas(self, volume_name):
+        """ Packs the images of the volume specified by **volume_name** into
+            an atlas, and saves the volume. Returns True if the volume was
+            saved.
+        """
+        volume = self.find_volume(join_image_name(volume_name, ""))
+        if volume is None:
+            raise TraitError(
+                "'%s' is not a known image volume name." % volume_name
+            )
+
+        return volume.build_atlas()
+
     def extract(self, file_name, image_names):
         """ Builds a new image volume called **file_name** from the list of
             image names specified by **image_names**. Each image name should be
@@ -1206,11 +1709,8 @@ class ImageLibrary(HasPrivateTraits):
             # Create the final volume info list for the volume:
             volume.info = list(info.values())
 
-            # Write the volume manifest source code to the zip file:
-            zf.writestr("image_volume.py", volume.image_volume_code)
-
-            # Write the image info source code to the zip file:
-            zf.writestr("image_info.py", volume.images_code)
+            # Write the volume index to the zip file:
+            zf.writestr(volume_index_name, volume.image_volume_index)
 
             # Write a separate licenses file for human consumption:
             zf.writestr("license.txt", volume.license_text)
@@ -1227,13 +1727,35 @@ class ImageLibrary(HasPrivateTraits):
     def _volumes_default(self):
         result = []
 
+        # Add the volumes for all of the library paths, re-using any volumes
+        # that have already been loaded on demand:
+        lazy_volumes = self._lazy_volumes
+        for path in self.volume_paths:
+            if path in lazy_volumes:
+                volume = lazy_volumes[path]
+            else:
+                volume = self._add_volume(path)
+            if volume is not None:
+                result.append(volume)
+
+        self._lazy_volumes = {}
+        self._volumes_loaded = True
+
+        # Return the list of default volumes found:
+        return result
+
+    def _volume_paths_default(self):
+        result = []
+
         # Check for and add the 'application' image library:
         app_library = join(dirname(abspath(sys.argv[0])), "library")
         if isdir(app_library):
-            result.extend(self._add_path(app_library))
+            result.extend(self._find_volume_paths(app_library))
 
         # Get all volumes in the standard Traits UI image library directory:
-        result.extend(self._add_path(join(get_resource_path(1), "library")))
+        result.extend(
+            self._find_volume_paths(join(get_resource_path(1), "library"))
+        )
 
         # Check to see if there is an environment variable specifying a list
         # of paths containing image libraries:
@@ -1247,14 +1769,22 @@ class ImageLibrary(HasPrivateTraits):
             # Add all image volumes found in each path in the environment
             # variable:
             for path in paths.split(separator):
-                result.extend(self._add_path(path))
+                result.extend(self._find_volume_paths(path))
 
-        # Return the list of default volumes found:
+        # Return the list of volume paths found:
         return result
 
     def _catalog_default(self):
         return dict([(volume.name, volume) for volume in self.volumes])
 
+    # -- Trait Event Handlers ---------------------------------------------------
+
+    def _volumes_changed(self):
+        self._volumes_loaded = True
+
+    def _catalog_changed(self):
+        self._volumes_loaded = True
+
     # -- Property Implementations -----------------------------------------------
 
     @cached_property
@@ -1277,9 +1807,57 @@ class ImageLibrary(HasPrivateTraits):
         # Return the images list:
         return images
 
-    def _add_path(self, path):
-        """ Returns a list of ImageVolume objects, one for each image library
-            located in the specified **path**.
+    def _find_lazy_volume(self, volume_name):
+        """ Returns the ImageVolume object for the specified **volume_name**
+            (or None if there is no such volume), loading only the library
+            volumes needed to resolve the name.
+        """
+        volume = self._resolve_lazy_volume(volume_name)
+        if (volume is None) and (
+            len(self._lazy_volumes) < len(self.volume_paths)
+        ):
+            # Aliases are defined by the volumes themselves, so load the rest
+            # of the volumes in case one of them defines the name:
+            for path in self.volume_paths:
+                self._load_lazy_volume(path)
+
+            volume = self._resolve_lazy_volume(volume_name)
+
+        return volume
+
+    def _resolve_lazy_volume(self, volume_name):
+        """ Returns the ImageVolume object for the specified **volume_name**
+            using the aliases of the volumes loaded so far, or None if the
+            volume cannot be found.
+        """
+        for name in (volume_name, self.aliases.get(volume_name)):
+            if name is None:
+                break
+
+            # Later paths take precedence over earlier ones, as they do in the
+            # catalog:
+            for path in reversed(self.volume_paths):
+                if splitext(basename(path))[0] == name:
+                    volume = self._load_lazy_volume(path)
+                    if volume is not None:
+                        return volume
+
+        return None
+
+    def _load_lazy_volume(self, path):
+        """ Returns the ImageVolume object for the library zip file specified
+            by **path** (or None if it is not a valid volume), loading it if
+            necessary.
+        """
+        lazy_volumes = self._lazy_volumes
+        if path not in lazy_volumes:
+            lazy_volumes[path] = self._add_volume(path)
+
+        return lazy_volumes[path]
+
+    def _find_volume_paths(self, path):
+        """ Returns a list of the paths of the image library zip files located
+            in the specified **path**.
         """
         result = []
 
@@ -1289,12 +1867,22 @@ class ImageLibrary(HasPrivateTraits):
             # Find each zip file in the directory:
             for base in listdir(path):
                 if splitext(base)[1] == ".zip":
+                    result.append(abspath(join(path, base)))
 
-                    # Try to create a volume from the zip file and add it to
-                    # the result:
-                    volume = self._add_volume(join(path, base))
-                    if volume is not None:
-                        result.append(volume)
+        # Return the list of paths found:
+        return result
+
+    def _add_path(self, path):
+        """ Returns a list of ImageVolume objects, one for each image library
+            located in the specified **path**.
+        """
+        result = []
+
+        # Try to create a volume from each zip file and add it to the result:
+        for volume_path in self._find_volume_paths(path):
+            volume = self._add_volume(volume_path)
+            if volume is not None:
+                result.append(volume)
 
         # Return the list of volumes found:
         return result
@@ -1307,7 +1895,7 @@ class ImageLibrary(HasPrivateTraits):
         path = abspath(path)
 
         # Make sure the path is a valid zip file:
-        if is_zipfile(path):
+        if get_zip_reader(path) is not None:
 
             # Create a fast zip file for reading:
             zf = FastZipFile(path=path)
@@ -1318,11 +1906,19 @@ class ImageLibrary(HasPrivateTraits):
             # Get the names of all top-level entries in the zip file:
             names = zf.namelist()
 
-            # Check to see if there is a manifest file:
-            if "image_volume.py" in names:
+            # Check to see if there is a volume index or a manifest file:
+            volume = None
+            if volume_index_name in names:
+                # Load the volume object from the volume index:
+                index = get_volume_index(zf.read(volume_index_name))
+                if index is not None:
+                    volume = image_volume_from_data(index)
+
+            if (volume is None) and ("image_volume.py" in names):
                 # Load the manifest code and extract the volume object:
                 volume = get_python_value(zf.read("image_volume.py"), "volume")
 
+            if volume is not None:
                 # Set the volume name:
                 volume.name = volume_name
 
@@ -1341,12 +1937,14 @@ class ImageLibrary(HasPrivateTraits):
                 volume = ImageVolume(name=volume_name, path=path, zip_file=zf)
 
             # If this volume is not up to date, update it:
-            if volume.time_stamp < time_stamp_for(stat(path)[ST_MTIME]):
+            if not volume._is_up_to_date(
+                volume._image_index, time_stamp_for(stat(path)[ST_MTIME])
+            ):
                 # Note that the save could fail if the volume is read-only, but
                 # that's OK, because we're only trying to do the save in case
                 # a developer had added or deleted some image files, which would
                 # require write access to the volume:
-                volume.save()
+                volume.save(atlas=volume._has_atlas())
 
             # Return the volume:
             return volume
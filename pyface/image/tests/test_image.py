@@ -8,7 +8,9 @@
 #
 # Thanks for using Enthought open source!
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
+import os
 from os import stat
 try:
     from importlib.resources import files
@@ -19,13 +21,17 @@ import shutil
 import tempfile
 import time
 import unittest
+from unittest import mock
 from zipfile import ZipFile, ZIP_DEFLATED
 
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
 from pyface.image_resource import ImageResource
 from pyface.ui_traits import Border, Margin
 from ..image import (
-    FastZipFile, ImageLibrary, ImageVolume, ImageVolumeInfo, ZipFileReference,
-    join_image_name, split_image_name, time_stamp_for,
+    AtlasImageReference, FastZipFile, ImageLibrary, ImageVolume,
+    ImageVolumeInfo, ZipFileReference, join_image_name, pack_images,
+    png_data, split_image_name, time_stamp_for,
 )
 
 
@@ -109,36 +115,40 @@ class TestFastZipFile(unittest.TestCase):
         zf = FastZipFile(path=ICONS_FILE)
 
         actual_zf = zf.zf
+        reader = zf._reader
 
-        self.assertIs(zf._zf, actual_zf)
+        self.assertIsNotNone(actual_zf)
+        self.assertTrue(reader.is_open)
 
         zf.close()
 
-        self.assertIsNone(zf._zf)
+        self.assertIsNone(zf._reader)
+        self.assertFalse(reader.is_open)
 
-    def test_eventual_zipfile_close(self):
-        zf = FastZipFile(path=ICONS_FILE)
+        # the zip file is reopened as needed
+        file_bytes = zf.read("red_ball.png")
 
-        self.assertFalse(zf._running)
-        start_time = time.time()
+        self.assertTrue(file_bytes.startswith(b"\x89PNG"))
 
-        actual_zf = zf.zf
+    def test_time_stamp(self):
+        zf = FastZipFile(path=ICONS_FILE)
 
+        start_time = time.time()
+        zf.read("red_ball.png")
         end_time = time.time()
 
-        self.assertIsNotNone(actual_zf)
         self.assertGreaterEqual(zf.time_stamp, start_time)
         self.assertLessEqual(zf.time_stamp, end_time)
-        self.assertTrue(zf._running)
-        self.assertIs(zf._zf, actual_zf)
 
-        # wait for thread to clean-up zipfile
-        # XXX this is not nice
-        while time.time() <= end_time + 3.0:
-            time.sleep(1.0)
+    def test_concurrent_reads(self):
+        zf = FastZipFile(path=ICONS_FILE)
+        names = [name for name in zf.namelist() if name.endswith(".png")]
+        expected = {name: zf.zf.read(name) for name in names}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(zf.read, names * 4))
 
-        self.assertFalse(zf._running)
-        self.assertIsNone(zf._zf)
+        self.assertEqual(results, [expected[name] for name in names * 4])
 
 
 class TestImageVolume(unittest.TestCase):
@@ -214,7 +224,7 @@ class TestImageVolume(unittest.TestCase):
             self.assertTrue(result)
 
             filenames = {file.name for file in path.iterdir()}
-            self.assertEqual(filenames, {"image_volume.py", "image_info.py", "license.txt"})
+            self.assertEqual(filenames, {"image_volume.json", "license.txt"})
 
             # test that new file is readable
             time_stamp = time_stamp_for(stat(path).st_mtime)
@@ -248,7 +258,7 @@ class TestImageVolume(unittest.TestCase):
             self.assertTrue(result)
 
             with closing(FastZipFile(path=path)) as zf:
-                self.assertEqual(set(zf.namelist()), {"image_volume.py", "image_info.py", "license.txt"})
+                self.assertEqual(set(zf.namelist()), {"image_volume.json", "license.txt"})
 
             # test that new file is readable
             with closing(FastZipFile(path=path)) as zf:
@@ -304,7 +314,7 @@ class TestImageVolume(unittest.TestCase):
             self.assertTrue(result)
 
             filenames = {file.name for file in path.iterdir()}
-            self.assertEqual(filenames, {"core.png", "image_volume.py", "image_info.py", "license.txt"})
+            self.assertEqual(filenames, {"core.png", "image_volume.json", "license.txt"})
 
             # test that new file is readable
             time_stamp = time_stamp_for(stat(path).st_mtime)
@@ -379,7 +389,7 @@ class TestImageVolume(unittest.TestCase):
             self.assertTrue(result)
 
             with closing(FastZipFile(path=path)) as zf:
-                self.assertEqual(set(zf.namelist()), {"core.png", "image_volume.py", "image_info.py", "license.txt"})
+                self.assertEqual(set(zf.namelist()), {"core.png", "image_volume.json", "license.txt"})
 
             # test that new file is readable
             with closing(FastZipFile(path=path)) as zf:
@@ -419,6 +429,72 @@ class TestImageVolume(unittest.TestCase):
                 # do one more save to smoke-test other code paths
                 volume_2.save()
 
+    def test_save_zipfile_volume_index(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "test.zip"
+            with ZipFile(path, "w", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "core.png")
+
+            with closing(FastZipFile(path=path)) as zf:
+                volume = ImageVolume(name="test", path=path, zip_file=zf)
+                image = volume.images[0]
+                image.description = "A test image"
+                image.keywords = ["core"]
+                image.border = Border(1, 2, 3, 4)
+                image.alignment = "center"
+                volume.save()
+
+            with closing(FastZipFile(path=path)) as zf:
+                with mock.patch(
+                    "pyface.image.image.get_python_value"
+                ) as get_python_value:
+                    volume_2 = ImageVolume(name="test", path=path, zip_file=zf)
+                    images = volume_2.images
+
+            get_python_value.assert_not_called()
+            image = images[0]
+            self.assertEqual(image.image_name, "@test:core")
+            self.assertEqual(image.description, "A test image")
+            self.assertEqual(image.keywords, ["core"])
+            self.assertEqual(image.width, 64)
+            self.assertEqual(image.height, 64)
+            self.assertEqual(
+                (
+                    image.border.left,
+                    image.border.right,
+                    image.border.top,
+                    image.border.bottom,
+                ),
+                (1, 2, 3, 4),
+            )
+            self.assertEqual(image.alignment, "center")
+            self.assertIs(image.volume, volume_2)
+
+    def test_load_legacy_manifest(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "test.zip"
+            with ZipFile(path, "w", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "core.png")
+
+            with closing(FastZipFile(path=path)) as zf:
+                volume = ImageVolume(name="test", path=path, zip_file=zf)
+                volume.images[0].description = "A test image"
+                volume.time_stamp = time_stamp_for(time.time() + 10.0)
+                image_volume_code = volume.image_volume_code
+                images_code = volume.images_code
+
+            with ZipFile(path, "a", ZIP_DEFLATED) as zf:
+                zf.writestr("image_volume.py", image_volume_code)
+                zf.writestr("image_info.py", images_code)
+
+            with closing(FastZipFile(path=path)) as zf:
+                volume_2 = ImageVolume(name="test", path=path, zip_file=zf)
+
+                self.assertEqual(len(volume_2.images), 1)
+                self.assertEqual(
+                    volume_2.images[0].description, "A test image"
+                )
+
     def test_icons_zipfile_volume(self):
         time_stamp = time_stamp_for(stat(ICONS_FILE).st_mtime)
         with closing(FastZipFile(path=ICONS_FILE)) as zf:
@@ -504,6 +580,167 @@ class TestImageVolume(unittest.TestCase):
             volume.volume_info("@test:four")
 
 
+class TestImageAtlas(unittest.TestCase):
+
+    def test_pack_images(self):
+        sizes = [(16, 16), (32, 32), (16, 8), (20, 16)]
+
+        offsets, size = pack_images(sizes, max_width=48)
+
+        self.assertEqual(size, (36, 56))
+        regions = [
+            (x, y, width, height)
+            for (x, y), (width, height) in zip(offsets, sizes)
+        ]
+        # no two images overlap and all are within the atlas
+        for i, (x, y, width, height) in enumerate(regions):
+            self.assertLessEqual(x + width, size[0])
+            self.assertLessEqual(y + height, size[1])
+            for x2, y2, width2, height2 in regions[i + 1:]:
+                self.assertTrue(
+                    x + width <= x2 or x2 + width2 <= x
+                    or y + height <= y2 or y2 + height2 <= y
+                )
+
+    def test_pack_images_wide(self):
+        offsets, size = pack_images([(100, 10), (10, 10)], max_width=50)
+
+        self.assertEqual(offsets, [(0, 0), (0, 10)])
+        self.assertEqual(size, (100, 20))
+
+    @requires_numpy
+    def test_png_data(self):
+        from pyface.util.image_helpers import bitmap_to_image, image_to_array
+
+        array = np.zeros((8, 16, 4), dtype="uint8")
+        array[..., 0] = np.arange(16, dtype="uint8")
+        array[..., 3] = 0xFF
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "test.png"
+            path.write_bytes(png_data(array))
+            image = ImageResource(str(path))
+            result = image_to_array(bitmap_to_image(image.create_bitmap()))
+
+        np.testing.assert_array_equal(result, array)
+
+    @requires_numpy
+    def test_build_atlas_zipfile(self):
+        from pyface.util.image_helpers import bitmap_to_image, image_to_array
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "icons.zip"
+            shutil.copyfile(ICONS_FILE, path)
+            with closing(FastZipFile(path=path)) as zf:
+                volume = ImageVolume(name="icons", path=path, zip_file=zf)
+                image_names = [image.image_name for image in volume.images]
+                originals = {
+                    image_name: image_to_array(bitmap_to_image(
+                        volume.image_resource(image_name).create_bitmap()
+                    ))
+                    for image_name in image_names
+                }
+
+                result = volume.build_atlas()
+
+            self.assertTrue(result)
+            with closing(FastZipFile(path=path)) as zf:
+                self.assertIn("image_atlas.png", zf.namelist())
+                self.assertIn("image_atlas.json", zf.namelist())
+                volume_2 = ImageVolume(name="icons", path=path, zip_file=zf)
+
+                self.assertEqual(
+                    [image.image_name for image in volume_2.images],
+                    image_names,
+                )
+                self.assertEqual(len(volume_2.atlas_index), len(image_names))
+                for image_name in image_names:
+                    image = volume_2.image_resource(image_name)
+                    self.assertIsInstance(
+                        image.get_reference(), AtlasImageReference
+                    )
+                    array = image_to_array(
+                        bitmap_to_image(image.create_bitmap())
+                    )
+                    np.testing.assert_array_equal(
+                        array, originals[image_name]
+                    )
+
+                # saving without an atlas discards it
+                volume_2.save()
+
+            with closing(FastZipFile(path=path)) as zf:
+                self.assertNotIn("image_atlas.png", zf.namelist())
+                volume_3 = ImageVolume(name="icons", path=path, zip_file=zf)
+
+                self.assertEqual(volume_3.atlas_index, {})
+                image = volume_3.image_resource(image_names[0])
+                self.assertIsInstance(
+                    image.get_reference(), ZipFileReference
+                )
+
+    @requires_numpy
+    def test_stale_volume_keeps_atlas(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "test.zip"
+            with ZipFile(path, "w", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "core.png")
+
+            with closing(FastZipFile(path=path)) as zf:
+                ImageVolume(name="test", path=path, zip_file=zf).build_atlas()
+
+            with ZipFile(path, "a", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "new.png")
+            library = type(ImageLibrary)()
+
+            volume = library._add_volume(path)
+            volume.zip_file.close()
+
+            with closing(FastZipFile(path=path)) as zf:
+                self.assertIn("image_atlas.png", zf.namelist())
+                volume_2 = ImageVolume(name="test", path=path, zip_file=zf)
+                self.assertEqual(
+                    volume_2.atlas_index,
+                    {"core.png": (0, 0, 64, 64), "new.png": (64, 0, 64, 64)},
+                )
+
+    @requires_numpy
+    def test_update_keeps_atlas(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            shutil.copyfile(
+                TEST_IMAGES_DIR / "core.png", Path(dir_path) / "core.png"
+            )
+            volume = ImageVolume(name="test", path=dir_path, is_zip_file=False)
+            volume.build_atlas()
+
+            volume.update()
+
+            self.assertTrue((Path(dir_path) / "image_atlas.png").exists())
+
+    @requires_numpy
+    def test_build_atlas_directory(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            shutil.copyfile(
+                TEST_IMAGES_DIR / "core.png", Path(dir_path) / "core.png"
+            )
+            volume = ImageVolume(name="test", path=dir_path, is_zip_file=False)
+
+            result = volume.build_atlas()
+
+            self.assertTrue(result)
+            self.assertTrue((Path(dir_path) / "image_atlas.png").exists())
+            volume_2 = ImageVolume(
+                name="test", path=dir_path, is_zip_file=False
+            )
+            self.assertEqual(
+                [image.image_name for image in volume_2.images],
+                ["@test:core"],
+            )
+            self.assertEqual(volume_2.atlas_index, {"core.png": (0, 0, 64, 64)})
+            image = volume_2.image_resource("@test:core")
+            self.assertEqual(image.image_size(image.create_image()), (64, 64))
+
+
 class TestImageLibrary(unittest.TestCase):
 
     # XXX These are more in the flavor of integration tests
@@ -560,3 +797,79 @@ class TestImageLibrary(unittest.TestCase):
         self.assertIsInstance(volume, ImageVolume)
         self.assertEqual(volume.name, "icons")
         self.assertTrue(ICONS_FILE.samefile(volume.path))
+
+    def test_find_volume_lazy(self):
+        library = type(ImageLibrary)()
+
+        volume = library.find_volume("@icons:red_ball")
+
+        self.assertEqual(volume.name, "icons")
+        self.assertEqual(
+            [Path(path).name for path in library._lazy_volumes],
+            ["icons.zip"],
+        )
+        self.assertFalse(library._volumes_loaded)
+
+        # the volume loaded on demand is re-used by the full list of volumes
+        self.assertIn(volume, library.volumes)
+        self.assertIs(library.catalog["icons"], volume)
+        self.assertTrue(library._volumes_loaded)
+
+    def test_find_volume_lazy_missing(self):
+        library = type(ImageLibrary)()
+
+        volume = library.find_volume("@missing:red_ball")
+
+        self.assertIsNone(volume)
+        self.assertEqual(
+            {Path(path).name for path in library._lazy_volumes},
+            {"icons.zip", "std.zip"},
+        )
+
+    def test_add_volume_up_to_date_not_saved(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "test.zip"
+            with ZipFile(path, "w", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "core.png")
+
+            with closing(FastZipFile(path=path)) as zf:
+                ImageVolume(name="test", path=path, zip_file=zf).save()
+
+            # a checkout or install makes the file newer than its time stamp
+            mtime = time.time() + 3600
+            os.utime(path, (mtime, mtime))
+            library = type(ImageLibrary)()
+
+            with mock.patch.object(ImageVolume, "save") as save:
+                volume = library._add_volume(path)
+                images = volume.images
+                volume.zip_file.close()
+
+            save.assert_not_called()
+            self.assertEqual(
+                [image.image_name for image in images], ["@test:core"]
+            )
+            self.assertEqual(images[0].width, 64)
+
+    def test_add_volume_new_image_saved(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = Path(dir_path) / "test.zip"
+            with ZipFile(path, "w", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "core.png")
+
+            with closing(FastZipFile(path=path)) as zf:
+                ImageVolume(name="test", path=path, zip_file=zf).save()
+
+            with ZipFile(path, "a", ZIP_DEFLATED) as zf:
+                zf.write(TEST_IMAGES_DIR / "core.png", "new.png")
+            library = type(ImageLibrary)()
+
+            volume = library._add_volume(path)
+            volume.zip_file.close()
+
+            with closing(FastZipFile(path=path)) as zf:
+                volume_2 = ImageVolume(name="test", path=path, zip_file=zf)
+                self.assertEqual(
+                    [image.image_name for image in volume_2.images],
+                    ["@test:core", "@test:new"],
+                )
@@ -13,12 +13,16 @@
 
 API for the ``pyface.resource`` subpackage.
 
+- :class:`~.DecodedImageCache`
+- :class:`~.PersistentImageCache`
 - :class:`~.ResourceFactory`
 - :class:`~.ResourceManager`
 - :func:`~.resource_path`
 
 """
 
+from .decoded_image_cache import DecodedImageCache
+from .persistent_image_cache import PersistentImageCache
 from .resource_factory import ResourceFactory
 from .resource_manager import ResourceManager
 from .resource_path import resource_path
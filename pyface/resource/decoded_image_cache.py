@@ -0,0 +1,228 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A cache of decoded toolkit images. """
+
+from pyface.resource.resource_reference import ImageReference
+from pyface.util.lru_cache import LRUCache
+
+
+#: The default maximum number of bytes of pixel data held by the cache.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class DecodedImageCache:
+    """ A least-recently-used cache of decoded toolkit images.
+
+    Images are keyed on a ``(source, size)`` tuple, where the source is any
+    hashable value which identifies where the image data came from, and the
+    cache is bounded by the total number of bytes of pixel data it holds.
+
+    The resource factory is used to compute the size of images and to copy
+    them, so that callers can never modify the images held by the cache.
+
+    If a persistent cache is set, images loaded from references whose keys
+    identify their content across sessions are also stored in it, and later
+    sessions load their pixels from there rather than decoding them.
+
+    Parameters
+    ----------
+    resource_factory : ResourceFactory
+        The toolkit resource factory.
+    max_bytes : int
+        The maximum number of bytes of pixel data to hold.
+    persistent_cache : PersistentImageCache or None
+        The on-disk cache of decoded images to use, if any.
+    """
+
+    def __init__(self, resource_factory, max_bytes=DEFAULT_MAX_BYTES,
+                 persistent_cache=None):
+        self.resource_factory = resource_factory
+        self.persistent_cache = persistent_cache
+        self._cache = LRUCache(
+            max_bytes,
+            size_of=resource_factory.image_nbytes,
+        )
+
+    @property
+    def max_bytes(self):
+        """ The maximum number of bytes of pixel data held by the cache. """
+        return self._cache.max_size
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        self._cache.max_size = max_bytes
+
+    def get_image(self, key, load):
+        """ Get a copy of a cached image, loading it if it isn't cached.
+
+        Parameters
+        ----------
+        key : hashable
+            The ``(source, size)`` key of the image.
+        load : callable
+            A callable with no arguments that returns the toolkit image.
+
+        Returns
+        -------
+        image : toolkit image
+            A copy of the cached toolkit image.
+        """
+        image = self._cache.get(key)
+        if image is None:
+            image = load()
+            self._cache[key] = image
+        return self.resource_factory.copy_image(image)
+
+    def find_image(self, key):
+        """ Get a copy of a cached image, if it is cached.
+
+        Parameters
+        ----------
+        key : hashable
+            The ``(source, size)`` key of the image.
+
+        Returns
+        -------
+        image : toolkit image or None
+            A copy of the cached toolkit image, or None if the image is not
+            in the cache.
+        """
+        image = self._cache.get(key)
+        if image is None:
+            return None
+        return self.resource_factory.copy_image(image)
+
+    def reference_key(self, reference, size=None):
+        """ Get the key of the image loaded from an image reference.
+
+        Parameters
+        ----------
+        reference : ResourceReference
+            The reference to load the image from.
+        size : (int, int) or None
+            The size of the image.
+
+        Returns
+        -------
+        key : tuple or None
+            The ``(source, size)`` key of the image, or None if the image
+            can't be cached.
+        """
+        source = reference.cache_key()
+        if source is None:
+            return None
+        return (source, size)
+
+    def get_reference_image(self, reference, size=None):
+        """ Get a copy of the image loaded from an image reference.
+
+        Parameters
+        ----------
+        reference : ResourceReference
+            The reference to load the image from.
+        size : (int, int) or None
+            The size of the image.
+
+        Returns
+        -------
+        image : toolkit image
+            A copy of the cached toolkit image.
+        """
+        key = self.reference_key(reference, size)
+        if key is None:
+            return reference.load()
+        if reference.is_persistent():
+            return self.get_image(
+                key,
+                lambda: self.load_persistent(
+                    key, reference.load, reference.read_data
+                ),
+            )
+        return self.get_image(key, reference.load)
+
+    def load_persistent(self, key, load, read_data):
+        """ Load an image, using the persistent cache if there is one.
+
+        The image is not added to the in-memory cache.
+
+        Parameters
+        ----------
+        key : hashable
+            The ``(source, size)`` key of the image.  Its ``repr`` must
+            identify the image content across sessions.
+        load : callable
+            A callable with no arguments that returns the toolkit image.
+        read_data : callable
+            A callable with no arguments that returns the encoded image
+            that the toolkit image is decoded from.
+
+        Returns
+        -------
+        image : toolkit image
+            The toolkit image.
+        """
+        persistent_cache = self.persistent_cache
+        if persistent_cache is None:
+            return load()
+
+        data = None
+        pixels = persistent_cache.find(key)
+        if pixels is None:
+            data = read_data()
+            pixels = persistent_cache.find_content(key, data)
+        if pixels is not None:
+            image = self.resource_factory.image_from_pixels(*pixels)
+            if image is not None:
+                return image
+
+        image = load()
+        pixels = self.resource_factory.image_pixels(image)
+        if pixels is not None and pixels[0] * pixels[1] > 0:
+            if data is None:
+                data = read_data()
+            persistent_cache.store(key, data, *pixels)
+        return image
+
+    def get_file_image(self, filename):
+        """ Get a copy of the image loaded from a file.
+
+        Parameters
+        ----------
+        filename : str
+            The path of the image file.
+
+        Returns
+        -------
+        image : toolkit image
+            A copy of the cached toolkit image.
+        """
+        reference = ImageReference(self.resource_factory, filename=filename)
+        return self.get_reference_image(reference)
+
+    def clear(self):
+        """ Discard all cached images. """
+        self._cache.clear()
+
+    def statistics(self):
+        """ Return the current statistics of the cache.
+
+        Returns
+        -------
+        statistics : CacheStatistics
+            A named tuple giving the number of hits, misses and evictions,
+            the number of images held, and the current and maximum number
+            of bytes of pixel data held.
+        """
+        return self._cache.statistics()
+
+    def reset_statistics(self):
+        """ Reset the hit, miss and eviction counts to zero. """
+        self._cache.reset_statistics()
@@ -0,0 +1,321 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A persistent on-disk cache of decoded images.
+
+Decoding an image means inflating it (for example from a zip file) and
+decompressing it, and most toolbar and menu icons are also scaled after they
+are decoded.  This cache stores the resulting pixels as raw RGBA data, so an
+application can skip all of that for the images it used in earlier sessions.
+
+Pixel data is stored in files named by a hash of the content of the encoded
+image together with the size of the decoded image, so an image which is
+available from more than one file is only stored once.  To avoid reading (and
+inflating) the encoded image just to compute its hash, the cache also records
+which content each source key referred to.  Source keys must identify the
+image content across sessions, such as those created by
+:py:func:`~pyface.resource.resource_reference.file_source`, which include
+the modification time and size of the file.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import threading
+import zlib
+
+from traits.trait_base import traits_home
+
+
+logger = logging.getLogger(__name__)
+
+#: The default directory holding the cache.
+DEFAULT_CACHE_PATH = os.path.join(traits_home(), "image_cache", "decoded")
+
+#: The default maximum number of bytes of pixel data held by the cache.
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+#: The version of the pixel file format.
+PIXELS_VERSION = 1
+
+# The header of a pixel file: magic, version, width, height and CRC-32 of the
+# pixel data.
+_PIXELS_HEADER = struct.Struct("<4sIIII")
+_PIXELS_MAGIC = b"PFRI"
+
+
+class PersistentImageCache:
+    """ A persistent, content-addressed cache of decoded RGBA pixels.
+
+    The cache is safe to use from several threads and several processes at
+    once: files are written to temporary names and atomically renamed, and
+    unreadable or corrupt files are treated as misses.  Failures to write to
+    the cache are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    path : str or None
+        The directory holding the cache.  If None, a directory in the
+        ETS home directory is used.
+    max_bytes : int
+        The maximum number of bytes of pixel data to keep.  The least
+        recently used images are removed once this is exceeded.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        if path is None:
+            path = DEFAULT_CACHE_PATH
+        self.path = path
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # The number of bytes of pixel files, or None if not counted yet.
+        self._size = None
+
+    def find(self, key):
+        """ Return the pixels of the image stored for a source key.
+
+        Parameters
+        ----------
+        key : hashable
+            The ``(source, size)`` key of the image.  Its ``repr`` must
+            identify the image content across sessions.
+
+        Returns
+        -------
+        pixels : (int, int, bytes) or None
+            The width, height and RGBA bytes of the image, or None if no
+            image is stored for the key.
+        """
+        try:
+            with open(self._link_path(key), "r", encoding="ascii") as fp:
+                name = fp.read().strip()
+        except (OSError, ValueError):
+            return None
+
+        return self._read_pixels(name)
+
+    def find_content(self, key, data):
+        """ Return the pixels of the image stored for some encoded content.
+
+        If found, the source key is recorded as referring to the content, so
+        that later lookups can use :py:meth:`find`.
+
+        Parameters
+        ----------
+        key : hashable
+            The ``(source, size)`` key of the image.
+        data : bytes
+            The encoded image, such as the contents of a PNG file.
+
+        Returns
+        -------
+        pixels : (int, int, bytes) or None
+            The width, height and RGBA bytes of the image, or None if no
+            image is stored for the content.
+        """
+        name = self._content_name(key, data)
+        pixels = self._read_pixels(name)
+        if pixels is not None:
+            self._write_link(key, name)
+        return pixels
+
+    def store(self, key, data, width, height, pixels):
+        """ Store the pixels of a decoded image.
+
+        Parameters
+        ----------
+        key : hashable
+            The ``(source, size)`` key of the image.
+        data : bytes
+            The encoded image that the pixels were decoded from.
+        width, height : int
+            The size of the decoded image.
+        pixels : bytes
+            The RGBA bytes of the decoded image, row by row.
+        """
+        if len(pixels) != width * height * 4:
+            raise ValueError(
+                "Expected {} bytes of pixel data, got {}".format(
+                    width * height * 4, len(pixels)
+                )
+            )
+
+        name = self._content_name(key, data)
+        header = _PIXELS_HEADER.pack(
+            _PIXELS_MAGIC, PIXELS_VERSION, width, height,
+            zlib.crc32(pixels) & 0xFFFFFFFF,
+        )
+        path = self._pixels_path(name)
+        new_file = not os.path.exists(path)
+        if not self._write_file(path, header + pixels):
+            return
+        self._write_link(key, name)
+
+        if new_file:
+            with self._lock:
+                if self._size is not None:
+                    self._size += _PIXELS_HEADER.size + len(pixels)
+        if self._get_size() > self.max_bytes:
+            self.prune()
+
+    def prune(self, max_bytes=None):
+        """ Remove the least recently used images until the cache is small
+        enough.
+
+        Parameters
+        ----------
+        max_bytes : int or None
+            The number of bytes to reduce the cache to.  If None, the
+            cache's maximum size is used.
+        """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+
+        entries = []
+        for entry in self._pixel_files():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        size = sum(entry_size for mtime, entry_size, path in entries)
+        for mtime, entry_size, path in entries:
+            if size <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+
+        with self._lock:
+            self._size = size
+
+    def clear(self):
+        """ Remove all of the images from the cache. """
+        for subdir in ["pixels", "sources"]:
+            try:
+                entries = list(os.scandir(os.path.join(self.path, subdir)))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+        with self._lock:
+            self._size = 0
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _content_name(self, key, data):
+        """ The name of the pixel file for some content at a size. """
+        source, size = key
+        digest = hashlib.sha256(data)
+        digest.update(repr(size).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _link_path(self, key):
+        """ The path of the file recording the content of a source key. """
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.path, "sources", name)
+
+    def _pixels_path(self, name):
+        """ The path of a pixel file. """
+        return os.path.join(self.path, "pixels", name + ".rgba")
+
+    def _read_pixels(self, name):
+        """ Read and check a pixel file, marking it as recently used. """
+        path = self._pixels_path(name)
+        try:
+            with open(path, "rb") as fp:
+                contents = fp.read()
+        except OSError:
+            return None
+
+        header_size = _PIXELS_HEADER.size
+        if len(contents) < header_size:
+            return None
+        magic, version, width, height, crc = _PIXELS_HEADER.unpack_from(
+            contents
+        )
+        pixels = contents[header_size:]
+        if (
+            magic != _PIXELS_MAGIC
+            or version != PIXELS_VERSION
+            or len(pixels) != width * height * 4
+            or (zlib.crc32(pixels) & 0xFFFFFFFF) != crc
+        ):
+            logger.debug("Ignoring corrupt cached image %r", path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return width, height, pixels
+
+    def _write_link(self, key, name):
+        """ Record the content that a source key refers to. """
+        self._write_file(self._link_path(key), name.encode("ascii"))
+
+    def _write_file(self, path, contents):
+        """ Atomically write a file, returning whether it succeeded. """
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    fp.write(contents)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            logger.debug("Could not write cached image %r", path, exc_info=True)
+            return False
+
+        return True
+
+    def _pixel_files(self):
+        """ The directory entries of the pixel files. """
+        try:
+            return [
+                entry
+                for entry in os.scandir(os.path.join(self.path, "pixels"))
+                if entry.name.endswith(".rgba")
+            ]
+        except OSError:
+            return []
+
+    def _get_size(self):
+        """ The number of bytes of pixel files, counting them if needed. """
+        with self._lock:
+            size = self._size
+        if size is None:
+            size = 0
+            for entry in self._pixel_files():
+                try:
+                    size += entry.stat().st_size
+                except OSError:
+                    pass
+            with self._lock:
+                self._size = size
+        return size
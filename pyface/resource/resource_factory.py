@@ -27,3 +27,35 @@ class ResourceFactory(object):
         """ Creates an image from the specified data. """
 
         raise NotImplementedError()
+
+    def image_nbytes(self, image):
+        """ Returns the number of bytes of pixel data held by an image. """
+
+        raise NotImplementedError()
+
+    def copy_image(self, image):
+        """ Returns a copy of an image which can be modified independently.
+        """
+
+        raise NotImplementedError()
+
+    def image_region(self, image, x, y, width, height):
+        """ Returns a copy of a rectangular region of an image. """
+
+        raise NotImplementedError()
+
+    def image_pixels(self, image):
+        """ Returns the (width, height, RGBA bytes) of an image.
+
+        Returns None if the toolkit can't provide the pixels of its images.
+        """
+
+        return None
+
+    def image_from_pixels(self, width, height, pixels):
+        """ Creates an image from RGBA bytes.
+
+        Returns None if the toolkit can't create images from pixels.
+        """
+
+        return None
@@ -14,12 +14,11 @@ sounds etc.
 """
 
 import collections.abc
-import glob
 import inspect
 import os
 from os.path import join
+import re
 import types
-from zipfile import is_zipfile, ZipFile
 
 # importlib.resources is new in Python 3.7, and importlib.resources.files is
 # new in Python 3.9, so for Python < 3.9 we must rely on the 3rd party
@@ -34,6 +33,14 @@ from traits.util.resource import get_path
 
 from pyface.resource.resource_factory import ResourceFactory
 from pyface.resource.resource_reference import ImageReference
+from pyface.resource.zip_reader import get_zip_reader
+from pyface.util.lru_cache import LRUCache
+
+#: The maximum number of image lookups remembered by a resource manager.
+LOOKUP_CACHE_SIZE = 10000
+
+#: Pattern matching the names of directories of images of a particular size.
+_SIZE_DIRECTORY = re.compile(r"^\d+x\d+$")
 
 
 class ResourceManager(HasTraits):
@@ -55,6 +62,14 @@ class ResourceManager(HasTraits):
     # a images in the format that they require.
     resource_factory = Instance(ResourceFactory)
 
+    # The results of previous image lookups, including failed lookups.
+    _lookup_cache = Instance(LRUCache, args=(LOOKUP_CACHE_SIZE,))
+
+    # Index of the files in searched directories, together with the
+    # modification time of the directory when it was indexed:
+    # {directory: (mtime, {normcase(name): [filename]})}
+    _directory_index = Instance(dict, ())
+
     # ------------------------------------------------------------------------
     # 'ResourceManager' interface.
     # ------------------------------------------------------------------------
@@ -81,21 +96,32 @@ class ResourceManager(HasTraits):
         image_ref : ImageReference or None
             ImageReference to the image found, or None if no matching images
             are found.
+
+        Notes
+        -----
+        The results of lookups, including failed lookups, are remembered.
+        A remembered result is discarded if the modification time of any of
+        the directories or zip files searched has changed, or if
+        ``clear_lookup_cache`` is called.  Checking the modification times
+        means that using a remembered result still costs a few ``os.stat``
+        calls for each directory in the search path, but no directory
+        listings or zip file reads.
         """
 
-        if not isinstance(path, collections.abc.Sequence):
-            path = [path]
+        resource_path = self._get_search_path(path)
 
-        resource_path = []
-        for item in list(path) + self.extra_paths:
-            if isinstance(item, str):
-                resource_path.append(item)
-            elif isinstance(item, types.ModuleType):
-                resource_path.append(item)
-            else:
-                resource_path.extend(self._get_resource_path(item))
+        if size is not None:
+            size = tuple(size)
+        key = (image_name, tuple(resource_path), size)
+        name_dir = os.path.dirname(image_name)
+        signature = self._get_path_signature(resource_path, name_dir, size)
+        cached = self._lookup_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        return self._locate_image(image_name, resource_path, size)
+        reference = self._locate_image(image_name, resource_path, size)
+        self._lookup_cache[key] = (signature, reference)
+        return reference
 
     def load_image(self, image_name, path, size=None):
         """ Loads an image. """
@@ -109,6 +135,46 @@ class ResourceManager(HasTraits):
 
         return image
 
+    def clear_lookup_cache(self):
+        """ Forget the results of all previous image lookups.
+
+        This should be called if images are added to or removed from search
+        locations in ways that don't change the modification times of the
+        directories, such as changes inside Python packages.
+        """
+
+        self._lookup_cache.clear()
+
+    def preload(self, path):
+        """ Index the image files available in a search path.
+
+        Image lookups use an index of the contents of each directory that
+        they search, which is built the first time the directory is searched
+        and rebuilt whenever the modification time of the directory changes.
+        This method builds the index for each directory in the path (and
+        their 'images' and sized 'images/{m}x{n}' subdirectories) ahead of
+        time.  It is safe to call this from a background thread, for example
+        during application startup.
+
+        Modules in the path are not indexed.
+
+        Parameters
+        ----------
+        path : list of (str or ModuleType)
+            Paths which will be searched for image files.
+        """
+
+        for dirname in self._get_search_path(path):
+            if not isinstance(dirname, str):
+                continue
+            self._get_directory_listing(dirname)
+            images_dir = join(dirname, "images")
+            listing = self._get_directory_listing(images_dir)
+            filenames = {name for names in listing.values() for name in names}
+            for filename in filenames:
+                if _SIZE_DIRECTORY.match(filename):
+                    self._get_directory_listing(join(images_dir, filename))
+
     # ------------------------------------------------------------------------
     # Private interface.
     # ------------------------------------------------------------------------
@@ -124,14 +190,17 @@ class ResourceManager(HasTraits):
         # If the image name contains a file extension (eg. '.jpg') then we will
         # only accept an an EXACT filename match.
         basename, extension = os.path.splitext(image_name)
-        if len(extension) > 0:
+        exact = len(extension) > 0
+        if exact:
             extensions = [extension]
-            pattern = image_name
 
         # Otherwise, we will search for common image suffixes.
         else:
             extensions = self.IMAGE_EXTENSIONS
-            pattern = image_name + ".*"
+
+        # The image name may include subdirectories.
+        name_dir, name = os.path.split(basename)
+        name_key = os.path.normcase(name)
 
         # Try the 'images' sub-directory first (since that is commonly
         # where we put them!).  If the image is not found there then look
@@ -162,83 +231,142 @@ class ResourceManager(HasTraits):
 
             # Is there anything resembling the image name in the directory?
             for path in subdirs:
-                filenames = glob.glob(join(dirname, path, pattern))
-                for filename in filenames:
-                    not_used, extension = os.path.splitext(filename)
-                    if extension in extensions:
-                        reference = ImageReference(
-                            self.resource_factory, filename=filename
-                        )
+                directory = join(dirname, *filter(None, [path, name_dir]))
+                listing = self._get_directory_listing(directory)
+                filenames = listing.get(name_key, [])
+                for extension in extensions:
+                    for filename in filenames:
+                        if _matches(filename, name_key, exact, extension):
+                            reference = ImageReference(
+                                self.resource_factory,
+                                filename=join(directory, filename),
+                            )
 
-                        return reference
+                            return reference
 
             # Is there an 'images' zip file in the directory?
-            zip_filename = join(dirname, "images.zip")
-            if os.path.isfile(zip_filename):
-                zip_file = ZipFile(zip_filename, "r")
+            zip_reader = get_zip_reader(join(dirname, "images.zip"))
+            if zip_reader is not None:
                 # Try the image name itself, and then the image name with
                 # common images suffixes.
-                for extension in extensions:
-                    try:
-                        image_data = zip_file.read(basename + extension)
-                        reference = ImageReference(
-                            self.resource_factory, data=image_data
+                for image_filename in image_filenames:
+                    if image_filename in zip_reader:
+                        return ImageReference(
+                            self.resource_factory,
+                            data=zip_reader.read(image_filename),
                         )
 
-                        return reference
-
-                    except:
-                        pass
-
-            # is this a path within a zip file?
-            # first, find the zip file in the path
-            filepath = dirname
-            zippath = ""
-            while (
-                not is_zipfile(filepath)
-                and os.path.splitdrive(filepath)[1].startswith("\\")
-                and os.path.splitdrive(filepath)[1].startswith("/")
-            ):
-                filepath, tail = os.path.split(filepath)
-                if zippath != "":
-                    zippath = tail + "/" + zippath
-                else:
-                    zippath = tail
-
-            # if we found a zipfile, then look inside it for the image!
-            if is_zipfile(filepath):
-
-                zip_file = ZipFile(filepath)
+            # Is this a path within a zip file?  If so, then look inside it
+            # for the image.
+            zip_reader = get_zip_reader(dirname)
+            if zip_reader is not None:
                 for subpath in ["images", ""]:
-                    for extension in extensions:
-                        try:
-                            # this is a little messy. since zip files don't
-                            # recognize a leading slash, we have to be very
-                            # particular about how we build this path when
-                            # there are empty strings
-                            if zippath != "":
-                                path = zippath + "/"
-                            else:
-                                path = ""
-
-                            if subpath != "":
-                                path = path + subpath + "/"
-
-                            path = path + basename + extension
-                            # now that we have the path we can attempt to load
-                            # the image
-                            image_data = zip_file.read(path)
-                            reference = ImageReference(
-                                self.resource_factory, data=image_data
+                    for image_filename in image_filenames:
+                        # Zip files don't recognize a leading slash.
+                        path = "/".join(filter(None, [subpath, image_filename]))
+                        if path in zip_reader:
+                            return ImageReference(
+                                self.resource_factory,
+                                data=zip_reader.read(path),
                             )
 
-                            # if there was no exception then return the result
-                            return reference
+        return None
 
-                        except:
-                            pass
+    def _get_search_path(self, path):
+        """ Resolves a path of directories, modules and objects to search.
+        """
 
-        return None
+        if not isinstance(path, collections.abc.Sequence):
+            path = [path]
+
+        resource_path = []
+        for item in list(path) + self.extra_paths:
+            if isinstance(item, str):
+                resource_path.append(item)
+            elif isinstance(item, types.ModuleType):
+                resource_path.append(item)
+            else:
+                resource_path.extend(self._get_resource_path(item))
+
+        return resource_path
+
+    def _get_directory_listing(self, directory):
+        """ Returns the index of the files in a directory.
+
+        The index maps the normalized case of each dot-separated prefix of a
+        filename to the filenames that start with it, so that "foo" finds
+        "foo.png" as well as "foo.2x.png".  It is rebuilt if the modification
+        time of the directory has changed since it was built.
+        """
+
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._directory_index.pop(directory, None)
+            return {}
+
+        cached = self._directory_index.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            filenames = os.listdir(directory)
+        except OSError:
+            # not a directory, or not readable
+            filenames = []
+
+        listing = {}
+        for filename in sorted(filenames):
+            parts = filename.split(".")
+            prefixes = {os.path.splitext(filename)[0]}
+            prefixes.update(
+                ".".join(parts[:i]) for i in range(1, len(parts))
+            )
+            for prefix in prefixes:
+                if prefix:
+                    listing.setdefault(
+                        os.path.normcase(prefix), []
+                    ).append(filename)
+
+        # Prefer filenames which are just the prefix and an extension.
+        for prefix, names in listing.items():
+            names.sort(
+                key=lambda name: (
+                    os.path.normcase(os.path.splitext(name)[0]) != prefix
+                )
+            )
+
+        self._directory_index[directory] = (mtime, listing)
+        return listing
+
+    def _get_path_signature(self, resource_path, name_dir, size):
+        """ Returns the modification times of the places an image is searched.
+
+        This is used to detect when remembered lookup results may be out of
+        date.  It covers each directory in the path (which may also be a zip
+        file), the directories within it that are searched for the image,
+        including any subdirectory given in the image name, and its
+        'images.zip' file.  Modules are assumed not to change.
+        """
+
+        if size is None:
+            subdirs = ["images", ""]
+        else:
+            subdirs = ["images/%dx%d" % (size[0], size[1]), "images", ""]
+        if not name_dir:
+            # the directory itself is already in the signature
+            subdirs.remove("")
+
+        signature = []
+        for dirname in resource_path:
+            if isinstance(dirname, str):
+                signature.append(_get_mtime(dirname))
+                for path in subdirs:
+                    directory = join(dirname, *filter(None, [path, name_dir]))
+                    signature.append(_get_mtime(directory))
+                signature.append(_get_mtime(join(dirname, "images.zip")))
+
+        return tuple(signature)
 
     def _get_resource_path(self, object):
         """ Returns the resource path for an object. """
@@ -268,6 +396,30 @@ class ResourceManager(HasTraits):
         return resource_path
 
 
+def _matches(filename, name_key, exact, extension):
+    """ Whether a filename found under a name's prefix is the image.
+
+    If the image name had an extension, only that exact filename matches.
+    Otherwise any filename which starts with the name and ends with the
+    extension matches, as for a glob of the name followed by ".*".
+    """
+    root, file_extension = os.path.splitext(filename)
+    if file_extension != extension:
+        return False
+    if exact:
+        return os.path.normcase(root) == name_key
+    return True
+
+
+def _get_mtime(path):
+    """ Return the modification time of a path, or None if it doesn't exist.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_package_data(module, rel_path):
     """ Return package data in bytes for the given module and resource path.
 
@@ -10,6 +10,7 @@
 
 """ Resource references. """
 
+import os
 
 from traits.api import Any, HasTraits, Instance
 
@@ -17,6 +18,31 @@ from traits.api import Any, HasTraits, Instance
 from pyface.resource.resource_factory import ResourceFactory
 
 
+def file_source(filename):
+    """ Return a cache source key for the current contents of a file.
+
+    The key includes the modification time and size of the file so that
+    cached resources are not used after the file has been changed.
+
+    Parameters
+    ----------
+    filename : str
+        The path of the file.
+
+    Returns
+    -------
+    source : tuple or None
+        The source key, or None if the file cannot be accessed.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (
+        "file", os.path.abspath(filename), stat.st_mtime_ns, stat.st_size
+    )
+
+
 class ResourceReference(HasTraits):
     """ Abstract base class for resource references.
 
@@ -37,6 +63,29 @@ class ResourceReference(HasTraits):
 
         raise NotImplementedError()
 
+    def read_data(self):
+        """ Returns the raw bytes of the resource.
+
+        Implementations must be safe to call from any thread.
+        """
+
+        raise NotImplementedError()
+
+    def cache_key(self):
+        """ Returns a hashable key identifying the current resource content.
+
+        Returns None if the loaded resource should not be cached.
+        """
+
+        return None
+
+    def is_persistent(self):
+        """ Returns whether the cache key identifies the resource content
+        across sessions, so that it can be used by persistent caches.
+        """
+
+        return False
+
 
 class ImageReference(ResourceReference):
     """ A reference to an image resource. """
@@ -74,3 +123,34 @@ class ImageReference(ResourceReference):
             raise ValueError("Image reference has no filename OR data")
 
         return image
+
+    def read_data(self):
+        """ Returns the raw bytes of the image file. """
+
+        if self.filename is not None:
+            with open(self.filename, "rb") as fp:
+                return fp.read()
+
+        elif self.data is not None:
+            return self.data
+
+        else:
+            raise ValueError("Image reference has no filename OR data")
+
+    def cache_key(self):
+        """ Returns a hashable key identifying the current image content. """
+
+        if self.filename is not None:
+            return file_source(self.filename)
+
+        elif self.data is not None:
+            return ("data", self.data)
+
+        return None
+
+    def is_persistent(self):
+        """ Returns whether the cache key identifies the resource content
+        across sessions.
+        """
+
+        return self.filename is not None
@@ -0,0 +1,195 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pyface.resource.decoded_image_cache import DecodedImageCache
+from pyface.resource.persistent_image_cache import PersistentImageCache
+from pyface.resource.resource_factory import ResourceFactory
+from pyface.resource.resource_reference import ImageReference
+
+
+class BytesResourceFactory(ResourceFactory):
+    """ A resource factory whose images are bytearrays. """
+
+    def image_from_file(self, filename):
+        try:
+            with open(filename, "rb") as fp:
+                return bytearray(fp.read())
+        except OSError:
+            return bytearray()
+
+    def image_from_data(self, data):
+        return bytearray(data)
+
+    def image_nbytes(self, image):
+        return len(image)
+
+    def copy_image(self, image):
+        return bytearray(image)
+
+
+class PixelResourceFactory(BytesResourceFactory):
+    """ A resource factory whose images are rows of RGBA bytes. """
+
+    def image_pixels(self, image):
+        return len(image) // 4, 1, bytes(image)
+
+    def image_from_pixels(self, width, height, pixels):
+        return bytearray(pixels)
+
+
+class TestDecodedImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.resource_factory = BytesResourceFactory()
+        self.cache = DecodedImageCache(self.resource_factory, max_bytes=10)
+
+    def test_get_image(self):
+        load = mock.Mock(return_value=bytearray(b"abc"))
+
+        image_1 = self.cache.get_image(("test", None), load)
+        image_2 = self.cache.get_image(("test", None), load)
+
+        self.assertEqual(image_1, b"abc")
+        self.assertEqual(image_2, b"abc")
+        self.assertIsNot(image_1, image_2)
+        load.assert_called_once_with()
+        statistics = self.cache.statistics()
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+        self.assertEqual(statistics.size, 3)
+
+    def test_get_image_copy_is_independent(self):
+        load = mock.Mock(return_value=bytearray(b"abc"))
+        image = self.cache.get_image(("test", None), load)
+
+        image[0] = ord("x")
+
+        self.assertEqual(self.cache.get_image(("test", None), load), b"abc")
+
+    def test_max_bytes(self):
+        self.cache.get_image(("a", None), lambda: bytearray(b"aaaaa"))
+        self.cache.get_image(("b", None), lambda: bytearray(b"bbbbb"))
+
+        self.cache.max_bytes = 5
+
+        self.assertEqual(self.cache.max_bytes, 5)
+        statistics = self.cache.statistics()
+        self.assertEqual(statistics.count, 1)
+        self.assertEqual(statistics.evictions, 1)
+
+    def test_get_reference_image_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "image.png")
+            with open(filename, "wb") as fp:
+                fp.write(b"data")
+            reference = ImageReference(
+                self.resource_factory, filename=filename
+            )
+
+            self.cache.get_reference_image(reference)
+            image = self.cache.get_reference_image(reference)
+
+        self.assertEqual(image, b"data")
+        self.assertEqual(self.cache.statistics().hits, 1)
+
+    def test_get_reference_image_data(self):
+        reference_1 = ImageReference(self.resource_factory, data=b"data")
+        reference_2 = ImageReference(self.resource_factory, data=b"data")
+
+        self.cache.get_reference_image(reference_1)
+        image = self.cache.get_reference_image(reference_2)
+
+        self.assertEqual(image, b"data")
+        self.assertEqual(self.cache.statistics().hits, 1)
+
+    def test_clear(self):
+        self.cache.get_image(("a", None), lambda: bytearray(b"aaaaa"))
+
+        self.cache.clear()
+
+        self.assertEqual(self.cache.statistics().count, 0)
+
+    def test_get_file_image_modified(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "image.png")
+            with open(filename, "wb") as fp:
+                fp.write(b"old")
+
+            self.cache.get_file_image(filename)
+            with open(filename, "wb") as fp:
+                fp.write(b"newer")
+            self.cache.get_file_image(filename)
+
+        self.assertEqual(self.cache.statistics().misses, 2)
+
+    def test_get_file_image_missing(self):
+        reference = ImageReference(self.resource_factory, filename="missing")
+
+        image = self.cache.get_reference_image(reference)
+
+        self.assertEqual(image, b"")
+        self.assertEqual(self.cache.statistics().count, 0)
+
+    def test_get_reference_image_persistent(self):
+        resource_factory = PixelResourceFactory()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            persistent_cache = PersistentImageCache(
+                os.path.join(tmpdir, "cache")
+            )
+            filename = os.path.join(tmpdir, "image.png")
+            with open(filename, "wb") as fp:
+                fp.write(b"rgba")
+            cache = DecodedImageCache(
+                resource_factory, persistent_cache=persistent_cache
+            )
+            reference = ImageReference(resource_factory, filename=filename)
+
+            image_1 = cache.get_reference_image(reference)
+
+            # a new session only has the persistent cache
+            cache = DecodedImageCache(
+                resource_factory, persistent_cache=persistent_cache
+            )
+            with mock.patch.object(
+                resource_factory, "image_from_file"
+            ) as image_from_file:
+                image_2 = cache.get_reference_image(reference)
+
+        self.assertEqual(image_1, b"rgba")
+        self.assertEqual(image_2, b"rgba")
+        image_from_file.assert_not_called()
+
+    def test_get_reference_image_persistent_data(self):
+        resource_factory = PixelResourceFactory()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            persistent_cache = PersistentImageCache(tmpdir)
+            cache = DecodedImageCache(
+                resource_factory, persistent_cache=persistent_cache
+            )
+            reference = ImageReference(resource_factory, data=b"rgba")
+
+            cache.get_reference_image(reference)
+
+            # images held in memory only aren't stored
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def test_load_persistent_no_cache(self):
+        load = mock.Mock(return_value=bytearray(b"rgba"))
+        read_data = mock.Mock(return_value=b"data")
+
+        image = self.cache.load_persistent(("test", None), load, read_data)
+
+        self.assertEqual(image, b"rgba")
+        read_data.assert_not_called()
@@ -0,0 +1,116 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import tempfile
+import time
+import unittest
+
+from ..persistent_image_cache import PersistentImageCache
+
+
+SOURCE = ("file", "/images/image.png", 1, 4)
+PIXELS = bytes(range(16))
+
+
+class TestPersistentImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = PersistentImageCache(self.tmpdir.name)
+
+    def test_store_and_find(self):
+        self.cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+
+        self.assertEqual(self.cache.find((SOURCE, None)), (2, 2, PIXELS))
+
+    def test_find_missing(self):
+        self.assertIsNone(self.cache.find((SOURCE, None)))
+
+    def test_find_size_in_key(self):
+        self.cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+
+        self.assertIsNone(self.cache.find((SOURCE, (16, 16))))
+        self.assertIsNone(self.cache.find_content((SOURCE, (16, 16)), b"data"))
+
+    def test_find_content(self):
+        other_source = ("file", "/other/image.png", 2, 4)
+        self.cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+
+        pixels = self.cache.find_content((other_source, None), b"data")
+
+        self.assertEqual(pixels, (2, 2, PIXELS))
+        # the new source is linked to the content
+        self.assertEqual(self.cache.find((other_source, None)), pixels)
+        self.assertEqual(len(self.cache._pixel_files()), 1)
+
+    def test_find_content_changed(self):
+        self.cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+
+        self.assertIsNone(self.cache.find_content((SOURCE, None), b"new"))
+
+    def test_store_bad_size(self):
+        with self.assertRaises(ValueError):
+            self.cache.store((SOURCE, None), b"data", 3, 2, PIXELS)
+
+    def test_corrupt_file(self):
+        self.cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+        path = self.cache._pixel_files()[0].path
+        with open(path, "r+b") as fp:
+            fp.seek(-1, os.SEEK_END)
+            fp.write(b"X")
+
+        self.assertIsNone(self.cache.find((SOURCE, None)))
+
+    def test_prune(self):
+        for i in range(5):
+            self.cache.store(
+                (("file", str(i)), None), str(i).encode(), 2, 2, PIXELS
+            )
+            # make the first images the least recently used
+            path = self.cache._pixels_path(
+                self.cache._content_name(((), None), str(i).encode())
+            )
+            os.utime(path, (time.time() + i, time.time() + i))
+
+        self.cache.prune(3 * (len(PIXELS) + 20))
+
+        self.assertEqual(len(self.cache._pixel_files()), 3)
+        self.assertIsNone(self.cache.find((("file", "0"), None)))
+        self.assertIsNotNone(self.cache.find((("file", "4"), None)))
+
+    def test_store_prunes(self):
+        self.cache.max_bytes = 3 * (len(PIXELS) + 20)
+
+        for i in range(5):
+            self.cache.store(
+                (("file", str(i)), None), str(i).encode(), 2, 2, PIXELS
+            )
+
+        self.assertEqual(len(self.cache._pixel_files()), 3)
+
+    def test_clear(self):
+        self.cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.find((SOURCE, None)))
+        self.assertEqual(self.cache._pixel_files(), [])
+
+    def test_unwritable(self):
+        path = os.path.join(self.tmpdir.name, "file")
+        with open(path, "w") as fp:
+            fp.write("not a directory")
+        cache = PersistentImageCache(path)
+
+        cache.store((SOURCE, None), b"data", 2, 2, PIXELS)
+
+        self.assertIsNone(cache.find((SOURCE, None)))
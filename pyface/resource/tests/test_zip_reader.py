@@ -0,0 +1,206 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import tempfile
+import time
+import unittest
+from zipfile import BadZipFile, ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+from ..zip_reader import (
+    ZipReader, clear_zip_readers, close_zip_reader, get_zip_reader,
+)
+
+
+def write_zip(path, members):
+    with ZipFile(path, "w") as zip_file:
+        for name, data in members.items():
+            zip_file.writestr(name, data)
+
+
+class TestZipReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "test.zip")
+        write_zip(self.path, {"a.png": b"a", "images/b.png": b"b"})
+
+    def test_names(self):
+        reader = ZipReader(self.path)
+        self.addCleanup(reader.close)
+
+        self.assertEqual(reader.names, {"a.png", "images/b.png"})
+        self.assertEqual(reader.namelist(), ["a.png", "images/b.png"])
+        self.assertIn("a.png", reader)
+        self.assertNotIn("b.png", reader)
+
+    def test_read(self):
+        reader = ZipReader(self.path)
+        self.addCleanup(reader.close)
+
+        self.assertEqual(reader.read("images/b.png"), b"b")
+        self.assertEqual(reader.get("a.png"), b"a")
+        self.assertIsNone(reader.get("missing.png"))
+        with self.assertRaises(KeyError):
+            reader.read("missing.png")
+
+    def test_close_and_reopen(self):
+        reader = ZipReader(self.path)
+        self.addCleanup(reader.close)
+
+        reader.close()
+
+        self.assertFalse(reader.is_open)
+        self.assertEqual(reader.read("a.png"), b"a")
+        self.assertTrue(reader.is_open)
+
+
+class TestZipReaderPool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(clear_zip_readers)
+        self.path = os.path.join(self.tmpdir.name, "test.zip")
+        write_zip(self.path, {"a.png": b"a"})
+
+    def test_shared(self):
+        reader = get_zip_reader(self.path)
+
+        self.assertIsInstance(reader, ZipReader)
+        self.assertIs(get_zip_reader(self.path), reader)
+
+    def test_not_zip_file(self):
+        path = os.path.join(self.tmpdir.name, "test.txt")
+        with open(path, "wb") as fp:
+            fp.write(b"not a zip file")
+
+        self.assertIsNone(get_zip_reader(path))
+        self.assertIsNone(get_zip_reader(self.tmpdir.name))
+        self.assertIsNone(get_zip_reader(path + ".missing"))
+
+    def test_file_changed(self):
+        reader = get_zip_reader(self.path)
+
+        write_zip(self.path, {"a.png": b"a", "c.png": b"c"})
+        new_reader = get_zip_reader(self.path)
+
+        self.assertIsNot(new_reader, reader)
+        self.assertFalse(reader.is_open)
+        self.assertIn("c.png", new_reader)
+
+    def test_close_zip_reader(self):
+        reader = get_zip_reader(self.path)
+
+        close_zip_reader(self.path)
+
+        self.assertFalse(reader.is_open)
+        self.assertIsNot(get_zip_reader(self.path), reader)
+
+
+class TestZipReaderConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "test.zip")
+        self.members = {
+            "member_%d.bin" % i: os.urandom(1000) * (i + 1) for i in range(20)
+        }
+        with ZipFile(self.path, "w", ZIP_DEFLATED) as zip_file:
+            for name, data in self.members.items():
+                zip_file.writestr(name, data)
+            zip_file.writestr("stored.bin", b"stored", ZIP_STORED)
+
+    def test_read_stored(self):
+        reader = ZipReader(self.path)
+        self.addCleanup(reader.close)
+
+        self.assertEqual(reader.read("stored.bin"), b"stored")
+
+    def test_concurrent_reads(self):
+        reader = ZipReader(self.path)
+        self.addCleanup(reader.close)
+        names = list(self.members) * 5
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(reader.read, names))
+
+        self.assertEqual(results, [self.members[name] for name in names])
+
+    def test_idle_timeout(self):
+        reader = ZipReader(self.path, idle_timeout=0.05)
+        self.addCleanup(reader.close)
+
+        reader.read("stored.bin")
+
+        for i in range(100):
+            if not reader.is_open:
+                break
+            time.sleep(0.02)
+
+        self.assertFalse(reader.is_open)
+        self.assertIsNone(reader._timer)
+
+    def test_idle_timeout_membership_only(self):
+        reader = ZipReader(self.path, idle_timeout=0.05)
+        self.addCleanup(reader.close)
+
+        self.assertIn("stored.bin", reader)
+
+        for i in range(100):
+            if not reader.is_open:
+                break
+            time.sleep(0.02)
+
+        self.assertFalse(reader.is_open)
+        self.assertIsNone(reader._timer)
+
+    def test_no_idle_timeout(self):
+        reader = ZipReader(self.path, idle_timeout=None)
+        self.addCleanup(reader.close)
+
+        reader.read("stored.bin")
+
+        self.assertIsNone(reader._timer)
+        self.assertTrue(reader.is_open)
+
+    def test_reopen_changed_file(self):
+        reader = ZipReader(self.path)
+        self.addCleanup(reader.close)
+
+        reader.close()
+        write_zip(self.path, {"new.png": b"new"})
+
+        self.assertEqual(reader.read("new.png"), b"new")
+        self.assertEqual(reader.names, {"new.png"})
+
+    def test_corrupt_member(self):
+        with open(self.path, "rb") as fp:
+            data = bytearray(fp.read())
+        reader = ZipReader(self.path, idle_timeout=None)
+        self.addCleanup(reader.close)
+        info = reader._infos["stored.bin"]
+        offset = data.index(
+            b"stored", info.header_offset + 30 + len(info.filename)
+        )
+        reader.close()
+        data[offset] = ord("S")
+        with open(self.path, "r+b") as fp:
+            fp.write(data)
+        # keep the same signature so that the directory isn't re-read
+        stat = os.stat(self.path)
+        self.assertEqual(stat.st_size, reader._signature[1])
+        os.utime(self.path, ns=(stat.st_atime_ns, reader._signature[0]))
+
+        with self.assertRaises(BadZipFile):
+            reader.read("stored.bin")
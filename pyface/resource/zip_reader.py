@@ -0,0 +1,417 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Shared, pooled readers for zip files.
+
+Opening a zip file means reading and parsing its central directory, which is
+expensive when it is done for every image that is looked up.  The readers in
+this module parse the directory of each archive once, and keep a set of its
+member names so that membership can be checked without raising and catching
+exceptions.
+
+Members are read with positional reads (``os.pread``) on a shared file
+descriptor, or with a file handle per thread on platforms without
+``os.pread``, so any number of threads can read from the same archive
+concurrently without holding a lock while reading or decompressing.
+
+The file handle is closed after the reader has been idle for a while, and is
+transparently reopened when it is next needed.  The directory is only parsed
+again if the file has changed in the meantime.
+
+Readers are pooled by absolute path, and a pooled reader is replaced when the
+modification time or size of the file changes.
+"""
+
+import os
+import stat
+import struct
+import threading
+import time
+import zlib
+from zipfile import BadZipFile, ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+
+#: The default number of seconds a reader can be idle before its file handle
+#: is closed.
+DEFAULT_IDLE_TIMEOUT = 2.0
+
+# The size and layout of the local file header of a zip file member.
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+_LOCAL_HEADER_LENGTHS = struct.Struct("<HH")
+
+# The flag bit indicating that a member is encrypted.
+_ENCRYPTED_FLAG = 0x1
+
+
+class ZipReader:
+    """ A thread-safe reader for a zip file with an index of member names.
+
+    Parameters
+    ----------
+    path : str
+        The path of the zip file.
+    idle_timeout : float or None
+        The number of seconds the reader can be idle before its file handle
+        is closed, or None if it should be kept open until closed
+        explicitly.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be opened.
+    zipfile.BadZipFile
+        If the file is not a zip file.
+    """
+
+    def __init__(self, path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.path = path
+        self.idle_timeout = idle_timeout
+
+        # The lock protects opening and closing the file handles; it is not
+        # held while members are being read.
+        self._lock = threading.Lock()
+        self._fd = None
+        self._local = threading.local()
+        self._handles = []
+        self._zip_file = None
+        self._readers = 0
+        self._close_requested = False
+        self._last_used = 0.0
+        self._timer = None
+
+        self._signature = None
+        self._infos = {}
+        self._namelist = []
+        self._names = frozenset()
+        with self._lock:
+            self._open()
+            # Readers that are only used for membership checks never read,
+            # so the idle timer must be started when the file is opened.
+            self._touch()
+
+    @property
+    def names(self):
+        """ The set of names of the members of the zip file. """
+        return self._names
+
+    @property
+    def zip_file(self):
+        """ An open ZipFile object for the file, opening it if needed. """
+        with self._lock:
+            self._open()
+            if self._zip_file is None:
+                self._zip_file = ZipFile(self.path, "r")
+            return self._zip_file
+
+    @property
+    def is_open(self):
+        """ Whether the underlying file handle is currently open. """
+        return self._fd is not None
+
+    def namelist(self):
+        """ Return the names of the members of the zip file, in order.
+
+        Returns
+        -------
+        names : list of str
+            The member names in the order they appear in the zip file.
+        """
+        with self._lock:
+            self._open()
+            self._touch()
+            return list(self._namelist)
+
+    def read(self, name):
+        """ Return the contents of a member of the zip file.
+
+        Parameters
+        ----------
+        name : str
+            The name of the member.
+
+        Returns
+        -------
+        data : bytes
+            The uncompressed contents of the member.
+
+        Raises
+        ------
+        KeyError
+            If there is no member with the given name.
+        zipfile.BadZipFile
+            If the member is corrupt.
+        """
+        with self._lock:
+            self._open()
+            info = self._infos.get(name)
+            if info is None:
+                raise KeyError(
+                    "There is no item named %r in the archive" % name
+                )
+            self._readers += 1
+
+        try:
+            if (info.flag_bits & _ENCRYPTED_FLAG) or (
+                info.compress_type not in {ZIP_STORED, ZIP_DEFLATED}
+            ):
+                # Let the zipfile module deal with anything unusual.
+                return self.zip_file.read(name)
+            return self._read_member(info)
+        finally:
+            with self._lock:
+                self._readers -= 1
+                if self._close_requested:
+                    self._close()
+                else:
+                    self._touch()
+
+    def get(self, name):
+        """ Return the contents of a member, or None if it doesn't exist.
+
+        Parameters
+        ----------
+        name : str
+            The name of the member.
+
+        Returns
+        -------
+        data : bytes or None
+            The uncompressed contents of the member, or None if there is no
+            member with the given name.
+        """
+        if name not in self._names:
+            return None
+        return self.read(name)
+
+    def close(self):
+        """ Close the underlying file handles.
+
+        The reader remains usable: the file is reopened when it is next
+        accessed, and its directory is parsed again if it has changed.
+        Handles that are being used by other threads are closed when they
+        are no longer in use.
+        """
+        with self._lock:
+            self._close()
+
+    # ------------------------------------------------------------------------
+    # 'object' interface.
+    # ------------------------------------------------------------------------
+
+    def __contains__(self, name):
+        return name in self._names
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _open(self):
+        """ Open the file, parsing its directory if it has changed.
+
+        This must be called with the lock held.
+        """
+        if self._fd is not None:
+            return
+
+        fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            st = os.fstat(fd)
+            signature = (st.st_mtime_ns, st.st_size)
+            if signature != self._signature:
+                with open(fd, "rb", closefd=False) as fp:
+                    with ZipFile(fp, "r") as zip_file:
+                        infos = zip_file.infolist()
+                self._infos = {info.filename: info for info in infos}
+                self._namelist = [info.filename for info in infos]
+                self._names = frozenset(self._namelist)
+                self._signature = signature
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def _close(self):
+        """ Close the file handles if they are not in use.
+
+        This must be called with the lock held.
+        """
+        if self._readers > 0:
+            # A reader is still using the handles, so close them once it
+            # has finished.
+            self._close_requested = True
+            return
+
+        self._close_requested = False
+
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+        for handle in self._handles:
+            handle.close()
+        self._handles = []
+        self._local = threading.local()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _touch(self):
+        """ Record that the reader was used, starting the idle timer.
+
+        This must be called with the lock held.
+        """
+        self._last_used = time.monotonic()
+        if self._timer is None and self.idle_timeout is not None:
+            self._start_timer(self.idle_timeout)
+
+    def _start_timer(self, delay):
+        """ Start a timer to check whether the reader has become idle. """
+        timer = threading.Timer(delay, self._check_idle)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _check_idle(self):
+        """ Close the file handles if the reader has been idle long enough.
+
+        Otherwise wait until the reader could next have been idle for long
+        enough.  Nothing is scheduled once the handles are closed.
+        """
+        with self._lock:
+            self._timer = None
+            if self._fd is None:
+                return
+            remaining = (
+                self._last_used + self.idle_timeout - time.monotonic()
+            )
+            if remaining > 0 or self._readers > 0:
+                self._start_timer(max(remaining, 0.1))
+            else:
+                self._close()
+
+    def _read_member(self, info):
+        """ Read and decompress a stored or deflated member. """
+        header = self._read_at(info.header_offset, _LOCAL_HEADER_SIZE)
+        if (
+            len(header) != _LOCAL_HEADER_SIZE
+            or header[:4] != _LOCAL_HEADER_SIGNATURE
+        ):
+            raise BadZipFile("Bad magic number for file header")
+
+        name_length, extra_length = _LOCAL_HEADER_LENGTHS.unpack(header[26:])
+        offset = (
+            info.header_offset + _LOCAL_HEADER_SIZE + name_length
+            + extra_length
+        )
+        data = self._read_at(offset, info.compress_size)
+        if info.compress_type == ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS)
+
+        if (zlib.crc32(data) & 0xFFFFFFFF) != info.CRC:
+            raise BadZipFile("Bad CRC-32 for file %r" % info.filename)
+
+        return data
+
+    def _read_at(self, offset, size):
+        """ Read bytes from an offset in the file without moving a shared
+        file position.
+        """
+        if hasattr(os, "pread"):
+            chunks = []
+            while size > 0:
+                chunk = os.pread(self._fd, size, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+                size -= len(chunk)
+            return b"".join(chunks)
+
+        # Without positional reads, each thread uses its own file handle.
+        handle = getattr(self._local, "handle", None)
+        if handle is None:
+            handle = open(self.path, "rb")
+            with self._lock:
+                self._handles.append(handle)
+            self._local.handle = handle
+        handle.seek(offset)
+        return handle.read(size)
+
+
+#: Pooled readers, keyed by absolute path, with the file signature they were
+#: created for.  A reader of None records that the file is not a zip file.
+_readers = {}
+
+#: The lock protecting the pool.
+_readers_lock = threading.Lock()
+
+
+def get_zip_reader(path):
+    """ Return the shared reader for a zip file.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The path of the zip file.
+
+    Returns
+    -------
+    reader : ZipReader or None
+        The pooled reader for the file, or None if the path is not a
+        readable zip file.
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        close_zip_reader(path)
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    signature = (st.st_mtime_ns, st.st_size)
+    with _readers_lock:
+        entry = _readers.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        if entry is not None and entry[1] is not None:
+            entry[1].close()
+        try:
+            reader = ZipReader(path)
+        except (OSError, BadZipFile):
+            reader = None
+        _readers[path] = (signature, reader)
+        return reader
+
+
+def close_zip_reader(path):
+    """ Close and discard the shared reader for a zip file, if any.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The path of the zip file.
+    """
+    path = os.path.abspath(path)
+    with _readers_lock:
+        entry = _readers.pop(path, None)
+    if entry is not None and entry[1] is not None:
+        entry[1].close()
+
+
+def clear_zip_readers():
+    """ Close and discard all of the shared zip file readers. """
+    with _readers_lock:
+        entries = list(_readers.values())
+        _readers.clear()
+    for signature, reader in entries:
+        if reader is not None:
+            reader.close()
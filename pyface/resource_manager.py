@@ -11,7 +11,7 @@
 """ The implementation of a shared resource manager. """
 
 
-from pyface.resource.api import ResourceManager
+from pyface.resource.api import DecodedImageCache, ResourceManager
 
 # Import the toolkit specific version.
 from .toolkit import toolkit_object
@@ -23,3 +23,6 @@ PyfaceResourceFactory = toolkit_object(
 
 #: A shared instance.
 resource_manager = ResourceManager(resource_factory=PyfaceResourceFactory())
+
+#: The shared cache of decoded toolkit images.
+decoded_image_cache = DecodedImageCache(resource_manager.resource_factory)
@@ -57,21 +57,25 @@ Enaml-specific Tasks functionality
 
 """
 
-from .i_dock_pane import IDockPane
-from .i_editor import IEditor
-from .i_editor_area_pane import IEditorAreaPane
-from .i_task_pane import ITaskPane
-from .task import Task
-from .tasks_application import TasksApplication, TaskFactory
-from .task_layout import (
-    TaskLayout,
-    PaneItem,
-    Tabbed,
-    Splitter,
-    HSplitter,
-    VSplitter,
-)
-from .task_window_layout import TaskWindowLayout
+# Imports which don't select the toolkit as a side-effect.  These are also
+# deferred until first use, so that importing the api module is cheap.
+
+_lazy_imports = {
+    'HSplitter': "task_layout",
+    'IDockPane': "i_dock_pane",
+    'IEditor': "i_editor",
+    'IEditorAreaPane': "i_editor_area_pane",
+    'ITaskPane': "i_task_pane",
+    'PaneItem': "task_layout",
+    'Splitter': "task_layout",
+    'Tabbed': "task_layout",
+    'Task': "task",
+    'TaskFactory': "tasks_application",
+    'TaskLayout': "task_layout",
+    'TasksApplication': "tasks_application",
+    'TaskWindowLayout': "task_window_layout",
+    'VSplitter': "task_layout",
+}
 
 
 # ----------------------------------------------------------------------------
@@ -102,8 +106,16 @@ _relative_imports = {
 }
 
 
+# Each name is looked up in the first table which has it, so a name in more
+# than one table would silently resolve to the wrong object.
+_import_tables = [_lazy_imports, _relative_imports, _toolkit_imports]
+assert sum(len(table) for table in _import_tables) == len(
+    set().union(*_import_tables)
+), "a name is in more than one of the deferred import tables"
+
+
 def __getattr__(name):
-    """Lazily load attributes with side-effects
+    """Lazily load attributes
 
     In particular, lazily load toolkit backend names.  For efficiency, lazily
     loaded objects are injected into the module namespace
@@ -112,9 +124,9 @@ def __getattr__(name):
     not_found = object()
     result = not_found
 
-    if name in _relative_imports:
+    source = _lazy_imports.get(name) or _relative_imports.get(name)
+    if source is not None:
         from importlib import import_module
-        source = _relative_imports[name]
         module = import_module(f"pyface.tasks.{source}")
         result = getattr(module, name)
 
@@ -135,8 +147,14 @@ def __getattr__(name):
 # ----------------------------------------------------------------------------
 
 # the list of available names we report for introspection purposes
-_extra_names = set(_toolkit_imports) | set(_relative_imports)
+_extra_names = (
+    set(_lazy_imports) | set(_toolkit_imports) | set(_relative_imports)
+)
 
 
 def __dir__():
     return sorted(set(globals()) | _extra_names)
+
+
+# names exported by "import *", which doesn't select the toolkit
+__all__ = sorted(_lazy_imports)
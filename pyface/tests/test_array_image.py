@@ -14,7 +14,7 @@ import unittest
 from traits.testing.optional_dependencies import numpy as np, requires_numpy
 
 if np is not None:
-    from ..array_image import ArrayImage
+    from ..array_image import ArrayImage, StreamingArrayImage
 
 
 @requires_numpy
@@ -51,3 +51,113 @@ class TestArrayImage(unittest.TestCase):
         icon = image.create_icon()
 
         self.assertIsNotNone(icon)
+
+    def test_create_image_in_place_change(self):
+        from pyface.resource_manager import decoded_image_cache
+        from pyface.util.image_helpers import image_to_array
+
+        decoded_image_cache.reset_statistics()
+        image = ArrayImage(self.data)
+        image.create_image()
+
+        image.data[...] = 0x11
+        array = image_to_array(image.create_image())
+
+        self.assertTrue(np.all(array == 0x11))
+        # array images are not held in the shared cache
+        statistics = decoded_image_cache.statistics()
+        self.assertEqual(statistics.misses, 0)
+        self.assertEqual(statistics.hits, 0)
+
+
+@requires_numpy
+class TestStreamingArrayImage(unittest.TestCase):
+    def setUp(self):
+        self.data = np.full((32, 64, 4), 0xee, dtype='uint8')
+
+    def test_init_copies(self):
+        image = StreamingArrayImage(self.data)
+
+        self.assertIsNot(image.data, self.data)
+        np.testing.assert_array_equal(image.data, self.data)
+
+    def test_update(self):
+        image = StreamingArrayImage(self.data)
+        buffer = image.data
+        events = []
+        image.observe(events.append, "updated")
+
+        image.update(np.full((32, 64, 4), 0x11, dtype='uint8'))
+
+        self.assertIs(image.data, buffer)
+        self.assertTrue(np.all(image.data == 0x11))
+        self.assertEqual([event.new for event in events], [(0, 0, 64, 32)])
+
+    def test_update_region(self):
+        image = StreamingArrayImage(self.data)
+        events = []
+        image.observe(events.append, "updated")
+
+        image.update(np.full((4, 8, 4), 0x11, dtype='uint8'), (2, 3, 8, 4))
+
+        self.assertTrue(np.all(image.data[3:7, 2:10] == 0x11))
+        self.assertEqual(np.count_nonzero(image.data == 0x11), 4 * 8 * 4)
+        self.assertEqual([event.new for event in events], [(2, 3, 8, 4)])
+
+    def test_update_region_from_frame(self):
+        image = StreamingArrayImage(self.data)
+        frame = np.full((32, 64, 4), 0x11, dtype='uint8')
+
+        image.update(frame, (2, 3, 8, 4))
+
+        self.assertTrue(np.all(image.data[3:7, 2:10] == 0x11))
+        self.assertEqual(np.count_nonzero(image.data == 0x11), 4 * 8 * 4)
+
+    def test_update_rgb(self):
+        image = StreamingArrayImage(self.data)
+
+        image.update(np.full((32, 64, 3), 0x11, dtype='uint8'))
+
+        self.assertTrue(np.all(image.data[..., :3] == 0x11))
+        self.assertTrue(np.all(image.data[..., 3] == 0xff))
+
+    def test_update_new_size(self):
+        image = StreamingArrayImage(self.data)
+        events = []
+        image.observe(events.append, "updated")
+
+        image.update(np.full((16, 8, 3), 0x11, dtype='uint8'))
+
+        self.assertEqual(image.data.shape, (16, 8, 3))
+        self.assertEqual([event.new for event in events], [(0, 0, 8, 16)])
+
+    def test_update_bad_region(self):
+        image = StreamingArrayImage(self.data)
+
+        with self.assertRaises(ValueError):
+            image.update(
+                np.full((4, 8, 4), 0x11, dtype='uint8'), (60, 0, 8, 4)
+            )
+        with self.assertRaises(ValueError):
+            image.update(
+                np.full((4, 4, 4), 0x11, dtype='uint8'), (0, 0, 8, 4)
+            )
+
+    def test_create_image_updated(self):
+        from pyface.util.image_helpers import image_to_array
+
+        image = StreamingArrayImage(self.data)
+        toolkit_image = image.create_image()
+
+        image.update(np.full((4, 8, 4), 0x11, dtype='uint8'), (2, 3, 8, 4))
+        toolkit_image = image.create_image()
+
+        array = image_to_array(toolkit_image)
+        np.testing.assert_array_equal(array, image.data)
+
+    def test_create_image_sized(self):
+        image = StreamingArrayImage(self.data)
+
+        toolkit_image = image.create_image((16, 8))
+
+        self.assertIsNotNone(toolkit_image)
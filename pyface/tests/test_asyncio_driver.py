@@ -0,0 +1,163 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import asyncio
+import socket
+import threading
+import unittest
+
+from ..asyncio_driver import AsyncioDriver
+from ..gui import GUI
+from ..toolkit import toolkit_object
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestAsyncioDriver(GuiTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.driver = AsyncioDriver()
+        self.addCleanup(self.driver.close)
+
+    def test_run_coroutine(self):
+        results = []
+
+        async def coroutine():
+            await asyncio.sleep(0.01)
+            results.append(threading.current_thread())
+
+        self.driver.start()
+        task = self.driver.create_task(coroutine())
+
+        with self.event_loop_until_condition(task.done):
+            pass
+        self.assertEqual(results, [threading.main_thread()])
+
+    def test_chained_awaits(self):
+        async def count(n):
+            for i in range(n):
+                await asyncio.sleep(0)
+            return n
+
+        self.driver.start()
+        task = self.driver.create_task(count(1000))
+
+        # ready callbacks don't wait for the polling interval
+        with self.event_loop_until_condition(task.done, timeout=5.0):
+            pass
+        self.assertEqual(task.result(), 1000)
+
+    def test_invoke_later_interop(self):
+        results = []
+
+        async def coroutine():
+            future = self.driver.loop.create_future()
+            GUI.invoke_later(future.set_result, "from the GUI")
+            results.append(await future)
+
+        self.driver.start()
+        task = self.driver.create_task(coroutine())
+
+        with self.event_loop_until_condition(task.done):
+            pass
+        self.assertEqual(results, ["from the GUI"])
+
+    def test_submit_interop(self):
+        async def coroutine():
+            future = GUI.submit(pow, 2, 5)
+            return await asyncio.wrap_future(future)
+
+        self.driver.start()
+        task = self.driver.create_task(coroutine())
+
+        with self.event_loop_until_condition(task.done):
+            pass
+        self.assertEqual(task.result(), 32)
+
+    def test_socket_read(self):
+        reader_socket, writer_socket = socket.socketpair()
+        self.addCleanup(reader_socket.close)
+        self.addCleanup(writer_socket.close)
+        reader_socket.setblocking(False)
+
+        async def read():
+            return await self.driver.loop.sock_recv(reader_socket, 100)
+
+        self.driver.start()
+        task = self.driver.create_task(read())
+        GUI.invoke_after(20, writer_socket.sendall, b"data")
+
+        with self.event_loop_until_condition(task.done):
+            pass
+        self.assertEqual(task.result(), b"data")
+
+    def test_stop(self):
+        results = []
+
+        async def coroutine():
+            results.append("ran")
+
+        self.driver.start()
+        self.driver.stop()
+        self.driver.create_task(coroutine())
+        self.event_loop_helper.event_loop(repeat=5)
+
+        self.assertFalse(self.driver.is_running())
+        self.assertEqual(results, [])
+
+        self.driver.start()
+        with self.event_loop_until_condition(lambda: results == ["ran"]):
+            pass
+
+    def test_close_cancels_tasks(self):
+        async def wait_forever():
+            await asyncio.Event().wait()
+
+        self.driver.start()
+        task = self.driver.create_task(wait_forever())
+        self.event_loop_helper.event_loop(repeat=5)
+
+        self.driver.close()
+
+        self.assertTrue(task.cancelled())
+        self.assertTrue(self.driver.loop.is_closed())
+
+    def test_close_restores_call_soon(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        driver = AsyncioDriver(loop=loop)
+        self.assertIn("call_soon", vars(loop))
+        self.assertIn("call_soon_threadsafe", vars(loop))
+
+        driver.close()
+
+        self.assertNotIn("call_soon", vars(loop))
+        self.assertNotIn("call_soon_threadsafe", vars(loop))
+        self.assertFalse(loop.is_closed())
+
+    def test_worker_thread_wakes_driver(self):
+        # a long polling interval, which results from worker threads
+        # shouldn't have to wait for
+        driver = AsyncioDriver(interval=10000)
+        self.addCleanup(driver.close)
+
+        async def coroutine():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, pow, 2, 5)
+
+        driver.start()
+        task = driver.create_task(coroutine())
+
+        with self.event_loop_until_condition(task.done, timeout=2.0):
+            pass
+        self.assertEqual(task.result(), 32)
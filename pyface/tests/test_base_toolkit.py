@@ -7,11 +7,24 @@
 # is also available online at http://www.enthought.com/licenses/BSD.txt
 #
 # Thanks for using Enthought open source!
+import importlib
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 from traits.etsconfig.api import ETSConfig
 
-from pyface.base_toolkit import find_toolkit, import_toolkit
+from pyface.base_toolkit import (
+    ENTRY_POINTS_CACHE_ENV,
+    Toolkit,
+    clear_entry_points_cache,
+    find_entry_points,
+    find_toolkit,
+    import_toolkit,
+    importlib_metadata,
+)
 
 
 class TestToolkit(unittest.TestCase):
@@ -62,3 +75,164 @@ class TestToolkit(unittest.TestCase):
             self.assertEqual(ETSConfig.toolkit, "null")
         finally:
             ETSConfig._toolkit = old_etsconfig_toolkit
+
+
+class TestToolkitObject(unittest.TestCase):
+    def setUp(self):
+        self.toolkit_object = Toolkit(
+            "pyface", "test", "pyface.tests.test_new_toolkit"
+        )
+
+    def test_object_cached(self):
+        from pyface.tests.test_new_toolkit.widget import Widget
+
+        with mock.patch(
+            "importlib.import_module", side_effect=importlib.import_module
+        ) as import_module:
+            self.assertIs(self.toolkit_object("widget:Widget"), Widget)
+            self.assertIs(self.toolkit_object("widget:Widget"), Widget)
+
+        self.assertEqual(import_module.call_count, 1)
+
+    def test_unimplemented_cached(self):
+        with mock.patch(
+            "importlib.import_module", side_effect=importlib.import_module
+        ) as import_module:
+            Unimplemented = self.toolkit_object("nosuchmodule:Widget")
+            self.assertIs(
+                self.toolkit_object("nosuchmodule:Widget"), Unimplemented
+            )
+            # the missing module is only imported once
+            self.toolkit_object("nosuchmodule:Other")
+
+        self.assertEqual(import_module.call_count, 1)
+        with self.assertRaises(NotImplementedError):
+            Unimplemented()
+
+    def test_resolve(self):
+        from pyface.tests.test_new_toolkit.widget import Widget
+
+        objects = self.toolkit_object.resolve(
+            ["widget:Widget", "nosuchmodule:Widget"]
+        )
+
+        self.assertEqual(set(objects), {"widget:Widget", "nosuchmodule:Widget"})
+        self.assertIs(objects["widget:Widget"], Widget)
+        self.assertIs(
+            self.toolkit_object("nosuchmodule:Widget"),
+            objects["nosuchmodule:Widget"],
+        )
+
+    def test_packages_changed(self):
+        from pyface.tests.test_new_toolkit.widget import Widget
+
+        self.toolkit_object.packages = ["pyface.tests"]
+        self.assertIsNot(self.toolkit_object("widget:Widget"), Widget)
+
+        self.toolkit_object.packages.append("pyface.tests.test_new_toolkit")
+
+        self.assertIs(self.toolkit_object("widget:Widget"), Widget)
+
+
+class TestEntryPointsCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache_path = os.path.join(self.tmpdir.name, "entry_points.json")
+        clear_entry_points_cache()
+        self.addCleanup(clear_entry_points_cache)
+
+    def test_find_entry_points(self):
+        entry_points = find_entry_points("pyface.toolkits")
+
+        names = {plugin.name for plugin in entry_points}
+        self.assertTrue({"qt", "wx", "null"} <= names)
+
+    def test_find_entry_points_cached(self):
+        entry_points = find_entry_points("pyface.toolkits")
+
+        with mock.patch(
+            "pyface.base_toolkit.importlib_metadata.entry_points"
+        ) as scan:
+            self.assertIs(find_entry_points("pyface.toolkits"), entry_points)
+
+        scan.assert_not_called()
+
+    def test_find_entry_points_single_scan(self):
+        with mock.patch(
+            "pyface.base_toolkit.importlib_metadata.entry_points",
+            wraps=importlib_metadata.entry_points,
+        ) as scan:
+            find_entry_points("pyface.toolkits")
+            find_entry_points("pyface.no_such_group")
+            find_toolkit()
+
+        scan.assert_called_once_with()
+
+    def test_clear_entry_points_cache(self):
+        find_entry_points("pyface.toolkits")
+        clear_entry_points_cache()
+
+        with mock.patch(
+            "pyface.base_toolkit.importlib_metadata.entry_points",
+            wraps=importlib_metadata.entry_points,
+        ) as scan:
+            find_entry_points("pyface.toolkits")
+
+        scan.assert_called_once_with()
+
+    def test_sys_path_change(self):
+        find_entry_points("pyface.toolkits")
+
+        with mock.patch("sys.path", [self.tmpdir.name]):
+            self.assertEqual(find_entry_points("pyface.toolkits"), ())
+
+    def test_persisted_cache(self):
+        with mock.patch.dict(
+            os.environ, {ENTRY_POINTS_CACHE_ENV: self.cache_path}
+        ):
+            entry_points = find_entry_points("pyface.toolkits")
+            self.assertTrue(os.path.exists(self.cache_path))
+
+            # simulate a new process
+            with mock.patch(
+                "pyface.base_toolkit._entry_points_cache", None
+            ), mock.patch(
+                "pyface.base_toolkit.importlib_metadata.entry_points"
+            ) as scan:
+                cached_entry_points = find_entry_points("pyface.toolkits")
+                toolkit = import_toolkit("null")
+
+        scan.assert_not_called()
+        self.assertEqual(
+            [(plugin.name, plugin.value) for plugin in cached_entry_points],
+            [(plugin.name, plugin.value) for plugin in entry_points],
+        )
+        self.assertEqual(toolkit.toolkit, "null")
+
+    def test_persisted_cache_invalid(self):
+        with open(self.cache_path, "w", encoding="utf-8") as fp:
+            json.dump(
+                {"version": 2, "key": "stale", "groups": {
+                    "pyface.toolkits": [["stale", "stale:toolkit"]],
+                }},
+                fp,
+            )
+
+        with mock.patch.dict(
+            os.environ, {ENTRY_POINTS_CACHE_ENV: self.cache_path}
+        ):
+            entry_points = find_entry_points("pyface.toolkits")
+
+        names = {plugin.name for plugin in entry_points}
+        self.assertNotIn("stale", names)
+        self.assertIn("null", names)
+
+    def test_clear_removes_persisted_cache(self):
+        with mock.patch.dict(
+            os.environ, {ENTRY_POINTS_CACHE_ENV: self.cache_path}
+        ):
+            find_entry_points("pyface.toolkits")
+            clear_entry_points_cache()
+
+        self.assertFalse(os.path.exists(self.cache_path))
@@ -0,0 +1,99 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import threading
+import unittest
+from unittest import mock
+
+from traits.api import Float, HasTraits, List
+
+from ..gui import GUI
+from ..toolkit import toolkit_object
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+class Progress(HasTraits):
+
+    value = Float()
+
+    values = List(Float)
+
+    def _value_changed(self, new):
+        self.values.append(new)
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestCoalescedCalls(GuiTestAssistant, unittest.TestCase):
+
+    def test_invoke_later_coalesced(self):
+        results = []
+
+        GUI.invoke_later_coalesced("a", results.append, "a1")
+        GUI.invoke_later(results.append, "b")
+        GUI.invoke_later_coalesced("a", results.append, "a2")
+        GUI.invoke_later_coalesced("c", results.append, "c")
+
+        with self.event_loop_until_condition(lambda: len(results) == 3):
+            pass
+        # the latest call runs in the position of the first
+        self.assertEqual(results, ["a2", "b", "c"])
+
+        GUI.invoke_later_coalesced("a", results.append, "a3")
+        with self.event_loop_until_condition(lambda: len(results) == 4):
+            pass
+        self.assertEqual(results[-1], "a3")
+
+    def test_set_trait_latest(self):
+        progress = Progress()
+
+        def produce():
+            for i in range(1000):
+                GUI.set_trait_latest(progress, "value", float(i))
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+
+        with self.event_loop_until_condition(lambda: progress.value == 999):
+            pass
+        self.assertEqual(progress.values, [999.0])
+
+    def test_set_trait_latest_different_objects(self):
+        progress_1 = Progress()
+        progress_2 = Progress()
+
+        GUI.set_trait_latest(progress_1, "value", 1.0)
+        GUI.set_trait_latest(progress_2, "value", 2.0)
+
+        with self.event_loop_until_condition(
+            lambda: progress_1.value == 1.0 and progress_2.value == 2.0
+        ):
+            pass
+
+
+class TestIterProcessingEvents(unittest.TestCase):
+
+    def test_process_events_periodically(self):
+        clock = mock.Mock()
+        clock.perf_counter.side_effect = [0.0, 0.01, 0.06, 0.07, 0.08, 0.2, 0.21]
+
+        with mock.patch("pyface.i_gui.time", clock), \
+                mock.patch.object(GUI, "process_events") as process_events:
+            items = []
+            for item in GUI.iter_processing_events(
+                "abcd", every_ms=50, max_time_ms=5, allow_user_events=False
+            ):
+                items.append((item, process_events.call_count))
+
+        self.assertEqual(items, [("a", 0), ("b", 0), ("c", 1), ("d", 1)])
+        process_events.assert_called_with(False, 5)
+        self.assertEqual(process_events.call_count, 2)
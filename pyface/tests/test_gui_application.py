@@ -9,6 +9,7 @@
 # Thanks for using Enthought open source!
 
 
+import asyncio
 import os
 from shutil import rmtree
 from tempfile import mkdtemp
@@ -180,6 +181,46 @@ class TestGUIApplication(unittest.TestCase, GuiTestAssistant):
         self.assertEqual(event_order, EVENTS)
         self.assertEqual(app.windows, [])
 
+    def test_asyncio_driver(self):
+        from ..asyncio_driver import AsyncioDriver
+
+        app = GUIApplication(asyncio_driver=AsyncioDriver())
+        results = []
+
+        async def exit_app():
+            await asyncio.sleep(0.05)
+            results.append("awaited")
+            app.exit()
+
+        def on_initialized(event):
+            app.asyncio_driver.create_task(exit_app())
+
+        app.observe(on_initialized, "application_initialized")
+
+        result = app.run()
+
+        self.assertTrue(result)
+        self.assertEqual(results, ["awaited"])
+        self.assertTrue(app.asyncio_driver.loop.is_closed())
+
+    def test_watchdog(self):
+        from ..gui_watchdog import GUIWatchdog
+
+        app = GUIApplication(watchdog=GUIWatchdog())
+        running = []
+
+        def on_initialized(event):
+            running.append(app.watchdog.is_running())
+            app.exit()
+
+        app.observe(on_initialized, "application_initialized")
+
+        result = app.run()
+
+        self.assertTrue(result)
+        self.assertEqual(running, [True])
+        self.assertFalse(app.watchdog.is_running())
+
     def test_exit_prepare_error(self):
         app = TestingApp(exit_prepared_error=True)
         self.connect_listeners(app)
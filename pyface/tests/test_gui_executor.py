@@ -0,0 +1,142 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import queue
+import threading
+import unittest
+
+from traits.api import Any, HasTraits
+
+from ..gui import GUI
+from ..gui_executor import (
+    GUIExecutor,
+    GUIFuture,
+    get_default_gui_executor,
+    set_default_gui_executor,
+)
+from ..toolkit import toolkit_object
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+class Widget(HasTraits):
+    """ An object with a control, like a widget. """
+
+    control = Any()
+
+    def destroy(self):
+        self.control = None
+
+
+def wait_for(event):
+    """ Block until an event is set, then return the current thread. """
+    event.wait()
+    return threading.current_thread()
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestGUIExecutor(GuiTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.executor = GUIExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_submit(self):
+        results = []
+
+        future = self.executor.submit(pow, 2, 10)
+        future.add_done_callback(
+            lambda future: results.append(
+                (future.result(), threading.current_thread())
+            )
+        )
+
+        self.assertIsInstance(future, GUIFuture)
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertEqual(results, [(1024, threading.main_thread())])
+
+    def test_callback_added_when_done(self):
+        results = []
+        future = self.executor.submit(pow, 2, 10)
+        future.result(timeout=5.0)
+
+        future.add_done_callback(results.append)
+
+        # callbacks are never called synchronously
+        self.assertEqual(results, [])
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+
+    def test_exception(self):
+        results = []
+
+        future = self.executor.submit(int, "not a number")
+        future.add_done_callback(results.append)
+
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertIsInstance(future.exception(), ValueError)
+
+    def test_cancel_running(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        results = []
+
+        future = self.executor.submit(wait_for, event)
+        future.add_done_callback(results.append)
+
+        self.assertTrue(future.cancel())
+        self.assertTrue(future.cancelled())
+        event.set()
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertTrue(results[0].cancelled())
+
+    def test_cancel_on_destroy(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        widget = Widget(control=object())
+
+        future = self.executor.submit(wait_for, event)
+        future.cancel_on_destroy(widget)
+        widget.destroy()
+
+        self.assertTrue(future.cancelled())
+
+    def test_max_pending(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        executor = GUIExecutor(max_workers=1, max_pending=1)
+        self.addCleanup(executor.shutdown)
+
+        future = executor.submit(wait_for, event)
+        with self.assertRaises(queue.Full):
+            executor.submit(wait_for, event)
+
+        event.set()
+        future.result(timeout=5.0)
+        # the slot is released before the result is set
+        self.assertEqual(executor.submit(pow, 2, 2).result(timeout=5.0), 4)
+
+    def test_gui_submit(self):
+        previous = set_default_gui_executor(self.executor)
+        self.addCleanup(set_default_gui_executor, previous)
+        results = []
+
+        future = GUI.submit(pow, 2, 3)
+        future.add_done_callback(results.append)
+
+        self.assertIs(get_default_gui_executor(), self.executor)
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertEqual(future.result(), 8)
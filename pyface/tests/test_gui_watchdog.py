@@ -0,0 +1,114 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import time
+import unittest
+from unittest import mock
+
+from .. import gui_watchdog
+from ..gui_watchdog import GUIStall, GUIWatchdog
+from ..toolkit import toolkit_object
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+def block_gui_thread(seconds):
+    """ Keep the GUI thread busy without processing events. """
+    time.sleep(seconds)
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestGUIWatchdog(GuiTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.stalls = []
+        self.watchdog = GUIWatchdog(threshold=0.1, interval=0.01)
+        self.watchdog.observe(
+            lambda event: self.stalls.append(event.new), "stalled"
+        )
+        self.addCleanup(self.watchdog.stop)
+
+    def test_no_stall(self):
+        self.watchdog.start()
+
+        self.event_loop_helper.event_loop(repeat=5)
+        block_gui_thread(0.02)
+        self.event_loop_helper.event_loop(repeat=5)
+
+        self.assertEqual(self.stalls, [])
+        self.assertEqual(self.watchdog.stall_count, 0)
+
+    def test_stall(self):
+        self.watchdog.start()
+        self.event_loop_helper.event_loop(repeat=5)
+
+        with self.assertLogs("pyface.gui_watchdog", "WARNING"):
+            block_gui_thread(0.5)
+            with self.event_loop_until_condition(
+                lambda: self.stalls and self.stalls[-1].recovered
+            ):
+                pass
+
+        self.assertEqual(self.watchdog.stall_count, 1)
+        stalls = [stall for stall in self.stalls if not stall.recovered]
+        self.assertGreaterEqual(len(stalls), 2)
+        for stall in stalls:
+            self.assertIsInstance(stall, GUIStall)
+            self.assertIn("block_gui_thread", stall.stack[-1])
+        self.assertGreaterEqual(stalls[0].duration, 0.1)
+        self.assertGreaterEqual(self.stalls[-1].duration, 0.4)
+
+    def test_log_stalls_false(self):
+        self.watchdog.log_stalls = False
+        self.watchdog.start()
+        self.event_loop_helper.event_loop(repeat=5)
+
+        with mock.patch.object(gui_watchdog.logger, "warning") as warning:
+            block_gui_thread(0.2)
+            with self.event_loop_until_condition(
+                lambda: self.stalls and self.stalls[-1].recovered
+            ):
+                pass
+
+        warning.assert_not_called()
+        self.assertEqual(self.watchdog.stall_count, 1)
+
+    def test_stop(self):
+        self.watchdog.start()
+        self.assertTrue(self.watchdog.is_running())
+
+        self.watchdog.stop()
+        block_gui_thread(0.2)
+        self.event_loop_helper.event_loop(repeat=5)
+
+        self.assertFalse(self.watchdog.is_running())
+        self.assertEqual(self.stalls, [])
+
+    def test_restart_ignores_old_heartbeats(self):
+        self.watchdog.start()
+        with self.event_loop_until_condition(
+            lambda: self.watchdog._heartbeat_count > 0
+        ):
+            pass
+        old_heartbeat = self.watchdog._heartbeat_count
+        self.watchdog.stop()
+
+        self.watchdog.start()
+        deadline = time.monotonic() + 5.0
+        while self.watchdog._pending <= old_heartbeat:
+            self.assertLess(time.monotonic(), deadline)
+            block_gui_thread(0.005)
+
+        # a heartbeat posted by the previous thread is delivered late
+        self.watchdog._heartbeat(old_heartbeat)
+
+        self.assertGreater(self.watchdog._pending, old_heartbeat)
@@ -117,3 +117,45 @@ class TestImageResource(unittest.TestCase):
             os.path.join(SEARCH_PATH, "splash.png"),
         )
         self.assertEqual(size, (601, 203))
+
+    def test_get_reference(self):
+        image_resource = ImageResource("core")
+
+        reference = image_resource.get_reference()
+
+        self.assertEqual(reference.filename, IMAGE_PATH)
+        self.assertIs(image_resource.get_reference(), reference)
+
+    def test_get_reference_missing(self):
+        image_resource = ImageResource("doesnt_exist.png")
+
+        self.assertIsNone(image_resource.get_reference())
+
+    def test_reference_argument(self):
+        from pyface.resource.resource_reference import ImageReference
+        from pyface.resource_manager import resource_manager
+
+        reference = ImageReference(
+            resource_manager.resource_factory, filename=IMAGE_PATH
+        )
+        image_resource = ImageResource("not_searched", reference=reference)
+
+        self.assertIs(image_resource.get_reference(), reference)
+        self.assertEqual(image_resource.absolute_path, IMAGE_PATH)
+
+    def test_create_image_decoded_once(self):
+        from pyface.resource_manager import decoded_image_cache
+
+        decoded_image_cache.clear()
+        decoded_image_cache.reset_statistics()
+        image_resource_1 = ImageResource("core")
+        image_resource_2 = ImageResource("core")
+
+        image_1 = image_resource_1.create_image()
+        image_2 = image_resource_2.create_image()
+
+        self.assertIsNotNone(image_1)
+        self.assertIsNotNone(image_2)
+        statistics = decoded_image_cache.statistics()
+        self.assertEqual(statistics.misses, 1)
+        self.assertEqual(statistics.hits, 1)
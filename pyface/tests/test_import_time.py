@@ -0,0 +1,110 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Import-time checks for the api modules.
+
+Each check imports an api module in a new process, so that nothing is
+already imported, and checks which modules were imported.  Deferring the
+imports of pyface submodules and of the toolkit until a name is used is what
+keeps the api modules cheap to import.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+#: The api modules which should be cheap to import.
+API_MODULES = [
+    "pyface.api",
+    "pyface.action.api",
+    "pyface.data_view.api",
+    "pyface.tasks.api",
+]
+
+#: Modules that must not be imported by just importing an api module.
+HEAVY_MODULES = ["traits.api", "pyface.toolkit", "pyface.ui_traits"]
+
+#: The top-level packages of the toolkits.
+TOOLKIT_PACKAGES = ["PyQt5", "PyQt6", "PySide2", "PySide6", "wx"]
+
+# Report the modules imported by some code, as JSON on stdout.
+SCRIPT = """
+import json, sys
+before = set(sys.modules)
+{code}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def imported_modules(code):
+    """ Run code in a new interpreter and report the modules it imports.
+
+    Parameters
+    ----------
+    code : str
+        The code to run.
+
+    Returns
+    -------
+    modules : list of str
+        The modules imported by the code.
+    """
+    process = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(process.stdout)
+
+
+def is_toolkit_module(module_name):
+    """ Whether a module belongs to a toolkit or to a pyface backend. """
+    package = module_name.split(".")[0]
+    return package in TOOLKIT_PACKAGES or module_name.startswith(
+        ("pyface.ui.", "pyface.qt")
+    )
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_api_modules(self):
+        for module_name in API_MODULES:
+            with self.subTest(module_name=module_name):
+                modules = imported_modules(f"import {module_name}")
+
+                for heavy_module in HEAVY_MODULES:
+                    self.assertNotIn(heavy_module, modules)
+                self.assertEqual(
+                    [name for name in modules if is_toolkit_module(name)], []
+                )
+                # only the api module and the packages containing it
+                parts = module_name.split(".")
+                self.assertEqual(
+                    sorted(
+                        name for name in modules if name.startswith("pyface")
+                    ),
+                    sorted(
+                        ".".join(parts[:i + 1]) for i in range(len(parts))
+                    ),
+                )
+
+    def test_color_and_font(self):
+        modules = imported_modules("from pyface.api import Color, Font")
+
+        self.assertIn("pyface.color", modules)
+        self.assertIn("pyface.font", modules)
+        self.assertNotIn("pyface.toolkit", modules)
+        self.assertNotIn("pyface.ui_traits", modules)
+        self.assertNotIn("pyface.i_widget", modules)
+        self.assertEqual(
+            [name for name in modules if is_toolkit_module(name)], []
+        )
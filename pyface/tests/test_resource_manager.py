@@ -15,10 +15,13 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
+import zipfile
 
 import pyface     # a package with images as package resources
 from ..resource_manager import PyfaceResourceFactory
 from ..resource_manager import ResourceManager
+from ..resource.zip_reader import ZipReader, clear_zip_readers
 
 IMAGE_PATH = os.path.join(os.path.dirname(__file__), "images", "core.png")
 
@@ -90,3 +93,223 @@ class TestPyfaceResourceFactory(unittest.TestCase):
 
             # then
             self.assertIsNotNone(image_ref)
+
+    def test_locate_image_cached(self):
+        resource_manager = ResourceManager()
+        search_path = [os.path.dirname(IMAGE_PATH)]
+
+        image_ref_1 = resource_manager.locate_image("core", search_path)
+        with mock.patch.object(
+            ResourceManager, "_locate_image"
+        ) as mock_locate_image:
+            image_ref_2 = resource_manager.locate_image("core", search_path)
+
+        self.assertIs(image_ref_1, image_ref_2)
+        mock_locate_image.assert_not_called()
+
+    def test_locate_image_missing_cached(self):
+        resource_manager = ResourceManager()
+        search_path = [os.path.dirname(IMAGE_PATH)]
+
+        image_ref = resource_manager.locate_image("missing", search_path)
+        with mock.patch.object(
+            ResourceManager, "_locate_image"
+        ) as mock_locate_image:
+            image_ref = resource_manager.locate_image("missing", search_path)
+
+        self.assertIsNone(image_ref)
+        mock_locate_image.assert_not_called()
+
+    def test_locate_image_directory_changed(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_ref = resource_manager.locate_image("random", [tmp_dir])
+            self.assertIsNone(image_ref)
+
+            images_dir = os.path.join(tmp_dir, "images")
+            os.mkdir(images_dir)
+            shutil.copyfile(IMAGE_PATH, os.path.join(images_dir, "random.png"))
+            image_ref = resource_manager.locate_image("random", [tmp_dir])
+
+            self.assertEqual(
+                image_ref.filename, os.path.join(images_dir, "random.png")
+            )
+
+    def test_clear_lookup_cache(self):
+        resource_manager = ResourceManager()
+        search_path = [os.path.dirname(IMAGE_PATH)]
+        resource_manager.locate_image("core", search_path)
+
+        resource_manager.clear_lookup_cache()
+        with mock.patch.object(
+            ResourceManager, "_locate_image", return_value=None
+        ) as mock_locate_image:
+            resource_manager.locate_image("core", search_path)
+
+        mock_locate_image.assert_called_once()
+
+    def test_locate_image_sized(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sized_dir = os.path.join(tmp_dir, "images", "16x16")
+            os.makedirs(sized_dir)
+            shutil.copyfile(IMAGE_PATH, os.path.join(tmp_dir, "random.png"))
+            shutil.copyfile(IMAGE_PATH, os.path.join(sized_dir, "random.png"))
+
+            image_ref = resource_manager.locate_image(
+                "random", [tmp_dir], (16, 16)
+            )
+            other_image_ref = resource_manager.locate_image(
+                "random", [tmp_dir]
+            )
+
+            self.assertEqual(
+                image_ref.filename, os.path.join(sized_dir, "random.png")
+            )
+            self.assertEqual(
+                other_image_ref.filename,
+                os.path.join(tmp_dir, "random.png"),
+            )
+
+    def test_locate_image_extension_preference(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for filename in ["random.gif", "random.png", "random.txt"]:
+                shutil.copyfile(IMAGE_PATH, os.path.join(tmp_dir, filename))
+
+            image_ref = resource_manager.locate_image("random", [tmp_dir])
+            gif_ref = resource_manager.locate_image("random.gif", [tmp_dir])
+            txt_ref = resource_manager.locate_image("random.txt", [tmp_dir])
+
+            self.assertEqual(
+                image_ref.filename, os.path.join(tmp_dir, "random.png")
+            )
+            self.assertEqual(
+                gif_ref.filename, os.path.join(tmp_dir, "random.gif")
+            )
+            self.assertEqual(
+                txt_ref.filename, os.path.join(tmp_dir, "random.txt")
+            )
+
+    def test_locate_image_dotted_filename(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for filename in ["random.2x.png", "other.tar.gif", "other.png"]:
+                shutil.copyfile(IMAGE_PATH, os.path.join(tmp_dir, filename))
+
+            dotted_ref = resource_manager.locate_image("random", [tmp_dir])
+            exact_ref = resource_manager.locate_image("other", [tmp_dir])
+            gif_ref = resource_manager.locate_image("other.gif", [tmp_dir])
+            tar_ref = resource_manager.locate_image("other.tar", [tmp_dir])
+
+            self.assertEqual(
+                dotted_ref.filename, os.path.join(tmp_dir, "random.2x.png")
+            )
+            self.assertEqual(
+                exact_ref.filename, os.path.join(tmp_dir, "other.png")
+            )
+            # a name with an extension only matches exactly
+            self.assertIsNone(gif_ref)
+            self.assertIsNone(tar_ref)
+
+    def test_locate_image_subdirectory_name(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.mkdir(os.path.join(tmp_dir, "icons"))
+            filename = os.path.join(tmp_dir, "icons", "random.png")
+            shutil.copyfile(IMAGE_PATH, filename)
+
+            image_ref = resource_manager.locate_image(
+                "icons/random", [tmp_dir]
+            )
+
+            self.assertEqual(image_ref.filename, filename)
+
+    def test_locate_image_subdirectory_name_changed(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            icons_dir = os.path.join(tmp_dir, "icons")
+            os.mkdir(icons_dir)
+            image_ref = resource_manager.locate_image(
+                "icons/random", [tmp_dir]
+            )
+            self.assertIsNone(image_ref)
+
+            # adding a file changes the subdirectory, but not tmp_dir
+            filename = os.path.join(icons_dir, "random.png")
+            shutil.copyfile(IMAGE_PATH, filename)
+            image_ref = resource_manager.locate_image(
+                "icons/random", [tmp_dir]
+            )
+            self.assertEqual(image_ref.filename, filename)
+
+            os.remove(filename)
+            image_ref = resource_manager.locate_image(
+                "icons/random", [tmp_dir]
+            )
+            self.assertIsNone(image_ref)
+
+    def test_preload(self):
+        resource_manager = ResourceManager()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sized_dir = os.path.join(tmp_dir, "images", "16x16")
+            os.makedirs(sized_dir)
+            shutil.copyfile(IMAGE_PATH, os.path.join(sized_dir, "random.png"))
+
+            resource_manager.preload([tmp_dir, pyface])
+
+            self.assertEqual(
+                set(resource_manager._directory_index),
+                {
+                    tmp_dir,
+                    os.path.join(tmp_dir, "images"),
+                    sized_dir,
+                },
+            )
+            with mock.patch("os.listdir") as mock_listdir:
+                image_ref = resource_manager.locate_image(
+                    "random", [tmp_dir], (16, 16)
+                )
+            mock_listdir.assert_not_called()
+            self.assertEqual(
+                image_ref.filename, os.path.join(sized_dir, "random.png")
+            )
+
+    def test_locate_image_images_zip(self):
+        resource_manager = ResourceManager()
+        with open(IMAGE_PATH, "rb") as fp:
+            data = fp.read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_path = os.path.join(tmp_dir, "images.zip")
+            with zipfile.ZipFile(zip_path, "w") as zip_file:
+                zip_file.writestr("random.gif", b"not used")
+                zip_file.writestr("random.png", data)
+
+            with mock.patch.object(
+                ZipReader, "read", side_effect=ZipReader.read, autospec=True,
+            ) as mock_read:
+                image_ref = resource_manager.locate_image("random", [tmp_dir])
+                missing_ref = resource_manager.locate_image(
+                    "missing", [tmp_dir]
+                )
+
+            clear_zip_readers()
+
+            self.assertEqual(image_ref.data, data)
+            self.assertIsNone(missing_ref)
+            # only the member that exists is read
+            self.assertEqual(mock_read.call_count, 1)
+
+    def test_locate_image_in_zip_path(self):
+        resource_manager = ResourceManager()
+        with open(IMAGE_PATH, "rb") as fp:
+            data = fp.read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_path = os.path.join(tmp_dir, "resources.zip")
+            with zipfile.ZipFile(zip_path, "w") as zip_file:
+                zip_file.writestr("images/random.png", data)
+
+            image_ref = resource_manager.locate_image("random", [zip_path])
+            clear_zip_readers()
+
+            self.assertEqual(image_ref.data, data)
@@ -0,0 +1,91 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import threading
+import unittest
+
+from traits.api import Float, HasTraits, Instance, List, observe
+
+from ..toolkit import toolkit_object
+from ..ui_dispatch import dispatch_latest
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+class Model(HasTraits):
+
+    progress = Float()
+
+    other = Float()
+
+
+class View(HasTraits):
+
+    model = Instance(Model)
+
+    events = List()
+
+    threads = List()
+
+    @observe("model:[progress,other]", dispatch="same")
+    @dispatch_latest
+    def _update(self, event):
+        self.events.append(event)
+        self.threads.append(threading.current_thread())
+
+
+def produce(model):
+    for i in range(1000):
+        model.progress = float(i)
+    model.other = 1.0
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestDispatchLatest(GuiTestAssistant, unittest.TestCase):
+
+    def test_method(self):
+        model = Model()
+        view = View(model=model)
+        view_2 = View(model=model)
+
+        thread = threading.Thread(target=produce, args=(model,))
+        thread.start()
+        thread.join()
+
+        with self.event_loop_until_condition(
+            lambda: len(view.events) == 2 and len(view_2.events) == 2
+        ):
+            pass
+        self.assertEqual(
+            [(event.name, event.new) for event in view.events],
+            [("progress", 999.0), ("other", 1.0)],
+        )
+        self.assertEqual(
+            view.threads, [threading.main_thread(), threading.main_thread()]
+        )
+
+    def test_function(self):
+        model = Model()
+        events = []
+
+        @dispatch_latest
+        def handler(event):
+            events.append(event)
+
+        model.observe(handler, "progress", dispatch="same")
+
+        thread = threading.Thread(target=produce, args=(model,))
+        thread.start()
+        thread.join()
+
+        with self.event_loop_until_condition(lambda: len(events) == 1):
+            pass
+        self.assertEqual(events[0].new, 999.0)
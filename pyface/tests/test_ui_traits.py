@@ -40,6 +40,9 @@ from ..ui_traits import (
     Margin,
     PyfaceColor,
     PyfaceFont,
+    clear_image_caches,
+    convert_bitmap,
+    convert_image,
     image_resource_cache,
     image_bitmap_cache,
 )
@@ -77,7 +80,9 @@ class TestImageTrait(unittest.TestCase, UnittestTools):
     def setUp(self):
         # clear all cached images
         image_resource_cache.clear()
+        image_resource_cache.reset_statistics()
         image_bitmap_cache.clear()
+        image_bitmap_cache.reset_statistics()
         # clear cached "not found" image
         ImageResource._image_not_found = None
 
@@ -142,6 +147,47 @@ class TestImageTrait(unittest.TestCase, UnittestTools):
 
         self.assertIsInstance(image_class.image, PILImage)
 
+    def test_convert_image_cached(self):
+        image_1 = convert_image("core.png", 2)
+        image_2 = convert_image("core.png", 2)
+
+        self.assertIs(image_1, image_2)
+        self.assertEqual(image_resource_cache.statistics().hits, 1)
+
+    def test_convert_image_cache_bounded(self):
+        self.addCleanup(
+            setattr, image_resource_cache, "max_size",
+            image_resource_cache.max_size,
+        )
+        image_resource_cache.max_size = 2
+
+        images = [convert_image(name, 2) for name in "abc"]
+
+        self.assertEqual(len(image_resource_cache), 2)
+        # evicted images are still found while they are in use
+        self.assertIs(convert_image("a", 2), images[0])
+
+    def test_convert_bitmap_cached(self):
+        image = ImageResource("core.png")
+
+        bitmap_1 = convert_bitmap(image)
+        bitmap_2 = convert_bitmap(image)
+
+        self.assertIs(bitmap_1, bitmap_2)
+        statistics = image_bitmap_cache.statistics()
+        self.assertEqual(statistics.count, 1)
+        self.assertGreater(statistics.size, 0)
+
+    def test_clear_image_caches(self):
+        image = convert_image("core.png", 2)
+        convert_bitmap(image)
+
+        clear_image_caches()
+
+        self.assertEqual(len(image_resource_cache), 0)
+        self.assertEqual(len(image_bitmap_cache), 0)
+        self.assertIsNot(convert_image("core.png", 2), image)
+
 
 class TestMargin(unittest.TestCase):
     def test_defaults(self):
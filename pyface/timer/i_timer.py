@@ -58,6 +58,9 @@ class ITimer(Interface):
     #: Whether or not the timer is currently running.
     active = Bool()
 
+    #: Whether the timer shares a toolkit timer with other shared timers.
+    shared = Bool(False)
+
     # -------------------------------------------------------------------------
     # ITimer interface
     # -------------------------------------------------------------------------
@@ -139,6 +142,12 @@ class BaseTimer(ABCHasTraits):
     #: Property that controls the state of the timer.
     active = Property(Bool, observe="_active")
 
+    #: Whether the timer shares a toolkit timer with other shared timers.
+    #: This saves resources when there are many timers, at the cost of
+    #: performing them up to a quarter of an interval late.  Toolkits which
+    #: don't support shared timers give each timer its own toolkit timer.
+    shared = Bool(False)
+
     # Private interface ------------------------------------------------------
 
     #: Whether or not the timer is currently running.
@@ -440,3 +440,115 @@ class TestTimer(TestCase, GuiTestAssistant):
                 expected_times, handler.times
             ),
         )
+
+
+@skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestSharedTimer(TestCase, GuiTestAssistant):
+    """ Test timers which share a toolkit timer. """
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+
+    def tearDown(self):
+        GuiTestAssistant.tearDown(self)
+
+    def test_repeat(self):
+        handler = ConditionHandler()
+        timer = CallbackTimer(
+            callback=handler.callback, interval=0.05, repeat=4, shared=True
+        )
+
+        timer.start()
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not timer.active
+            )
+        finally:
+            timer.stop()
+
+        self.assertEqual(handler.count, 4)
+
+    def test_interval_without_drift(self):
+        handler = ConditionHandler()
+        timer = EventTimer(interval=0.05, repeat=10, shared=True)
+        timer.observe(handler.callback, "timeout")
+
+        start_time = perf_counter()
+        timer.start()
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not timer.active
+            )
+        finally:
+            timer.stop()
+
+        self.assertEqual(handler.count, 10)
+        for i, actual in enumerate(handler.times):
+            self.assertGreaterEqual(actual, start_time + 0.05 * (i + 1))
+        # ticks are scheduled from the previous due time, not from when the
+        # timer was performed, so lateness doesn't accumulate
+        self.assertLess(handler.times[-1], start_time + 0.5 + 0.1)
+
+    def test_expire(self):
+        handler = ConditionHandler()
+        timer = CallbackTimer(
+            callback=handler.callback, interval=10.0, expire=0.1, shared=True
+        )
+
+        timer.start()
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not timer.active, timeout=5.0
+            )
+        finally:
+            timer.stop()
+
+        # the timer stops when it expires, without waiting for the interval
+        self.assertEqual(handler.count, 0)
+
+    def test_many_timers(self):
+        handlers = [ConditionHandler() for i in range(200)]
+        timers = [
+            CallbackTimer.timer(
+                callback=handler.callback,
+                interval=0.02 + 0.0001 * i,
+                repeat=3,
+                shared=True,
+            )
+            for i, handler in enumerate(handlers)
+        ]
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not any(timer.active for timer in timers)
+            )
+        finally:
+            for timer in timers:
+                timer.stop()
+
+        self.assertTrue(all(handler.count == 3 for handler in handlers))
+
+    def test_stop_from_callback(self):
+        timers = []
+        handler = ConditionHandler()
+
+        def stop_other():
+            handler.callback()
+            timers[1].stop()
+
+        timers.append(
+            CallbackTimer.timer(callback=stop_other, interval=0.05, shared=True)
+        )
+        timers.append(
+            CallbackTimer.timer(
+                callback=handler.callback, interval=0.05, shared=True
+            )
+        )
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                handler.called_n(3)
+            )
+        finally:
+            for timer in timers:
+                timer.stop()
+
+        self.assertFalse(timers[1].active)
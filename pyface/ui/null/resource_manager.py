@@ -31,3 +31,18 @@ class PyfaceResourceFactory(ResourceFactory):
     def image_from_data(self, data):
         """ Creates an image from the specified data. """
         return data
+
+    def image_nbytes(self, image):
+        """ Returns the number of bytes of pixel data held by an image. """
+        return len(image)
+
+    def copy_image(self, image):
+        """ Returns a copy of an image which can be modified independently.
+        """
+        # the images are immutable bytes
+        return image
+
+    def image_region(self, image, x, y, width, height):
+        """ Returns a copy of a rectangular region of an image. """
+        # the images are undecoded bytes, so they can't be cropped
+        return image
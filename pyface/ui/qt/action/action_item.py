@@ -22,6 +22,7 @@ from traits.api import Any, Bool, HasTraits
 
 
 from pyface.action.action_event import ActionEvent
+from pyface.ui.qt.image_loader import get_image_loader
 
 
 class PyfaceWidgetAction(QtGui.QWidgetAction):
@@ -305,8 +306,7 @@ class _Tool(HasTraits):
         elif action.image is None:
             self.control = tool_bar.addAction(action.name)
         else:
-            size = tool_bar.iconSize()
-            image = action.image.create_icon((size.width(), size.height()))
+            image = self._create_icon(action.image)
             self.control = tool_bar.addAction(image, action.name)
         tool_bar.tools.append(self)
 
@@ -475,10 +475,7 @@ class _Tool(HasTraits):
         """ Called when the accelerator trait is changed on an action. """
         action = event.object
         if self.control is not None:
-            size = self.tool_bar.iconSize()
-            self.control.setIcon(
-                action.image.create_icon((size.width(), size.height()))
-            )
+            self.control.setIcon(self._create_icon(action.image))
 
     def _on_action_tooltip_changed(self, event):
         """ Called when the accelerator trait is changed on an action. """
@@ -486,6 +483,29 @@ class _Tool(HasTraits):
         if self.control is not None:
             self.control.setToolTip(action.tooltip)
 
+    def _create_icon(self, image):
+        """ Create the icon for an image at the tool bar's icon size.
+
+        If the tool bar manager asks for images to be decoded in the
+        background, a placeholder is returned and the icon is set once the
+        image is ready.
+        """
+        size = self.tool_bar.iconSize()
+        size = (size.width(), size.height())
+        manager = getattr(self.tool_bar, "tool_bar_manager", None)
+        if getattr(manager, "async_images", False):
+            return get_image_loader().load_icon(
+                image,
+                lambda icon: self._on_icon_loaded(image, icon),
+                size,
+            )
+        return image.create_icon(size)
+
+    def _on_icon_loaded(self, image, icon):
+        """ Called when an image decoded in the background is ready. """
+        if self.control is not None and self.item.action.image is image:
+            self.control.setIcon(icon)
+
 
 class _PaletteTool(HasTraits):
     """ A tool palette representation of an action item. """
@@ -53,6 +53,10 @@ class ToolBarManager(ActionManager):
     # Should we display the horizontal divider?
     show_divider = Bool(True)
 
+    # Should tool images be decoded in the background, showing a placeholder
+    # until they are ready?
+    async_images = Bool(False)
+
     # Private interface ----------------------------------------------------
 
     # Cache of tool images (scaled to the appropriate size).
@@ -11,7 +11,9 @@
 import logging
 
 from pyface.qt import is_qt4
-from pyface.qt.QtCore import QAbstractItemModel, QMimeData, QModelIndex, Qt
+from pyface.qt.QtCore import (
+    QAbstractItemModel, QMimeData, QModelIndex, QPersistentModelIndex, Qt
+)
 from pyface.qt.QtGui import QColor
 from pyface.data_view.abstract_data_model import AbstractDataModel
 from pyface.data_view.abstract_value_type import CheckState
@@ -19,6 +21,7 @@ from pyface.data_view.data_view_errors import (
     DataViewGetError, DataViewSetError
 )
 from pyface.data_view.index_manager import Root
+from pyface.ui.qt.image_loader import get_image_loader
 from .data_wrapper import DataWrapper
 
 
@@ -44,9 +47,19 @@ class DataViewItemModel(QAbstractItemModel):
 
     def __init__(self, model, selection_type, exporters, parent=None):
         super().__init__(parent)
+        # cache of (can_have_children, row_count) keyed by index object
+        self._row_count_cache = {}
+        # (row, column) of items whose images are being loaded
+        self._pending_images = set()
+        # toolkit images delivered by the image loader keyed by (row, column),
+        # so that they are shown even if the decoded image cache can't hold
+        # them
+        self._loaded_images = {}
         self.model = model
         self.selectionType = selection_type
         self.exporters = exporters
+        # whether to decode images in the background
+        self.async_images = False
         self.destroyed.connect(self._on_destroyed)
 
     @property
@@ -59,6 +72,8 @@ class DataViewItemModel(QAbstractItemModel):
         if hasattr(self, '_model'):
             self.beginResetModel()
             self._model = model
+            self._row_count_cache.clear()
+            self._clear_images()
             self.endResetModel()
         else:
             # model is being initialized
@@ -69,6 +84,12 @@ class DataViewItemModel(QAbstractItemModel):
 
     def on_structure_changed(self, event):
         self.beginResetModel()
+        if isinstance(event.new, (tuple, list)):
+            # only the rows below this row have changed
+            self._invalidate_row_counts(tuple(event.new))
+        else:
+            self._row_count_cache.clear()
+        self._clear_images()
         self.endResetModel()
 
     def on_values_changed(self, event):
@@ -87,6 +108,8 @@ class DataViewItemModel(QAbstractItemModel):
             top = top[:i+1]
             bottom = bottom[:i+1]
 
+            # the images of the items may have changed
+            self._loaded_images.clear()
             top_left = self._to_model_index(top, left)
             bottom_right = self._to_model_index(bottom, right)
             self.dataChanged.emit(top_left, bottom_right)
@@ -115,20 +138,21 @@ class DataViewItemModel(QAbstractItemModel):
         return index
 
     def rowCount(self, index=QModelIndex()):
-        row_index = self._to_row_index(index)
         try:
-            if self.model.can_have_children(row_index):
-                return self.model.get_row_count(row_index)
+            can_have_children, row_count = self._get_row_count(index)
         except Exception:
             logger.exception("Error in rowCount")
+        else:
+            if can_have_children:
+                return row_count
 
         return 0
 
     def columnCount(self, index=QModelIndex()):
-        row_index = self._to_row_index(index)
         try:
+            can_have_children, row_count = self._get_row_count(index)
             # the number of columns is constant; leaf rows return 0
-            if self.model.can_have_children(row_index):
+            if can_have_children:
                 return self.model.get_column_count() + 1
         except Exception:
             logger.exception("Error in columnCount")
@@ -145,7 +169,7 @@ class DataViewItemModel(QAbstractItemModel):
             return Qt.ItemFlag.ItemIsEnabled
 
         flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
-        if not is_qt4 and not self.model.can_have_children(row):
+        if not is_qt4 and not self._get_row_count(index)[0]:
             flags |= Qt.ItemFlag.ItemNeverHasChildren
 
         try:
@@ -189,6 +213,8 @@ class DataViewItemModel(QAbstractItemModel):
                 if value_type.has_image(self.model, row, column):
                     image = value_type.get_image(self.model, row, column)
                     if image is not None:
+                        if self.async_images:
+                            return self._load_image(index, image)
                         return image.create_image()
             elif role == Qt.ItemDataRole.BackgroundRole:
                 if value_type.has_color(self.model, row, column):
@@ -314,6 +340,92 @@ class DataViewItemModel(QAbstractItemModel):
     def _on_destroyed(self):
         self._disconnect_model_observers()
         self._model = None
+        self._row_count_cache.clear()
+        self._clear_images()
+
+    def _clear_images(self):
+        """ Forget the images which are loading or have been loaded. """
+        self._pending_images.clear()
+        self._loaded_images.clear()
+
+    def _load_image(self, index, image):
+        """ Load an item's image in the background.
+
+        A placeholder is returned while the image is loading, and the view
+        is told that the item has changed once it is ready.  The loaded
+        image is kept until the item's value or the structure of the model
+        changes.
+        """
+        key = (self._to_row_index(index), self._to_column_index(index))
+        toolkit_image = self._loaded_images.get(key)
+        if toolkit_image is not None:
+            return toolkit_image
+        if key in self._pending_images:
+            # the view will be told when the image is ready
+            return get_image_loader().create_placeholder()
+
+        persistent_index = QPersistentModelIndex(index)
+
+        def image_loaded(toolkit_image):
+            if key not in self._pending_images:
+                # the model was reset while the image was loading
+                return
+            self._pending_images.discard(key)
+            self._loaded_images[key] = toolkit_image
+            if self._model is not None and persistent_index.isValid():
+                index = QModelIndex(persistent_index)
+                self.dataChanged.emit(index, index)
+
+        toolkit_image, pending = get_image_loader().request_image(
+            image, image_loaded
+        )
+        if pending:
+            self._pending_images.add(key)
+        return toolkit_image
+
+    def _get_row_count(self, index):
+        """ Get whether a row can have children and its number of children.
+
+        Results are cached by the index manager's index object for the row,
+        so that models with expensive child counts only compute them once
+        per row until the structure below the row changes.
+        """
+        if not index.isValid():
+            key = Root
+        else:
+            key = self.model.index_manager.create_index(
+                index.internalPointer(),
+                index.row(),
+            )
+        try:
+            return self._row_count_cache[key]
+        except KeyError:
+            pass
+
+        row_index = self._to_row_index(index)
+        can_have_children = self.model.can_have_children(row_index)
+        if can_have_children:
+            row_count = self.model.get_row_count(row_index)
+        else:
+            row_count = 0
+        self._row_count_cache[key] = (can_have_children, row_count)
+        return can_have_children, row_count
+
+    def _invalidate_row_counts(self, row_index):
+        """ Discard cached row counts of a row and all of its descendants.
+        """
+        depth = len(row_index)
+        if depth == 0:
+            self._row_count_cache.clear()
+            return
+
+        to_sequence = self.model.index_manager.to_sequence
+        stale = [
+            key for key in self._row_count_cache
+            if to_sequence(key)[:depth] == row_index
+        ]
+        for key in stale:
+            del self._row_count_cache[key]
 
     def _connect_model_observers(self):
         if getattr(self, "_model", None) is not None:
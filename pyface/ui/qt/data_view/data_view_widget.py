@@ -123,6 +123,7 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
             self.selection_type,
             self.exporters,
         )
+        self._item_model.async_images = self.async_images
 
     def _get_control_header_visible(self):
         """ Method to get the control's header visibility. """
@@ -245,3 +246,8 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
     def _update_exporters(self, event):
         if self._item_model is not None:
             self._item_model.exporters = self.exporters
+
+    @observe('async_images', dispatch='ui')
+    def _update_async_images(self, event):
+        if self._item_model is not None:
+            self._item_model.async_images = event.new
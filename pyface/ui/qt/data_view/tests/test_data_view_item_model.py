@@ -8,19 +8,29 @@
 #
 # Thanks for using Enthought open source!
 
-from unittest import TestCase
+import os
+from unittest import TestCase, mock
 
 from traits.testing.optional_dependencies import numpy as np, requires_numpy
 
-from pyface.qt.QtCore import QMimeData
+from pyface.api import GUI, ImageResource
+from pyface.qt.QtCore import QMimeData, QModelIndex, Qt
 # This import results in an error without numpy installed
 # see enthought/pyface#742
 if np is not None:
     from pyface.data_view.data_models.api import ArrayDataModel
 from pyface.data_view.exporters.row_exporter import RowExporter
 from pyface.data_view.data_formats import table_format
-from pyface.data_view.value_types.api import FloatValue
+from pyface.data_view.value_types.api import ConstantValue, FloatValue
+from pyface.resource_manager import decoded_image_cache
 from pyface.ui.qt.data_view.data_view_item_model import DataViewItemModel
+from pyface.ui.qt.image_loader import get_image_loader
+from pyface.ui.qt.util.event_loop_helper import EventLoopHelper
+from pyface.util.guisupport import get_app_qt4
+
+IMAGES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "..", "tests", "images"
+)
 
 
 @requires_numpy
@@ -72,3 +82,105 @@ class TestDataViewItemModel(TestCase):
 
         self.assertIsInstance(mime_data, QMimeData)
         # exact contents depend on Qt, so won't test more deeply
+
+    def test_rowCount_cached(self):
+        get_row_count = ArrayDataModel.get_row_count
+        with mock.patch.object(
+            ArrayDataModel,
+            'get_row_count',
+            autospec=True,
+            side_effect=get_row_count,
+        ) as mock_get_row_count:
+            parent = self.item_model.index(1, 0, QModelIndex())
+            self.assertEqual(self.item_model.rowCount(parent), 5)
+            self.assertEqual(self.item_model.rowCount(parent), 5)
+            self.assertEqual(self.item_model.columnCount(parent), 7)
+            self.assertEqual(self.item_model.rowCount(), 4)
+
+        self.assertEqual(mock_get_row_count.call_count, 2)
+
+    def test_rowCount_structure_changed(self):
+        parent = self.item_model.index(1, 0, QModelIndex())
+        self.item_model.rowCount(parent)
+        self.item_model.rowCount()
+
+        self.model.data = np.arange(60.0).reshape(2, 5, 6)
+
+        self.assertEqual(self.item_model.rowCount(), 2)
+        self.assertEqual(self.item_model._row_count_cache, {(): (True, 2)})
+
+    def test_rowCount_structure_changed_row(self):
+        for row in range(4):
+            parent = self.item_model.index(row, 0, QModelIndex())
+            self.item_model.rowCount(parent)
+        self.item_model.rowCount()
+
+        self.model.structure_changed = (1,)
+
+        index_manager = self.model.index_manager
+        self.assertEqual(
+            sorted(
+                index_manager.to_sequence(key)
+                for key in self.item_model._row_count_cache
+            ),
+            [(), (0,), (2,), (3,)],
+        )
+
+    def test_data_decoration_async(self):
+        decoded_image_cache.clear()
+        self.addCleanup(decoded_image_cache.clear)
+        image = ImageResource("core", search_path=[IMAGES_DIR])
+        self.model.value_type = ConstantValue(image=image)
+        self.item_model.async_images = True
+        parent = self.item_model.index(0, 0, QModelIndex())
+        index = self.item_model.index(0, 1, parent)
+        changed = []
+        self.item_model.dataChanged.connect(
+            lambda top_left, bottom_right, *args: changed.append(top_left)
+        )
+
+        placeholder = self.item_model.data(index, Qt.ItemDataRole.DecorationRole)
+        self.item_model.data(index, Qt.ItemDataRole.DecorationRole)
+
+        self.assertTrue(placeholder.isNull())
+        self.assertEqual(len(self.item_model._pending_images), 1)
+        helper = EventLoopHelper(qt_app=get_app_qt4(), gui=GUI())
+        helper.event_loop_until_condition(lambda: len(changed) == 1)
+        self.assertEqual(changed[0], index)
+        self.assertEqual(self.item_model._pending_images, set())
+
+        pixmap = self.item_model.data(index, Qt.ItemDataRole.DecorationRole)
+        self.assertEqual(pixmap.width(), 64)
+
+    def test_data_decoration_async_larger_than_cache(self):
+        decoded_image_cache.clear()
+        self.addCleanup(decoded_image_cache.clear)
+        max_bytes = decoded_image_cache.max_bytes
+        self.addCleanup(setattr, decoded_image_cache, "max_bytes", max_bytes)
+        # the image is too big to be held by the cache
+        decoded_image_cache.max_bytes = 1
+        image = ImageResource("core", search_path=[IMAGES_DIR])
+        self.model.value_type = ConstantValue(image=image)
+        self.item_model.async_images = True
+        parent = self.item_model.index(0, 0, QModelIndex())
+        index = self.item_model.index(0, 1, parent)
+        changed = []
+        self.item_model.dataChanged.connect(
+            lambda top_left, bottom_right, *args: changed.append(top_left)
+        )
+        loader = get_image_loader()
+
+        with mock.patch.object(
+            loader, "_decode", wraps=loader._decode
+        ) as decode:
+            self.item_model.data(index, Qt.ItemDataRole.DecorationRole)
+            helper = EventLoopHelper(qt_app=get_app_qt4(), gui=GUI())
+            helper.event_loop_until_condition(lambda: len(changed) == 1)
+
+            pixmap = self.item_model.data(
+                index, Qt.ItemDataRole.DecorationRole
+            )
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(pixmap.width(), 64)
+        self.assertEqual(self.item_model._pending_images, set())
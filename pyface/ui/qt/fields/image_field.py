@@ -15,6 +15,7 @@ from pyface.qt.QtGui import QLabel, QPixmap
 from traits.api import provides
 
 from pyface.ui.qt.fields.field import Field
+from pyface.ui.qt.image_loader import get_image_loader
 from pyface.fields.i_image_field import IImageField, MImageField
 
 
@@ -47,6 +48,20 @@ class ImageField(MImageField, Field):
         if value is None:
             self._toolkit_value = None
             self.control.setPixmap(QPixmap())
+        elif self.async_images:
+            self._toolkit_value = get_image_loader().load_image(
+                value,
+                lambda toolkit_value: self._on_image_loaded(
+                    value, toolkit_value
+                ),
+            )
+            self.control.setPixmap(self._toolkit_value)
         else:
             self._toolkit_value = self.value.create_bitmap()
             self.control.setPixmap(self._toolkit_value)
+
+    def _on_image_loaded(self, value, toolkit_value):
+        """ Called when an image decoded in the background is ready. """
+        if self.control is not None and self.value is value:
+            self._toolkit_value = toolkit_value
+            self.control.setPixmap(toolkit_value)
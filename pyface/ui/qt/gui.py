@@ -12,8 +12,11 @@
 # However, when used with the GPL version of PyQt the additional terms described in the PyQt GPL exception also apply
 
 
+import collections
+import functools
 import logging
 import threading
+import time
 
 
 from pyface.qt import QtCore, QtGui
@@ -61,28 +64,47 @@ class GUI(MGUI, HasTraits):
 
     @classmethod
     def invoke_after(cls, millisecs, callable, *args, **kw):
-        _FutureCall(millisecs, callable, *args, **kw)
+        _Dispatcher.instance().dispatch(millisecs, callable, args, kw)
 
     @classmethod
     def invoke_later(cls, callable, *args, **kw):
-        _FutureCall(0, callable, *args, **kw)
+        _Dispatcher.instance().dispatch(0, callable, args, kw)
 
     @classmethod
     def set_trait_after(cls, millisecs, obj, trait_name, new):
-        _FutureCall(millisecs, setattr, obj, trait_name, new)
+        _Dispatcher.instance().dispatch(
+            millisecs, setattr, (obj, trait_name, new), {}
+        )
 
     @classmethod
     def set_trait_later(cls, obj, trait_name, new):
-        _FutureCall(0, setattr, obj, trait_name, new)
+        _Dispatcher.instance().dispatch(
+            0, setattr, (obj, trait_name, new), {}
+        )
 
     @staticmethod
-    def process_events(allow_user_events=True):
+    def process_events(allow_user_events=True, max_time_ms=None):
         if allow_user_events:
             events = QtCore.QEventLoop.ProcessEventsFlag.AllEvents
         else:
             events = QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents
 
-        QtCore.QCoreApplication.processEvents(events)
+        if max_time_ms is None:
+            QtCore.QCoreApplication.processEvents(events)
+            return
+
+        # Let the dispatcher stop part way through a batch of callables when
+        # the time is up, as Qt only checks the time between events.
+        dispatcher = _Dispatcher.instance()
+        previous = dispatcher.deadline
+        deadline = time.perf_counter() + max_time_ms / 1000.0
+        if previous is not None:
+            deadline = min(deadline, previous)
+        dispatcher.deadline = deadline
+        try:
+            QtCore.QCoreApplication.processEvents(events, int(max_time_ms))
+        finally:
+            dispatcher.deadline = previous
 
     @staticmethod
     def set_busy(busy=True):
@@ -131,33 +153,52 @@ class GUI(MGUI, HasTraits):
             QtGui.QApplication.restoreOverrideCursor()
 
 
-class _FutureCall(QtCore.QObject):
-    """ This is a helper class that is similar to the wx FutureCall class. """
+class _Dispatcher(QtCore.QObject):
+    """ Calls callables on the main GUI thread in batches.
+
+    Callables may be added from any thread.  They are appended to a deque,
+    and an event is posted to wake up the dispatcher only if one isn't
+    already pending.  When the event is delivered, the dispatcher calls all
+    of the callables that are pending at that time, in order.  Callables
+    added while it is doing so post a new event, so that a busy producer
+    can't starve the event loop.  While events are processed with a time
+    limit, a batch that runs out of time is also finished by a new event.
+    """
 
-    # Keep a list of references so that they don't get garbage collected.
-    _calls = []
+    #: The shared dispatcher, created on first use.
+    _instance = None
 
-    # Manage access to the list of instances.
-    _calls_mutex = QtCore.QMutex()
+    #: Lock protecting the creation of the shared dispatcher.
+    _instance_lock = threading.Lock()
 
-    # A new Qt event type for _FutureCalls
+    # A new Qt event type for waking up the dispatcher
     _pyface_event = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
 
-    def __init__(self, ms, callable, *args, **kw):
+    @classmethod
+    def instance(cls):
+        """ Get the shared dispatcher, creating it if needed. """
+        dispatcher = cls._instance
+        if dispatcher is None:
+            with cls._instance_lock:
+                dispatcher = cls._instance
+                if dispatcher is None:
+                    dispatcher = cls._instance = cls()
+        return dispatcher
+
+    def __init__(self):
         super().__init__()
 
-        # Save the arguments.
-        self._ms = ms
-        self._callable = callable
-        self._args = args
-        self._kw = kw
+        # The pending (millisecs, callable, args, kw) tuples.  Appending to
+        # and popping from a deque are atomic, so no lock is needed.
+        self._pending = collections.deque()
 
-        # Save the instance.
-        self._calls_mutex.lock()
-        try:
-            self._calls.append(self)
-        finally:
-            self._calls_mutex.unlock()
+        # Whether a wake up event has been posted and not yet delivered.
+        self._posted = False
+
+        #: The perf_counter time after which a batch is interrupted and the
+        #: rest of it re-posted, or None.  This is set while events are
+        #: processed with a time limit.
+        self.deadline = None
 
         # Move to the main GUI thread if necessary.
         # Note that calling QApplication.thread() seems to cause an
@@ -167,35 +208,85 @@ class _FutureCall(QtCore.QObject):
         if threading.current_thread() != threading.main_thread():
             self.moveToThread(QtGui.QApplication.instance().thread())
 
-        # Post an event to be dispatched on the main GUI thread. Note that
-        # we do not call QTimer.singleShot here, which would be simpler, because
-        # that only works on QThreads. We want regular Python threads to work.
-        event = QtCore.QEvent(self._pyface_event)
-        QtGui.QApplication.postEvent(self, event)
+    def dispatch(self, millisecs, callable, args, kw):
+        """ Call a callable on the main GUI thread.
+
+        This may be called from any thread.
+
+        Parameters
+        ----------
+        millisecs : int
+            The delay before calling the callable, or 0 to call it as soon
+            as possible.
+        callable : callable
+            The callable to call.
+        args : tuple
+            The positional arguments to call it with.
+        kw : dict
+            The keyword arguments to call it with.
+        """
+        self._pending.append((millisecs, callable, args, kw))
+
+        # If the flag is set, the dispatcher either hasn't been woken up yet
+        # or hasn't cleared the flag yet, so it will see the new callable.
+        if not self._posted:
+            self._post()
 
     def event(self, event):
         """ QObject event handler.
         """
         if event.type() == self._pyface_event:
-            # Invoke the callable (puts it at the end of the event queue)
-            QtCore.QTimer.singleShot(self._ms, self._dispatch)
+            self._dispatch()
             return True
 
         return super().event(event)
 
-    def _dispatch(self):
-        """ Invoke the callable.
-        """
-        try:
-            self._callable(*self._args, **self._kw)
-        finally:
-            self._finished()
+    def _post(self):
+        """ Post an event to wake up the dispatcher. """
+        self._posted = True
+
+        # Post an event to be dispatched on the main GUI thread. Note that
+        # we do not call QTimer.singleShot here, which would be simpler,
+        # because that only works on QThreads. We want regular Python threads
+        # to work.
+        event = QtCore.QEvent(self._pyface_event)
+        QtGui.QApplication.postEvent(self, event)
 
-    def _finished(self):
-        """ Remove the call from the list, so it can be garbage collected.
+    def _dispatch(self):
+        """ Invoke the callables that are pending.
         """
-        self._calls_mutex.lock()
-        try:
-            self._calls.remove(self)
-        finally:
-            self._calls_mutex.unlock()
+        # Clear the flag before taking callables, so that any callable added
+        # from now on posts a new event if it isn't taken by this batch.
+        self._posted = False
+
+        pending = self._pending
+        for i in range(len(pending)):
+            if i > 0 and self._past_deadline():
+                # Leave the rest of the batch for a later event.
+                if pending and not self._posted:
+                    self._post()
+                break
+
+            try:
+                millisecs, callable, args, kw = pending.popleft()
+            except IndexError:
+                # a nested event loop has already dispatched the rest
+                break
+
+            try:
+                if millisecs > 0:
+                    QtCore.QTimer.singleShot(
+                        millisecs, functools.partial(callable, *args, **kw)
+                    )
+                else:
+                    callable(*args, **kw)
+            except BaseException:
+                # Make sure the rest of the batch is still dispatched.
+                if pending and not self._posted:
+                    self._post()
+                raise
+
+    def _past_deadline(self):
+        """ Whether the time allowed for processing events has run out. """
+        deadline = self.deadline
+        return deadline is not None and time.perf_counter() >= deadline
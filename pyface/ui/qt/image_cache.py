@@ -19,44 +19,60 @@ from traits.api import HasTraits, provides
 
 
 from pyface.i_image_cache import IImageCache, MImageCache
+from pyface.resource.api import DecodedImageCache
+from pyface.resource.resource_reference import file_source
+from pyface.resource_manager import decoded_image_cache, resource_manager
+
+
+#: The default maximum number of bytes of pixel data held by the shared
+#: cache of scaled images.
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+#: The cache of scaled images shared by all image caches.  Images are keyed
+#: on the file they came from and their (width, height, device pixel ratio),
+#: so caches for different sizes don't evict each other's images.  The limit
+#: can be changed via its ``max_bytes`` attribute.
+scaled_image_cache = DecodedImageCache(
+    resource_manager.resource_factory, DEFAULT_MAX_BYTES
+)
 
 
 @provides(IImageCache)
 class ImageCache(MImageCache, HasTraits):
     """ The toolkit specific implementation of an ImageCache.  See the
     IImageCache interface for the API documentation.
+
+    Images are scaled for the device pixel ratio of the application, unless
+    a device pixel ratio is given explicitly.
     """
 
     # ------------------------------------------------------------------------
     # 'object' interface.
     # ------------------------------------------------------------------------
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, device_pixel_ratio=None):
         self._width = width
         self._height = height
+        self._device_pixel_ratio = device_pixel_ratio
 
     # ------------------------------------------------------------------------
     # 'ImageCache' interface.
     # ------------------------------------------------------------------------
 
     def get_image(self, filename):
-        image = QtGui.QPixmapCache.find(filename)
-
-        if image is not None:
-            scaled = self._qt4_scale(image)
-
-            if scaled is not image:
-                # The Qt cache is application wide so we only keep the last
-                # size asked for.
-                QtGui.QPixmapCache.remove(filename)
-                QtGui.QPixmapCache.insert(filename, scaled)
-        else:
-            # Load the image from the file and add it to the cache.
-            image = QtGui.QPixmap(filename)
-            scaled = self._qt4_scale(image)
-            QtGui.QPixmapCache.insert(filename, scaled)
-
-        return scaled
+        device_pixel_ratio = self._get_device_pixel_ratio()
+        source = file_source(filename)
+        if source is None:
+            # Nothing to share the image with, so just load it.
+            return self._qt4_scale(
+                self._load_image(filename), device_pixel_ratio
+            )
+
+        key = (source, (self._width, self._height, device_pixel_ratio))
+        return scaled_image_cache.get_image(
+            key,
+            lambda: self._load_scaled_image(key, filename, device_pixel_ratio),
+        )
 
     # Qt doesn't distinguish between bitmaps and images.
     get_bitmap = get_image
@@ -65,12 +81,48 @@ class ImageCache(MImageCache, HasTraits):
     # Private 'ImageCache' interface.
     # ------------------------------------------------------------------------
 
-    def _qt4_scale(self, image):
+    def _load_image(self, filename):
+        """ Loads the unscaled image, sharing it with other image users. """
+        return decoded_image_cache.get_file_image(filename)
+
+    def _load_scaled_image(self, key, filename, device_pixel_ratio):
+        """ Loads and scales an image, using the persistent image cache if
+        there is one.
+        """
+        def read_data():
+            with open(filename, "rb") as fp:
+                return fp.read()
+
+        image = decoded_image_cache.load_persistent(
+            key,
+            lambda: self._qt4_scale(
+                self._load_image(filename), device_pixel_ratio
+            ),
+            read_data,
+        )
+        image.setDevicePixelRatio(device_pixel_ratio)
+        return image
+
+    def _get_device_pixel_ratio(self):
+        """ The device pixel ratio to scale images for. """
+        if self._device_pixel_ratio is not None:
+            return self._device_pixel_ratio
+
+        app = QtGui.QGuiApplication.instance()
+        if app is None:
+            return 1.0
+        return app.devicePixelRatio()
+
+    def _qt4_scale(self, image, device_pixel_ratio=1.0):
         """ Scales the given image if necessary. """
 
+        width = round(self._width * device_pixel_ratio)
+        height = round(self._height * device_pixel_ratio)
+
         # Although Qt won't scale the image if it doesn't need to, it will make
         # a deep copy which we don't need.
-        if image.width() != self._width or image.height() != self._height:
-            image = image.scaled(self._width, self._height)
+        if image.width() != width or image.height() != height:
+            image = image.scaled(width, height)
+        image.setDevicePixelRatio(device_pixel_ratio)
 
         return image
@@ -0,0 +1,272 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Background decoding of images for Qt.
+
+Decoding large numbers of images (for example, thumbnails in a data view)
+on the GUI thread can block the user interface for seconds.  The image loader
+reads and decodes images into ``QImage`` objects on a pool of worker threads,
+which is safe in Qt, and returns a placeholder immediately.  Once an image is
+ready, it is converted to a ``QPixmap`` on the GUI thread, added to the
+shared decoded image cache, and handed to the callback of each consumer that
+asked for it.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from pyface.i_image_resource import IImageResource
+from pyface.qt import QtCore, QtGui
+
+
+logger = logging.getLogger(__name__)
+
+#: The shared image loader, created on first use.
+_image_loader = None
+
+
+def get_image_loader():
+    """ Return the shared image loader, creating it if needed.
+
+    This must be called from the GUI thread.
+
+    Returns
+    -------
+    image_loader : ImageLoader
+        The shared image loader.
+    """
+    global _image_loader
+
+    if _image_loader is None:
+        _image_loader = ImageLoader()
+    return _image_loader
+
+
+class ImageLoader(QtCore.QObject):
+    """ Decodes images on a pool of worker threads.
+
+    The loader must be created on the GUI thread, and all of its public
+    methods must be called from the GUI thread.  Callbacks are also called
+    on the GUI thread.
+
+    Parameters
+    ----------
+    max_workers : int or None
+        The maximum number of worker threads.  If None, the default for a
+        ThreadPoolExecutor is used.
+    parent : QObject or None
+        The parent of the loader.
+    """
+
+    #: Emitted from a worker thread with the cache key of an image and the
+    #: decoded QImage (or None if the image could not be decoded).
+    _image_decoded = QtCore.Signal(object, object)
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        self._max_workers = max_workers
+        self._executor = None
+        # mapping from cache key to (reference, list of callbacks)
+        self._pending = {}
+        self._image_decoded.connect(self._on_image_decoded)
+
+    def load_image(self, image, callback, size=None):
+        """ Get a toolkit image, decoding it in the background if needed.
+
+        If the image has already been decoded it is returned immediately and
+        the callback is not called.  Otherwise a placeholder is returned,
+        and the callback is called with the toolkit image once it is ready.
+        Images that can't be decoded in the background (for example array
+        images) are created immediately.
+
+        Parameters
+        ----------
+        image : IImage
+            The image to load.
+        callback : callable
+            A callable which takes the toolkit image as its argument.
+        size : (int, int) or None
+            The preferred size of the image, if any.  This is also the size
+            of the placeholder.
+
+        Returns
+        -------
+        image : QPixmap
+            The toolkit image, or a placeholder.
+        """
+        toolkit_image, pending = self.request_image(image, callback, size)
+        return toolkit_image
+
+    def request_image(self, image, callback, size=None):
+        """ Get a toolkit image, and whether it is being decoded.
+
+        This is the same as :py:meth:`load_image` except that it also
+        reports whether a placeholder was returned.
+
+        Parameters
+        ----------
+        image : IImage
+            The image to load.
+        callback : callable
+            A callable which takes the toolkit image as its argument.
+        size : (int, int) or None
+            The preferred size of the image, if any.  This is also the size
+            of the placeholder.
+
+        Returns
+        -------
+        image : QPixmap
+            The toolkit image, or a placeholder.
+        pending : bool
+            True if a placeholder was returned and the callback will be
+            called once the image is ready.
+        """
+        from pyface.resource_manager import decoded_image_cache
+
+        reference = None
+        if isinstance(image, IImageResource):
+            reference = image.get_reference(size)
+        if reference is None:
+            return image.create_bitmap(size), False
+
+        key = decoded_image_cache.reference_key(reference)
+        if key is None:
+            return image.create_bitmap(size), False
+
+        toolkit_image = decoded_image_cache.find_image(key)
+        if toolkit_image is not None:
+            return toolkit_image, False
+
+        if key in self._pending:
+            self._pending[key][1].append(callback)
+        else:
+            self._pending[key] = (reference, [callback])
+            self._get_executor().submit(self._decode, key, reference)
+
+        return self.create_placeholder(size), True
+
+    def load_icon(self, image, callback, size=None):
+        """ Get a toolkit icon, decoding the image in the background if needed.
+
+        Parameters
+        ----------
+        image : IImage
+            The image to load.
+        callback : callable
+            A callable which takes the QIcon as its argument.
+        size : (int, int) or None
+            The preferred size of the image, if any.  This is also the size
+            of the placeholder.
+
+        Returns
+        -------
+        icon : QIcon
+            The toolkit icon, or a placeholder.
+        """
+        pixmap = self.load_image(
+            image, lambda pixmap: callback(QtGui.QIcon(pixmap)), size
+        )
+        return QtGui.QIcon(pixmap)
+
+    def create_placeholder(self, size=None):
+        """ Create a placeholder for an image that is being loaded.
+
+        Parameters
+        ----------
+        size : (int, int) or None
+            The size of the placeholder.  If None, an empty image is
+            returned.
+
+        Returns
+        -------
+        placeholder : QPixmap
+            A transparent image.
+        """
+        if size is None:
+            return QtGui.QPixmap()
+
+        placeholder = QtGui.QPixmap(*size)
+        placeholder.fill(QtCore.Qt.GlobalColor.transparent)
+        return placeholder
+
+    def is_pending(self):
+        """ Whether any images are waiting to be decoded.
+
+        Returns
+        -------
+        pending : bool
+            True if some images have not been delivered yet.
+        """
+        return bool(self._pending)
+
+    def shutdown(self, wait=True):
+        """ Stop the worker threads.
+
+        Images which are still being decoded are not delivered.  The loader
+        starts new worker threads if it is used again.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for the worker threads to finish.
+        """
+        executor = self._executor
+        self._executor = None
+        self._pending = {}
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _get_executor(self):
+        """ Get the executor, starting it if needed. """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="pyface-image-loader",
+            )
+        return self._executor
+
+    def _decode(self, key, reference):
+        """ Read and decode an image.  This runs on a worker thread. """
+        try:
+            image = QtGui.QImage.fromData(reference.read_data())
+            if image.isNull():
+                # let the GUI thread load it the usual way
+                image = None
+        except Exception:
+            logger.debug("Could not decode image %r", key, exc_info=True)
+            image = None
+
+        self._image_decoded.emit(key, image)
+
+    def _on_image_decoded(self, key, image):
+        """ Deliver a decoded image to its consumers on the GUI thread. """
+        from pyface.resource_manager import decoded_image_cache
+
+        if key not in self._pending:
+            # the loader was shut down
+            return
+
+        reference, callbacks = self._pending.pop(key)
+        if image is None:
+            pixmap = decoded_image_cache.get_reference_image(reference)
+        else:
+            pixmap = decoded_image_cache.get_image(
+                key, lambda: QtGui.QPixmap.fromImage(image)
+            )
+
+        for callback in callbacks:
+            try:
+                callback(pixmap)
+            except Exception:
+                logger.exception("Image loader callback %r failed", callback)
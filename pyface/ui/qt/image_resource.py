@@ -55,7 +55,9 @@ class ImageResource(MImageResource, HasTraits):
         ref = self._get_ref(size)
 
         if ref is not None:
-            image = ref.load()
+            from pyface.resource_manager import decoded_image_cache
+
+            image = decoded_image_cache.get_reference_image(ref)
         else:
             image = self._get_image_not_found_image()
 
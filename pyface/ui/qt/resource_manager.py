@@ -12,7 +12,7 @@
 # However, when used with the GPL version of PyQt the additional terms described in the PyQt GPL exception also apply
 
 
-from pyface.qt import QtCore, QtGui, QtSvg
+from pyface.qt import QtCore, QtGui, QtSvg, qt_api
 
 
 from pyface.resource.api import ResourceFactory
@@ -49,3 +49,51 @@ class PyfaceResourceFactory(ResourceFactory):
         image.loadFromData(data)
 
         return image
+
+    def image_nbytes(self, image):
+        """ Returns the number of bytes of pixel data held by an image. """
+
+        return image.width() * image.height() * image.depth() // 8
+
+    def copy_image(self, image):
+        """ Returns a copy of an image which can be modified independently.
+        """
+
+        # Qt images are implicitly shared, so this copy is cheap and only
+        # copies the pixel data if one of the images is modified.
+        copy = type(image)(image)
+
+        # keep references to any Python objects holding the pixel data
+        for name in ["_image", "_numpy_data"]:
+            if hasattr(image, name):
+                setattr(copy, name, getattr(image, name))
+
+        return copy
+
+    def image_region(self, image, x, y, width, height):
+        """ Returns a copy of a rectangular region of an image. """
+
+        return image.copy(x, y, width, height)
+
+    def image_pixels(self, image):
+        """ Returns the (width, height, RGBA bytes) of an image. """
+
+        if isinstance(image, QtGui.QPixmap):
+            image = image.toImage()
+        # rows of RGBA8888 images are never padded
+        image = image.convertToFormat(QtGui.QImage.Format.Format_RGBA8888)
+        bits = image.constBits()
+        if qt_api in {"pyqt", "pyqt5", "pyqt6"}:
+            bits.setsize(image.sizeInBytes())
+
+        return image.width(), image.height(), bytes(bits)
+
+    def image_from_pixels(self, width, height, pixels):
+        """ Creates an image from RGBA bytes. """
+
+        image = QtGui.QImage(
+            pixels, width, height, 4 * width,
+            QtGui.QImage.Format.Format_RGBA8888,
+        )
+        # the QImage doesn't own the pixel data, so copy it
+        return QtGui.QPixmap.fromImage(image.copy())
@@ -12,13 +12,18 @@ Qt-specific tests for the Qt GUI implementation.
 """
 
 
+import threading
+import time
 import unittest
+from unittest import mock
 
 from traits.api import Event, HasStrictTraits, Instance
 
 from pyface.api import GUI
 from pyface.i_gui import IGUI
-from pyface.qt import QtCore
+from pyface.qt import QtCore, QtGui
+from pyface.ui.qt.gui import _Dispatcher
+from pyface.ui.qt.util.gui_test_assistant import GuiTestAssistant
 from pyface.util.guisupport import get_app_qt4, is_event_loop_running_qt4
 
 
@@ -81,3 +86,108 @@ class TestGui(unittest.TestCase):
             qt_app.sendPostedEvents()
 
         self.assertTrue(application_running[0])
+
+
+class TestDispatcher(GuiTestAssistant, unittest.TestCase):
+
+    def test_invoke_later_from_threads(self):
+        results = []
+
+        def produce(thread_index):
+            for i in range(1000):
+                GUI.invoke_later(results.append, (thread_index, i))
+
+        threads = [
+            threading.Thread(target=produce, args=(index,))
+            for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.event_loop_until_condition(lambda: len(results) == 4000):
+            pass
+        for index in range(4):
+            self.assertEqual(
+                [i for thread_index, i in results if thread_index == index],
+                list(range(1000)),
+            )
+
+    def test_one_event_per_batch(self):
+        results = []
+        with mock.patch.object(
+            QtGui.QApplication, "postEvent", wraps=QtGui.QApplication.postEvent
+        ) as post_event:
+            for i in range(100):
+                GUI.invoke_later(results.append, i)
+
+            with self.event_loop_until_condition(lambda: len(results) == 100):
+                pass
+
+        self.assertEqual(results, list(range(100)))
+        self.assertEqual(post_event.call_count, 1)
+
+    def test_invoke_later_from_callable(self):
+        # callables added while dispatching run in a later batch
+        results = []
+
+        def callable():
+            results.append("first")
+            GUI.invoke_later(results.append, "third")
+
+        GUI.invoke_later(callable)
+        GUI.invoke_later(results.append, "second")
+
+        with self.event_loop_until_condition(lambda: len(results) == 3):
+            pass
+        self.assertEqual(results, ["first", "second", "third"])
+
+    def test_invoke_after(self):
+        results = []
+
+        GUI.invoke_after(50, results.append, "later")
+        GUI.invoke_later(results.append, "sooner")
+
+        with self.event_loop_until_condition(lambda: len(results) == 2):
+            pass
+        self.assertEqual(results, ["sooner", "later"])
+
+    def test_exception_does_not_drop_batch(self):
+        results = []
+
+        def fail():
+            raise ZeroDivisionError()
+
+        with mock.patch("sys.excepthook") as excepthook:
+            GUI.invoke_later(results.append, 1)
+            GUI.invoke_later(fail)
+            GUI.invoke_later(results.append, 2)
+
+            with self.event_loop_until_condition(lambda: len(results) == 2):
+                pass
+
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(excepthook.call_count, 1)
+        self.assertFalse(_Dispatcher.instance()._pending)
+
+    def test_process_events_max_time(self):
+        results = []
+
+        def slow(i):
+            time.sleep(0.005)
+            results.append(i)
+
+        for i in range(100):
+            GUI.invoke_later(slow, i)
+
+        GUI.process_events(max_time_ms=50)
+
+        # the batch is interrupted when the time is up, and the rest of it
+        # is dispatched later
+        self.assertGreater(len(results), 0)
+        self.assertLess(len(results), 100)
+        self.assertIsNone(_Dispatcher.instance().deadline)
+        with self.event_loop_until_condition(lambda: len(results) == 100):
+            pass
+        self.assertEqual(results, list(range(100)))
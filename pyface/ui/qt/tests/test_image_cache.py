@@ -0,0 +1,120 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pyface.resource.api import PersistentImageCache
+from pyface.resource_manager import decoded_image_cache, resource_manager
+from pyface.ui.qt.image_cache import ImageCache, scaled_image_cache
+
+IMAGE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "tests", "images", "core.png"
+)
+
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        scaled_image_cache.clear()
+        scaled_image_cache.reset_statistics()
+        self.addCleanup(scaled_image_cache.clear)
+        decoded_image_cache.clear()
+        decoded_image_cache.reset_statistics()
+        self.addCleanup(decoded_image_cache.clear)
+
+    def test_different_sizes_kept(self):
+        small_cache = ImageCache(16, 16, 1.0)
+        large_cache = ImageCache(32, 32, 1.0)
+
+        for i in range(3):
+            small = small_cache.get_image(IMAGE_PATH)
+            large = large_cache.get_image(IMAGE_PATH)
+
+        self.assertEqual(small.width(), 16)
+        self.assertEqual(large.width(), 32)
+        statistics = scaled_image_cache.statistics()
+        self.assertEqual(statistics.misses, 2)
+        self.assertEqual(statistics.hits, 4)
+        # the source image is only decoded once
+        self.assertEqual(decoded_image_cache.statistics().misses, 1)
+
+    def test_device_pixel_ratio(self):
+        image_cache = ImageCache(16, 16, 2.0)
+
+        image = image_cache.get_image(IMAGE_PATH)
+
+        self.assertEqual(image.width(), 32)
+        self.assertEqual(image.devicePixelRatio(), 2.0)
+
+    def test_device_pixel_ratio_in_key(self):
+        ImageCache(16, 16, 1.0).get_image(IMAGE_PATH)
+        ImageCache(16, 16, 2.0).get_image(IMAGE_PATH)
+
+        self.assertEqual(scaled_image_cache.statistics().count, 2)
+
+    def test_max_bytes(self):
+        self.addCleanup(
+            setattr, scaled_image_cache, "max_bytes",
+            scaled_image_cache.max_bytes,
+        )
+        # room for a single 32 x 32 image
+        scaled_image_cache.max_bytes = 32 * 32 * 4
+
+        ImageCache(32, 32, 1.0).get_image(IMAGE_PATH)
+        ImageCache(16, 16, 1.0).get_image(IMAGE_PATH)
+
+        statistics = scaled_image_cache.statistics()
+        self.assertEqual(statistics.count, 1)
+        self.assertEqual(statistics.evictions, 1)
+
+    def test_persistent_cache(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.addCleanup(setattr, decoded_image_cache, "persistent_cache", None)
+        decoded_image_cache.persistent_cache = PersistentImageCache(
+            tmpdir.name
+        )
+        image_1 = ImageCache(16, 16, 2.0).get_image(IMAGE_PATH)
+
+        # simulate a new session
+        scaled_image_cache.clear()
+        decoded_image_cache.clear()
+        with mock.patch.object(
+            resource_manager.resource_factory, "image_from_file"
+        ) as image_from_file:
+            image_2 = ImageCache(16, 16, 2.0).get_image(IMAGE_PATH)
+
+        image_from_file.assert_not_called()
+        self.assertEqual(image_2.width(), 32)
+        self.assertEqual(image_2.devicePixelRatio(), 2.0)
+        resource_factory = resource_manager.resource_factory
+        self.assertEqual(
+            resource_factory.image_pixels(image_1),
+            resource_factory.image_pixels(image_2),
+        )
+
+
+class TestResourceFactoryPixels(unittest.TestCase):
+
+    def test_pixels_round_trip(self):
+        resource_factory = resource_manager.resource_factory
+        image = resource_factory.image_from_file(IMAGE_PATH)
+
+        width, height, pixels = resource_factory.image_pixels(image)
+        new_image = resource_factory.image_from_pixels(width, height, pixels)
+
+        self.assertEqual((width, height), (64, 64))
+        self.assertEqual(len(pixels), 64 * 64 * 4)
+        self.assertEqual(
+            resource_factory.image_pixels(new_image), (width, height, pixels)
+        )
@@ -0,0 +1,133 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
+from pyface.array_image import ArrayImage
+from pyface.image_resource import ImageResource
+from pyface.qt import QtGui
+from pyface.resource_manager import decoded_image_cache
+from pyface.ui.qt.fields.image_field import ImageField
+from pyface.ui.qt.image_loader import ImageLoader
+from pyface.ui.qt.util.gui_test_assistant import GuiTestAssistant
+
+IMAGE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "tests", "images", "core.png"
+)
+
+
+class TestImageLoader(GuiTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        shutil.copyfile(IMAGE_PATH, os.path.join(self.tmpdir.name, "core.png"))
+        self.image = ImageResource("core", search_path=[self.tmpdir.name])
+        decoded_image_cache.clear()
+        self.addCleanup(decoded_image_cache.clear)
+        self.loader = ImageLoader(max_workers=2)
+        self.addCleanup(self.loader.shutdown)
+
+    def test_load_image(self):
+        results = []
+
+        placeholder = self.loader.load_image(self.image, results.append)
+
+        self.assertIsInstance(placeholder, QtGui.QPixmap)
+        self.assertTrue(placeholder.isNull())
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertEqual(results[0].width(), 64)
+        self.assertFalse(self.loader.is_pending())
+
+        # once decoded, the image is available immediately
+        image, pending = self.loader.request_image(self.image, results.append)
+
+        self.assertFalse(pending)
+        self.assertEqual(image.width(), 64)
+
+    def test_load_image_placeholder_size(self):
+        results = []
+
+        placeholder = self.loader.load_image(
+            self.image, results.append, (16, 16)
+        )
+
+        self.assertEqual((placeholder.width(), placeholder.height()), (16, 16))
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+
+    def test_load_image_coalesced(self):
+        results = []
+
+        self.loader.load_image(self.image, results.append)
+        self.loader.load_image(self.image, results.append)
+
+        self.assertEqual(len(self.loader._pending), 1)
+        with self.event_loop_until_condition(lambda: len(results) == 2):
+            pass
+        self.assertEqual(decoded_image_cache.statistics().count, 1)
+
+    def test_load_icon(self):
+        results = []
+
+        icon = self.loader.load_icon(self.image, results.append, (16, 16))
+
+        self.assertIsInstance(icon, QtGui.QIcon)
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertIsInstance(results[0], QtGui.QIcon)
+        self.assertFalse(results[0].isNull())
+
+    def test_load_image_not_decodable(self):
+        filename = os.path.join(self.tmpdir.name, "bad.png")
+        with open(filename, "wb") as fp:
+            fp.write(b"not an image")
+        image = ImageResource("bad", search_path=[self.tmpdir.name])
+        results = []
+
+        self.loader.load_image(image, results.append)
+
+        with self.event_loop_until_condition(lambda: len(results) == 1):
+            pass
+        self.assertTrue(results[0].isNull())
+
+    @requires_numpy
+    def test_load_array_image(self):
+        image = ArrayImage(data=np.full((10, 20, 4), 0xFF, dtype="uint8"))
+        results = []
+
+        toolkit_image, pending = self.loader.request_image(
+            image, results.append
+        )
+
+        self.assertFalse(pending)
+        self.assertIsInstance(toolkit_image, QtGui.QPixmap)
+        self.assertEqual(toolkit_image.width(), 20)
+
+    def test_image_field(self):
+        field = ImageField(async_images=True, value=self.image)
+        field.create()
+        self.addCleanup(field.destroy)
+
+        self.assertTrue(field.control.pixmap().isNull())
+
+        # use the shared loader, as the field does
+        with self.event_loop_until_condition(
+            lambda: not field.control.pixmap().isNull()
+        ):
+            pass
+        self.assertEqual(field.control.pixmap().width(), 64)
@@ -0,0 +1,99 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+from unittest import mock
+
+from pyface.timer.api import CallbackTimer
+from pyface.ui.qt.timer.timer_wheel import TimerWheel, resolution_for
+from pyface.ui.qt.util.gui_test_assistant import GuiTestAssistant
+
+
+class TestResolutionFor(unittest.TestCase):
+
+    def test_resolution_for(self):
+        self.assertEqual(resolution_for(0.0), 1)
+        self.assertEqual(resolution_for(0.016), 1)
+        self.assertEqual(resolution_for(0.05), 10)
+        self.assertEqual(resolution_for(0.5), 50)
+        self.assertEqual(resolution_for(1.0), 250)
+        self.assertEqual(resolution_for(60.0), 1000)
+
+
+class TestTimerWheel(GuiTestAssistant, unittest.TestCase):
+
+    def test_shared_timers_share_qtimer(self):
+        wheel = TimerWheel.instance()
+        timers = [
+            CallbackTimer(callback=lambda: None, interval=0.05, shared=True)
+            for i in range(100)
+        ]
+        for timer in timers:
+            timer.start()
+        try:
+            self.assertEqual(len(wheel), 100)
+            self.assertTrue(all(timer._timer is None for timer in timers))
+            bucket = wheel._buckets[10]
+            self.assertTrue(bucket.qtimer.isActive())
+        finally:
+            for timer in timers:
+                timer.stop()
+
+        self.assertEqual(len(wheel), 0)
+        self.assertFalse(bucket.qtimer.isActive())
+        self.assertEqual(bucket.heap, [])
+
+    def test_unshared_timer(self):
+        timer = CallbackTimer(callback=lambda: None, interval=0.05)
+        timer.start()
+        try:
+            self.assertIsNotNone(timer._timer)
+            self.assertNotIn(timer, TimerWheel.instance()._timer_buckets)
+        finally:
+            timer.stop()
+
+    def test_restart_many_times(self):
+        wheel = TimerWheel.instance()
+        timer = CallbackTimer(callback=lambda: None, interval=1.0, shared=True)
+        for i in range(1000):
+            timer.start()
+            timer.stop()
+
+        # stopped timers don't accumulate in the heap
+        self.assertLess(len(wheel._buckets[250].heap), 100)
+
+    def test_exception_does_not_lose_timers(self):
+        results = []
+
+        def fail():
+            raise ZeroDivisionError()
+
+        with mock.patch("sys.excepthook") as excepthook:
+            failing = CallbackTimer.timer(
+                callback=fail, interval=0.05, shared=True
+            )
+            other = CallbackTimer.timer(
+                callback=lambda: results.append(1),
+                interval=0.05,
+                repeat=2,
+                shared=True,
+            )
+            try:
+                with self.event_loop_until_condition(
+                    lambda: not other.active
+                ):
+                    pass
+            finally:
+                failing.stop()
+                other.stop()
+
+        # the failing timer is stopped, but the other one continues
+        self.assertEqual(excepthook.call_count, 1)
+        self.assertEqual(results, [1, 1])
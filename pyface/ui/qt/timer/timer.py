@@ -13,21 +13,30 @@ from traits.api import Instance
 
 from pyface.qt.QtCore import QTimer
 from pyface.timer.i_timer import BaseTimer
+from pyface.ui.qt.timer.timer_wheel import TimerWheel
 
 
 class PyfaceTimer(BaseTimer):
-    """ Abstract base class for Qt toolkit timers. """
+    """ Abstract base class for Qt toolkit timers.
 
-    #: The QTimer for the PyfaceTimer.
-    _timer = Instance(QTimer, (), allow_none=False)
+    Shared timers are run by the :py:class:`TimerWheel`, and only unshared
+    timers create a QTimer of their own.
+    """
 
-    def __init__(self, **traits):
-        traits.setdefault("_timer", QTimer())
-        super().__init__(**traits)
-        self._timer.timeout.connect(self.perform)
+    #: The QTimer for the PyfaceTimer, if it isn't shared.
+    _timer = Instance(QTimer)
 
     def _start(self):
+        if self.shared:
+            TimerWheel.instance().add(self)
+            return
+
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.timeout.connect(self.perform)
         self._timer.start(int(self.interval * 1000))
 
     def _stop(self):
-        self._timer.stop()
+        TimerWheel.instance().remove(self)
+        if self._timer is not None:
+            self._timer.stop()
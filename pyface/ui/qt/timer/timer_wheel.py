@@ -0,0 +1,232 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+""" A scheduler which runs many timers from a few shared QTimers.
+
+Each shared timer is assigned to a bucket according to its interval, and
+each bucket keeps a heap of the times at which its timers are due, with a
+single-shot QTimer armed for the earliest of them.  Due times are rounded up
+to a multiple of the bucket's resolution, so that timers which are due at
+about the same time are performed by the same QTimer event.
+"""
+
+import heapq
+import itertools
+import math
+
+from pyface.qt import QtCore
+from pyface.timer.i_timer import perf_counter
+
+#: The resolutions of the buckets, in milliseconds.
+RESOLUTIONS = (1, 10, 50, 250, 1000)
+
+#: Timers use the coarsest resolution which is at most this fraction of their
+#: interval, so they are performed at most this fraction of an interval late.
+RESOLUTION_FRACTION = 0.25
+
+#: Buckets with at least this resolution use coarse QTimers, which the
+#: operating system may batch with other timers.
+COARSE_RESOLUTION = 50
+
+
+def resolution_for(interval):
+    """ The bucket resolution to use for a timer interval.
+
+    Parameters
+    ----------
+    interval : float
+        The interval of the timer, in seconds.
+
+    Returns
+    -------
+    resolution : int
+        The resolution of the bucket, in milliseconds.
+    """
+    limit = interval * 1000 * RESOLUTION_FRACTION
+    candidates = [res for res in RESOLUTIONS if res <= limit]
+    return candidates[-1] if candidates else RESOLUTIONS[0]
+
+
+class _Bucket:
+    """ The timers of one resolution, run from a single QTimer. """
+
+    def __init__(self, wheel, resolution):
+        self.wheel = wheel
+        self.resolution = resolution
+
+        # The heap of [due, sequence, timer, expiring] entries.  Entries of
+        # timers which are stopped are marked by setting the timer to None,
+        # and discarded when they reach the top of the heap.
+        self.heap = []
+
+        # The live entry of each timer.
+        self.entries = {}
+
+        self.qtimer = QtCore.QTimer()
+        self.qtimer.setSingleShot(True)
+        if resolution >= COARSE_RESOLUTION:
+            self.qtimer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        else:
+            self.qtimer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.qtimer.timeout.connect(self.run)
+
+    def schedule(self, timer, due, sequence):
+        """ Schedule a timer to be performed at a perf_counter time. """
+        expiring = False
+        if timer.expire is not None:
+            expire_time = timer._start_time + timer.expire
+            if due > expire_time:
+                # stop the timer when it expires, rather than leaving it
+                # active until its next tick
+                due = expire_time
+                expiring = True
+
+        entry = [due, sequence, timer, expiring]
+        self.entries[timer] = entry
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] is entry:
+            self._arm()
+
+    def remove(self, timer):
+        """ Remove a timer, if it is in the bucket. """
+        entry = self.entries.pop(timer, None)
+        if entry is None:
+            return
+        entry[2] = None
+
+        # Don't let stopped timers accumulate.
+        if len(self.heap) > 2 * len(self.entries) + 64:
+            self.heap = [entry for entry in self.heap if entry[2] is not None]
+            heapq.heapify(self.heap)
+        self._arm()
+
+    def run(self):
+        """ Perform the timers which are due. """
+        now = perf_counter()
+        due_entries = []
+        while self.heap and (self.heap[0][2] is None or self.heap[0][0] <= now):
+            entry = heapq.heappop(self.heap)
+            if entry[2] is not None:
+                due_entries.append(entry)
+
+        index = -1
+        try:
+            for index, entry in enumerate(due_entries):
+                due, sequence, timer, expiring = entry
+                if self.entries.get(timer) is not entry:
+                    # stopped or restarted by an earlier timer
+                    continue
+                del self.entries[timer]
+                self.wheel._perform(timer, due, sequence, expiring)
+        finally:
+            # If a timer raised, make sure the rest are not lost.
+            for entry in due_entries[index + 1:]:
+                if self.entries.get(entry[2]) is entry:
+                    heapq.heappush(self.heap, entry)
+            self._arm()
+
+    def _arm(self):
+        """ Start the QTimer for the earliest timer, or stop it if none. """
+        heap = self.heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        if not heap:
+            self.qtimer.stop()
+            return
+
+        resolution = self.resolution / 1000.0
+        slot = math.ceil(heap[0][0] / resolution) * resolution
+        delay = max(0, math.ceil((slot - perf_counter()) * 1000))
+        self.qtimer.start(delay)
+
+
+class TimerWheel:
+    """ Runs many Pyface timers from a few shared QTimers.
+
+    This must only be used from the GUI thread.
+    """
+
+    #: The shared timer wheel, created on first use.
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """ Get the shared timer wheel, creating it if needed. """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        # The buckets, created as needed, keyed by resolution.
+        self._buckets = {}
+
+        # The bucket of each timer in the wheel.
+        self._timer_buckets = {}
+
+        # Break ties between timers due at the same time in start order.
+        self._sequence = itertools.count()
+
+    def add(self, timer):
+        """ Start running a timer.
+
+        Parameters
+        ----------
+        timer : PyfaceTimer
+            The timer, whose interval is used for the first tick.
+        """
+        self.remove(timer)
+        self._schedule(
+            timer, perf_counter() + timer.interval, next(self._sequence)
+        )
+
+    def remove(self, timer):
+        """ Stop running a timer, if it is running.
+
+        Parameters
+        ----------
+        timer : PyfaceTimer
+            The timer.
+        """
+        bucket = self._timer_buckets.pop(timer, None)
+        if bucket is not None:
+            bucket.remove(timer)
+
+    def __len__(self):
+        return len(self._timer_buckets)
+
+    def _schedule(self, timer, due, sequence):
+        """ Put a timer in the bucket for its interval. """
+        resolution = resolution_for(timer.interval)
+        bucket = self._buckets.get(resolution)
+        if bucket is None:
+            bucket = self._buckets[resolution] = _Bucket(self, resolution)
+        self._timer_buckets[timer] = bucket
+        bucket.schedule(timer, due, sequence)
+
+    def _perform(self, timer, due, sequence, expiring):
+        """ Perform a timer which is due and schedule its next tick. """
+        del self._timer_buckets[timer]
+        if expiring:
+            timer.stop()
+            return
+
+        try:
+            timer.perform()
+        finally:
+            # Schedule from the due time rather than the current time, so
+            # that repeating timers don't drift.  Ticks which have been
+            # missed entirely are skipped.  Timers which were stopped or
+            # restarted while performing are left alone.
+            if timer._active and timer not in self._timer_buckets:
+                interval = timer.interval
+                next_due = due + interval
+                now = perf_counter()
+                if interval > 0 and next_due < now:
+                    next_due += interval * math.ceil((now - next_due) / interval)
+                self._schedule(timer, next_due, sequence)
@@ -93,57 +93,75 @@ def resize_bitmap(bitmap, size, aspect_ratio=AspectRatio.ignore,
     return bitmap.scaled(*size, aspect_ratio.value, mode.value)
 
 
-def image_to_array(image):
+def image_to_array(image, copy=True):
     """ Convert a QImage to a numpy array.
 
-    This copies the data returned from Qt.
-
     Parameters
     ----------
     image : QImage
         The QImage that we want to extract the values from.  The format must
-        be either RGB32 or ARGB32.
+        be one of RGB32, ARGB32, ARGB32_Premultiplied, RGBA8888, RGBX8888 or
+        RGB888.
+    copy : bool
+        Whether to copy the data returned from Qt.  If False, and the format
+        of the image is RGBA8888, RGBX8888 or RGB888, the array is a view
+        onto the pixel data of the image which keeps the image alive.  Other
+        formats are converted to RGBA8888 by Qt first.
 
     Return
     ------
     array : ndarray
-        An N x M x 4 array of unsigned 8-bit ints as RGBA values.
+        An N x M x 4 array of unsigned 8-bit ints as RGBA values, or an
+        N x M x 3 array of RGB values for RGB888 images.
     """
-    import numpy as np
-
-    width, height = image.width(), image.height()
-    channels = image.pixelFormat().channelCount()
-    data = image.bits()
-    if qt_api in {'pyqt', 'pyqt5'}:
-        data = data.asarray(width * height * channels)
-    array = np.array(data, dtype='uint8')
-    array.shape = (height, width, channels)
-    if image.format() in {QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32}:
-        # comes in as BGRA, but want RGBA
-        array = array[:, :, [2, 1, 0, 3]]
+    image_format = image.format()
+    if image_format == QImage.Format.Format_ARGB32_Premultiplied:
+        # Qt un-premultiplies the alpha while converting
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        image_format = image.format()
+        copy = False
+
+    if image_format in _BGRA_FORMATS:
+        if not copy:
+            image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+            return _image_view(image, 4)
+        # comes in as BGRA, but want RGBA; the fancy index makes the only
+        # copy of the data
+        return _image_view(image, 4)[:, :, [2, 1, 0, 3]]
+    elif image_format in _RGBA_FORMATS:
+        array = _image_view(image, 4)
+    elif image_format == QImage.Format.Format_RGB888:
+        array = _image_view(image, 3)
     else:
         raise ValueError(
             "Unsupported QImage format {}".format(image.format())
         )
+
+    if copy:
+        array = array.copy()
     return array
 
 
-def array_to_image(array):
+def array_to_image(array, copy=True):
     """ Convert a numpy array to a QImage.
 
-    This copies the data before passing it to Qt.
-
     Parameters
     ----------
     array : ndarray
         An N x M x {3, 4} array of unsigned 8-bit ints.  The image
         format is assumed to be RGB or RGBA, based on the shape.
+    copy : bool
+        Whether to copy the data before passing it to Qt.  If False, and
+        the array is laid out in memory the way Qt expects, the image wraps
+        the array's memory directly and keeps the array alive, so changes
+        to the array show up in the image.  Otherwise the data is copied.
 
     Return
     ------
     image : QImage
         The QImage created from the data.  The pixel format is
-        QImage.Format.Format_RGB32.
+        QImage.Format.Format_RGBA8888 for RGBA data, or
+        QImage.Format.Format_RGB888 for RGB data.
     """
     import numpy as np
 
@@ -151,24 +169,86 @@ def array_to_image(array):
         raise ValueError("Array must be either RGB or RGBA values.")
 
     height, width, channels = array.shape
-    data = np.empty((height, width, 4), dtype='uint8')
     if channels == 3:
-        data[:, :, [2, 1, 0]] = array
-        data[:, :, 3] = 0xff
+        image_format = QImage.Format.Format_RGB888
     elif channels == 4:
-        data[:, :, [2, 1, 0, 3]] = array
+        image_format = QImage.Format.Format_RGBA8888
     else:
         raise ValueError("Array must be either RGB or RGBA values.")
 
-    bytes_per_line = 4 * width
-
-    if channels == 3:
-        image = QImage(data.data, width, height, bytes_per_line,
-                       QImage.Format.Format_RGB32)
-
-    elif channels == 4:
-        image = QImage(data.data, width, height, bytes_per_line,
-                       QImage.Format.Format_ARGB32)
+    if copy or not _is_image_layout(array):
+        data = np.array(array, dtype='uint8', order='C')
+    else:
+        data = array
+    bytes_per_line = data.strides[0]
+
+    # a flat view of the memory spanned by the rows, which may be padded
+    buffer = np.lib.stride_tricks.as_strided(
+        data,
+        shape=((height - 1) * bytes_per_line + width * channels,),
+        strides=(1,),
+        writeable=False,
+    )
+    image = QImage(buffer.data, width, height, bytes_per_line, image_format)
     # keep a reference to the array to ensure underlying data is available
     image._numpy_data = data
     return image
+
+
+#: QImage formats which hold 32-bit pixels in native-endian ARGB order.
+_BGRA_FORMATS = {QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32}
+
+#: QImage formats which hold pixels in RGBA byte order.
+_RGBA_FORMATS = {
+    QImage.Format.Format_RGBA8888, QImage.Format.Format_RGBX8888
+}
+
+
+class _ImageBuffer:
+    """ Expose the pixel data of a QImage to numpy.
+
+    Arrays created from this object keep a reference to it, and so to the
+    QImage, which ensures that the pixel data stays available.
+    """
+
+    def __init__(self, image, channels):
+        import numpy as np
+
+        height, width = image.height(), image.width()
+        # non-const access, so the image detaches from any shared copies
+        data = image.bits()
+        if qt_api in {'pyqt', 'pyqt5', 'pyqt6'}:
+            data.setsize(image.sizeInBytes())
+        self.image = image
+        self.__array_interface__ = {
+            'shape': (height, width, channels),
+            'typestr': '|u1',
+            'strides': (image.bytesPerLine(), channels, 1),
+            'data': (np.frombuffer(data, dtype='uint8').ctypes.data, False),
+            'version': 3,
+        }
+
+
+def _image_view(image, channels):
+    """ Return an array which is a view onto the pixel data of a QImage. """
+    import numpy as np
+
+    return np.asarray(_ImageBuffer(image, channels))
+
+
+def _is_image_layout(array):
+    """ Whether a QImage can use the memory of an array directly.
+
+    Pixels within a row must be contiguous, and rows must start on 32-bit
+    boundaries.
+    """
+    height, width, channels = array.shape
+    row_stride, pixel_stride, channel_stride = array.strides
+    return (
+        array.dtype == 'uint8'
+        and channel_stride == 1
+        and pixel_stride == channels
+        and row_stride >= width * channels
+        and row_stride % 4 == 0
+        and array.ctypes.data % 4 == 0
+    )
@@ -157,6 +157,63 @@ class TestArrayImageHelpers(unittest.TestCase):
         self.assertTrue(np.all(array[:, :, 2] == 0xcc))
         self.assertTrue(np.all(array[:, :, 3] == 0xee))
 
+    def test_image_to_array_premultiplied(self):
+        qimage = QImage(32, 64, QImage.Format.Format_ARGB32_Premultiplied)
+        qimage.fill(QColor(0x44, 0x88, 0xcc, 0xff))
+
+        array = image_to_array(qimage)
+
+        self.assertEqual(array.shape, (64, 32, 4))
+        self.assertTrue(np.all(array == [0x44, 0x88, 0xcc, 0xff]))
+
+    def test_image_to_array_rgba8888(self):
+        qimage = QImage(32, 64, QImage.Format.Format_RGBA8888)
+        qimage.fill(QColor(0x44, 0x88, 0xcc, 0xee))
+
+        array = image_to_array(qimage)
+        array[:, :, 0] = 0
+
+        self.assertEqual(array.shape, (64, 32, 4))
+        self.assertTrue(np.all(array[:, :, 1:] == [0x88, 0xcc, 0xee]))
+        # the array is a copy of the data
+        self.assertEqual(qimage.pixelColor(0, 0).red(), 0x44)
+
+    def test_image_to_array_rgb888(self):
+        # width chosen so that rows are padded
+        qimage = QImage(31, 64, QImage.Format.Format_RGB888)
+        qimage.fill(QColor(0x44, 0x88, 0xcc))
+
+        array = image_to_array(qimage)
+
+        self.assertEqual(array.shape, (64, 31, 3))
+        self.assertTrue(np.all(array == [0x44, 0x88, 0xcc]))
+
+    def test_image_to_array_no_copy(self):
+        qimage = QImage(32, 64, QImage.Format.Format_RGBA8888)
+        qimage.fill(QColor(0x44, 0x88, 0xcc, 0xee))
+
+        array = image_to_array(qimage, copy=False)
+        array[0, 0] = [0x11, 0x22, 0x33, 0x44]
+        del qimage
+
+        # the array keeps the image data alive
+        self.assertIsInstance(array.base.image, QImage)
+        color = array.base.image.pixelColor(0, 0)
+        self.assertEqual(
+            (color.red(), color.green(), color.blue(), color.alpha()),
+            (0x11, 0x22, 0x33, 0x44),
+        )
+        self.assertTrue(np.all(array[1:] == [0x44, 0x88, 0xcc, 0xee]))
+
+    def test_image_to_array_no_copy_converted(self):
+        qimage = QImage(32, 64, QImage.Format.Format_ARGB32)
+        qimage.fill(QColor(0x44, 0x88, 0xcc, 0xee))
+
+        array = image_to_array(qimage, copy=False)
+
+        self.assertEqual(array.shape, (64, 32, 4))
+        self.assertTrue(np.all(array == [0x44, 0x88, 0xcc, 0xee]))
+
     def test_image_to_array_bad(self):
         qimage = QImage(32, 64, QImage.Format.Format_RGB30)
         qimage.fill(QColor(0x44, 0x88, 0xcc))
@@ -178,7 +235,7 @@ class TestArrayImageHelpers(unittest.TestCase):
 
         self.assertEqual(qimage.width(), 32)
         self.assertEqual(qimage.height(), 64)
-        self.assertEqual(qimage.format(), QImage.Format.Format_RGB32)
+        self.assertEqual(qimage.format(), QImage.Format.Format_RGB888)
         self.assertTrue(all(
             qimage.pixel(i, j) == 0xff4488cc
             for i in range(32) for j in range(64)
@@ -199,12 +256,54 @@ class TestArrayImageHelpers(unittest.TestCase):
 
         self.assertEqual(qimage.width(), 32)
         self.assertEqual(qimage.height(), 64)
-        self.assertEqual(qimage.format(), QImage.Format.Format_ARGB32)
+        self.assertEqual(qimage.format(), QImage.Format.Format_RGBA8888)
         self.assertTrue(all(
             qimage.pixel(i, j) == 0xee4488cc
             for i in range(32) for j in range(64)
         ))
 
+    def test_array_to_image_copy(self):
+        array = np.full((64, 32, 4), 0x44, dtype='uint8')
+
+        qimage = array_to_image(array)
+        array[...] = 0
+
+        self.assertEqual(qimage.pixelColor(0, 0).red(), 0x44)
+
+    def test_array_to_image_no_copy(self):
+        array = np.full((64, 32, 4), 0x44, dtype='uint8')
+
+        qimage = array_to_image(array, copy=False)
+        array[0, 0] = [0x11, 0x22, 0x33, 0xff]
+
+        self.assertIs(qimage._numpy_data, array)
+        color = qimage.pixelColor(0, 0)
+        self.assertEqual(
+            (color.red(), color.green(), color.blue(), color.alpha()),
+            (0x11, 0x22, 0x33, 0xff),
+        )
+
+    def test_array_to_image_no_copy_padded(self):
+        frame = np.zeros((80, 40, 4), dtype='uint8')
+        frame[8:72, 4:36] = [0x44, 0x88, 0xcc, 0xee]
+        array = frame[8:72, 4:36]
+
+        qimage = array_to_image(array, copy=False)
+
+        self.assertIs(qimage._numpy_data, array)
+        self.assertEqual(qimage.width(), 32)
+        self.assertEqual(qimage.height(), 64)
+        self.assertTrue(np.all(image_to_array(qimage) == array))
+
+    def test_array_to_image_no_copy_bad_layout(self):
+        # channels in reversed order can't be used directly by Qt
+        array = np.full((64, 32, 4), 0x44, dtype='uint8')[:, :, ::-1]
+
+        qimage = array_to_image(array, copy=False)
+
+        self.assertIsNot(qimage._numpy_data, array)
+        self.assertTrue(np.all(image_to_array(qimage) == array))
+
     def test_array_to_image_bad_channels(self):
         array = np.empty((64, 32, 2), dtype='uint8')
         array[:, :, 0] = 0x44
@@ -51,6 +51,10 @@ class ToolBarManager(ActionManager):
     # Should we display the horizontal divider?
     show_divider = Bool(False)
 
+    # Should tool images be decoded in the background?  This is not supported
+    # by wx, so images are always loaded immediately.
+    async_images = Bool(False)
+
     # Private interface ----------------------------------------------------
 
     # Cache of tool images (scaled to the appropriate size).
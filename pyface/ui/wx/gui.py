@@ -74,7 +74,8 @@ class GUI(MGUI, HasTraits):
         wx.CallAfter(setattr, obj, trait_name, new)
 
     @staticmethod
-    def process_events(allow_user_events=True):
+    def process_events(allow_user_events=True, max_time_ms=None):
+        # wx can't limit the time spent, so all pending events are processed.
         if allow_user_events:
             wx.GetApp().Yield(True)
         else:
@@ -13,9 +13,6 @@
 """
 
 
-import wx
-
-
 from traits.api import HasTraits, provides
 
 
@@ -53,11 +50,10 @@ class ImageCache(MImageCache, HasTraits):
         image = self._images.get(filename)
 
         if image is None:
-            # Load the image from the file and add it to the list.
-            #
-            # N.B 'wx.BITMAP_TYPE_ANY' tells wxPython to attempt to autodetect
-            # --- the image format.
-            image = wx.Image(filename, wx.BITMAP_TYPE_ANY)
+            # Load the image from the file and add it to the list.  The
+            # decoded image is shared with other image users and we get a
+            # copy that we are free to rescale.
+            image = self._load_image(filename)
 
             # We force all images in the cache to be the same size.
             if (
@@ -89,3 +85,13 @@ class ImageCache(MImageCache, HasTraits):
             self._bitmaps[filename] = bmp
 
         return bmp
+
+    # ------------------------------------------------------------------------
+    # Private 'ImageCache' interface.
+    # ------------------------------------------------------------------------
+
+    def _load_image(self, filename):
+        """ Loads the unscaled image, sharing it with other image users. """
+        from pyface.resource_manager import decoded_image_cache
+
+        return decoded_image_cache.get_file_image(filename)
@@ -62,3 +62,37 @@ class PyfaceResourceFactory(ResourceFactory):
             os.unlink(filename)
 
         return image
+
+    def image_nbytes(self, image):
+        """ Returns the number of bytes of pixel data held by an image. """
+        channels = 4 if image.HasAlpha() else 3
+        return image.GetWidth() * image.GetHeight() * channels
+
+    def copy_image(self, image):
+        """ Returns a copy of an image which can be modified independently.
+        """
+        return image.Copy()
+
+    def image_region(self, image, x, y, width, height):
+        """ Returns a copy of a rectangular region of an image. """
+        return image.GetSubImage(wx.Rect(x, y, width, height))
+
+    def image_pixels(self, image):
+        """ Returns the (width, height, RGBA bytes) of an image. """
+        width, height = image.GetWidth(), image.GetHeight()
+        rgb = bytes(image.GetData())
+        pixels = bytearray(width * height * 4)
+        for channel in range(3):
+            pixels[channel::4] = rgb[channel::3]
+        if image.HasAlpha():
+            pixels[3::4] = bytes(image.GetAlpha())
+        else:
+            pixels[3::4] = b"\xff" * (width * height)
+        return width, height, bytes(pixels)
+
+    def image_from_pixels(self, width, height, pixels):
+        """ Creates an image from RGBA bytes. """
+        rgb = bytearray(width * height * 3)
+        for channel in range(3):
+            rgb[channel::3] = pixels[channel::4]
+        return wx.Image(width, height, bytes(rgb), bytes(pixels[3::4]))
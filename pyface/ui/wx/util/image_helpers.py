@@ -95,7 +95,7 @@ def resize_bitmap(bitmap, size, aspect_ratio=AspectRatio.ignore,
     return image_to_bitmap(image)
 
 
-def image_to_array(image):
+def image_to_array(image, copy=True):
     """ Convert a wx.Image to a numpy array.
 
     This copies the data returned from wx.
@@ -105,6 +105,9 @@ def image_to_array(image):
     image : wx.Image
         The wx.Image that we want to extract the values from.  The format must
         be either RGB32 or ARGB32.
+    copy : bool
+        Whether to copy the data.  This is ignored, since wx stores the RGB
+        and alpha values separately, so the data is always copied.
 
     Return
     ------
@@ -114,18 +117,22 @@ def image_to_array(image):
     import numpy as np
 
     width, height = image.GetSize()
-    rgb_data = np.array(image.GetData(), dtype='uint8').reshape(width, height, 3)
+    rgb_data = np.frombuffer(image.GetData(), dtype='uint8').reshape(
+        height, width, 3
+    )
     if image.HasAlpha():
-        alpha = np.array(image.GetAlpha(), dtype='uint8').reshape(width, height)
+        alpha = np.frombuffer(image.GetAlpha(), dtype='uint8').reshape(
+            height, width
+        )
     else:
-        alpha = np.full((width, height), 0xff, dtype='uint8')
-    array = np.empty(shape=(width, height, 4), dtype='uint8')
+        alpha = np.full((height, width), 0xff, dtype='uint8')
+    array = np.empty(shape=(height, width, 4), dtype='uint8')
     array[:, :, :3] = rgb_data
     array[:, :, 3] = alpha
     return array
 
 
-def array_to_image(array):
+def array_to_image(array, copy=True):
     """ Convert a numpy array to a wx.Image.
 
     This copies the data before passing it to wx.
@@ -135,6 +142,9 @@ def array_to_image(array):
     array : ndarray
         An N x M x {3, 4} array of unsigned 8-bit ints.  The image
         format is assumed to be RGB or RGBA, based on the shape.
+    copy : bool
+        Whether to copy the data.  This is ignored, since wx stores the RGB
+        and alpha values separately, so the data is always copied.
 
     Return
     ------
@@ -0,0 +1,65 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Helpers for dispatching trait change handlers to the GUI thread. """
+
+import functools
+
+
+def dispatch_latest(handler):
+    """ Make an observer handler run on the GUI thread, latest change only.
+
+    Observers registered with ``dispatch="ui"`` run once on the GUI thread
+    for every change, even when a background thread changes a trait much
+    faster than the GUI can keep up.  A handler wrapped with this function
+    should instead be registered with ``dispatch="same"``: each change
+    replaces any pending call for the same handler, object and trait, so
+    that when the GUI gets to it, the handler runs once with the most recent
+    event.
+
+    This can decorate methods as well as functions::
+
+        class ProgressView(HasTraits):
+
+            model = Instance(Model)
+
+            @observe("model:progress", dispatch="same")
+            @dispatch_latest
+            def _update_progress_bar(self, event):
+                self.progress_bar.value = event.new
+
+    Parameters
+    ----------
+    handler : callable
+        The observer handler, whose last positional argument is the change
+        event.
+
+    Returns
+    -------
+    wrapper : callable
+        A handler that schedules the wrapped handler on the GUI thread.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(*args):
+        from pyface.gui import GUI
+
+        *bound, event = args
+        # The pending call keeps the objects alive, so their ids are unique
+        # for as long as the key is in use.
+        key = (
+            handler,
+            tuple(id(arg) for arg in bound),
+            id(getattr(event, "object", None)),
+            getattr(event, "name", None),
+        )
+        GUI.invoke_later_coalesced(key, handler, *args)
+
+    return wrapper
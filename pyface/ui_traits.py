@@ -34,6 +34,7 @@ from pyface.font import Font
 from pyface.i_image import IImage
 from pyface.util.color_parser import ColorParseError
 from pyface.util.font_parser import simple_parser, FontParseError
+from pyface.util.lru_cache import WeakValueLRUCache
 
 
 logger = logging.getLogger(__name__)
@@ -42,11 +43,49 @@ logger = logging.getLogger(__name__)
 #  Images
 # -------------------------------------------------------------------------------
 
+#: The maximum number of image resources held strongly by the Image trait.
+IMAGE_RESOURCE_CACHE_SIZE = 1024
+
+#: The maximum number of bytes of toolkit bitmaps held strongly by the cache.
+IMAGE_BITMAP_CACHE_BYTES = 32 * 1024 * 1024
+
+
+def _bitmap_nbytes(bitmap):
+    """ The number of bytes of pixel data held by a toolkit bitmap. """
+    from pyface.resource_manager import resource_manager
+
+    try:
+        return resource_manager.resource_factory.image_nbytes(bitmap)
+    except Exception:
+        # not a toolkit image that the resource factory understands
+        return 0
+
+
 # cache of lookups from string to ImageResource instance
-image_resource_cache = {}
+image_resource_cache = WeakValueLRUCache(IMAGE_RESOURCE_CACHE_SIZE)
 
 # cache of conversions of ImageResource instances to toolkit bitmaps
-image_bitmap_cache = {}
+image_bitmap_cache = WeakValueLRUCache(
+    IMAGE_BITMAP_CACHE_BYTES, size_of=_bitmap_nbytes
+)
+
+
+def clear_image_caches():
+    """ Discard all cached image resources, bitmaps and decoded images.
+
+    The Image trait caches the image resources created from strings, and
+    toolkit bitmaps created from image resources.  Both caches are bounded
+    and only weakly reference values that have not been used recently, but
+    applications may want to release everything, for example after
+    unloading plugins.  The statistics of each cache are available from
+    its ``statistics`` method.
+    """
+    image_resource_cache.clear()
+    image_bitmap_cache.clear()
+
+    from pyface.resource_manager import decoded_image_cache
+
+    decoded_image_cache.clear()
 
 
 def convert_image(value, level=3):
@@ -77,7 +116,8 @@ def convert_image(value, level=3):
 
             result = ImageResource(value, search_path=[search_path])
 
-        image_resource_cache[key] = result
+        if result is not None:
+            image_resource_cache[key] = result
 
     return result
 
@@ -0,0 +1,280 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A size-bounded least-recently-used cache.
+
+The cache holds at most ``max_size`` units of values, where the size of each
+value is computed by an optional ``size_of`` callable (by default every value
+has size 1, so the cache is bounded by the number of items).  When a new value
+would exceed the bound, the least recently used values are discarded.
+
+The cache is safe to use from multiple threads, and keeps simple statistics
+of hits, misses and evictions to help with tuning the bound.
+
+The weak-valued variant additionally keeps weak references to every value it
+has been given, so that values which are still in use elsewhere can be found
+again after they have been evicted, without keeping unused values alive.
+"""
+
+from collections import OrderedDict, namedtuple
+import threading
+import weakref
+
+
+#: Statistics reported by an LRUCache.
+CacheStatistics = namedtuple(
+    "CacheStatistics",
+    ["hits", "misses", "evictions", "count", "size", "max_size"],
+)
+
+
+class LRUCache:
+    """ A thread-safe, size-bounded least-recently-used cache.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum total size of the values held in the cache.
+    size_of : callable or None
+        A callable that returns the size of a value.  If None, then each
+        value has a size of 1.
+    """
+
+    def __init__(self, max_size, size_of=None):
+        self._max_size = max_size
+        self._size_of = size_of
+        self._lock = threading.RLock()
+        self._items = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self):
+        """ The maximum total size of the values held in the cache. """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size):
+        with self._lock:
+            self._max_size = max_size
+            self._trim()
+
+    def get(self, key, default=None):
+        """ Get a value from the cache, marking it as recently used.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        default : Any
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        value : Any
+            The cached value, or the default.
+        """
+        with self._lock:
+            try:
+                value, size = self._items[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._items.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def pop(self, key, default=None):
+        """ Remove a value from the cache, returning it.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        default : Any
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        value : Any
+            The value removed from the cache, or the default.
+        """
+        with self._lock:
+            try:
+                value, size = self._items.pop(key)
+            except KeyError:
+                return default
+            self._size -= size
+            return value
+
+    def clear(self):
+        """ Remove all values from the cache. """
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def statistics(self):
+        """ Return the current statistics of the cache.
+
+        Returns
+        -------
+        statistics : CacheStatistics
+            A named tuple giving the number of hits, misses and evictions,
+            the number of values held, and the current and maximum sizes.
+        """
+        with self._lock:
+            return CacheStatistics(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._items),
+                self._size,
+                self._max_size,
+            )
+
+    def reset_statistics(self):
+        """ Reset the hit, miss and eviction counts to zero. """
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    # ------------------------------------------------------------------------
+    # 'object' interface.
+    # ------------------------------------------------------------------------
+
+    def __setitem__(self, key, value):
+        size = 1 if self._size_of is None else self._size_of(value)
+        with self._lock:
+            if key in self._items:
+                old_value, old_size = self._items.pop(key)
+                self._size -= old_size
+            if size > self._max_size:
+                # the value will never fit, so don't evict everything else
+                return
+            self._items[key] = (value, size)
+            self._size += size
+            self._trim()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _trim(self):
+        """ Evict least recently used values until under the maximum size. """
+        while self._size > self._max_size and self._items:
+            key, (value, size) = self._items.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+
+
+class WeakValueLRUCache(LRUCache):
+    """ A least-recently-used cache which also weakly references its values.
+
+    The most recently used values are held strongly, up to ``max_size``.
+    Values which have been evicted are still returned for as long as
+    something else keeps them alive, and are then held strongly again.
+    Values which can't be weakly referenced are only held strongly.
+
+    Evicted values which are found again count as hits, and the count in
+    the statistics is the number of values held strongly.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum total size of the values held strongly in the cache.
+    size_of : callable or None
+        A callable that returns the size of a value.  If None, then each
+        value has a size of 1.
+    """
+
+    def __init__(self, max_size, size_of=None):
+        super().__init__(max_size, size_of=size_of)
+        self._weak_items = weakref.WeakValueDictionary()
+
+    def get(self, key, default=None):
+        """ Get a value from the cache, marking it as recently used.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        default : Any
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        value : Any
+            The cached value, or the default.
+        """
+        with self._lock:
+            if key in self._items:
+                return super().get(key, default)
+
+            value = self._weak_items.get(key)
+            if value is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self[key] = value
+            return value
+
+    def pop(self, key, default=None):
+        """ Remove a value from the cache, returning it.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        default : Any
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        value : Any
+            The value removed from the cache, or the default.
+        """
+        with self._lock:
+            weak_value = self._weak_items.pop(key, None)
+            value = super().pop(key, weak_value)
+            return default if value is None else value
+
+    def clear(self):
+        """ Remove all values from the cache. """
+        with self._lock:
+            super().clear()
+            self._weak_items.clear()
+
+    # ------------------------------------------------------------------------
+    # 'object' interface.
+    # ------------------------------------------------------------------------
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            try:
+                self._weak_items[key] = value
+            except TypeError:
+                # the value can't be weakly referenced
+                self._weak_items.pop(key, None)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items or key in self._weak_items
@@ -0,0 +1,182 @@
+# (C) Copyright 2005-2025 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from pyface.util.lru_cache import (
+    CacheStatistics, LRUCache, WeakValueLRUCache
+)
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_missing(self):
+        cache = LRUCache(3)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", 1), 1)
+        self.assertEqual(cache.statistics().misses, 2)
+
+    def test_set_and_get(self):
+        cache = LRUCache(3)
+
+        cache["a"] = 1
+
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.statistics().hits, 1)
+
+    def test_evict_least_recently_used(self):
+        cache = LRUCache(3)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        cache.get("a")
+
+        cache["d"] = 4
+
+        self.assertNotIn("b", cache)
+        self.assertEqual(
+            cache.statistics(),
+            CacheStatistics(
+                hits=1, misses=0, evictions=1, count=3, size=3, max_size=3,
+            ),
+        )
+
+    def test_size_of(self):
+        cache = LRUCache(10, size_of=len)
+        cache["a"] = "aaaa"
+        cache["b"] = "bbbb"
+
+        cache["c"] = "cccc"
+
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.statistics().size, 8)
+
+    def test_replace_value(self):
+        cache = LRUCache(10, size_of=len)
+        cache["a"] = "aaaa"
+
+        cache["a"] = "aa"
+
+        self.assertEqual(cache.get("a"), "aa")
+        self.assertEqual(cache.statistics().size, 2)
+
+    def test_value_too_large(self):
+        cache = LRUCache(10, size_of=len)
+        cache["a"] = "aaaa"
+
+        cache["b"] = "b" * 11
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+
+    def test_reduce_max_size(self):
+        cache = LRUCache(3)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        cache.max_size = 1
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn("b", cache)
+
+    def test_pop(self):
+        cache = LRUCache(10, size_of=len)
+        cache["a"] = "aaaa"
+
+        self.assertEqual(cache.pop("a"), "aaaa")
+        self.assertIsNone(cache.pop("a"))
+        self.assertEqual(cache.statistics().size, 0)
+
+    def test_clear(self):
+        cache = LRUCache(3)
+        cache["a"] = 1
+        cache.get("a")
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.statistics().hits, 1)
+
+    def test_reset_statistics(self):
+        cache = LRUCache(3)
+        cache["a"] = 1
+        cache.get("a")
+        cache.get("b")
+
+        cache.reset_statistics()
+
+        self.assertEqual(
+            cache.statistics(),
+            CacheStatistics(
+                hits=0, misses=0, evictions=0, count=1, size=1, max_size=3,
+            ),
+        )
+
+
+class Value:
+    """ A weakly referenceable value. """
+
+
+class TestWeakValueLRUCache(unittest.TestCase):
+
+    def test_evicted_value_in_use(self):
+        cache = WeakValueLRUCache(1)
+        a = Value()
+        cache["a"] = a
+        cache["b"] = Value()
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn("a", cache)
+        self.assertIs(cache.get("a"), a)
+        # the value is held strongly again
+        self.assertEqual(len(cache), 1)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.statistics().hits, 1)
+
+    def test_evicted_value_not_in_use(self):
+        cache = WeakValueLRUCache(1)
+        cache["a"] = Value()
+        cache["b"] = Value()
+
+        self.assertNotIn("a", cache)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.statistics().misses, 1)
+
+    def test_not_weakly_referenceable(self):
+        cache = WeakValueLRUCache(1)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+    def test_pop(self):
+        cache = WeakValueLRUCache(1)
+        a = Value()
+        cache["a"] = a
+        cache["b"] = Value()
+
+        self.assertIs(cache.pop("a"), a)
+        self.assertNotIn("a", cache)
+        self.assertIsNone(cache.pop("a"))
+
+    def test_clear(self):
+        cache = WeakValueLRUCache(1)
+        a = Value()
+        cache["a"] = a
+        cache["b"] = Value()
+
+        cache.clear()
+
+        self.assertNotIn("a", cache)
+        self.assertIsNone(cache.get("a"))